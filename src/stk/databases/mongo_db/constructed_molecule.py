@@ -11,7 +11,7 @@ from stk.serialization import (
     ConstructedMoleculeDejsonizer,
 )
 from ..constructed_molecule import ConstructedMoleculeDatabase
-from .utilities import HashableDict
+from .utilities import HashableDict, to_hashable_matrix
 
 
 class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
@@ -250,6 +250,10 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         self._jsonizer = jsonizer
         self._dejsonizer = dejsonizer
 
+        # Holds the references of building blocks put into the
+        # database, so that it does not need to be searched for them.
+        self._stored_building_blocks = set()
+
         self._get = lru_cache(maxsize=lru_cache_size)(self._get)
         self._put = lru_cache(maxsize=lru_cache_size)(self._put)
 
@@ -273,9 +277,7 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         json = self._jsonizer.to_json(molecule)
         # lru_cache requires that the parameters to the cached function
         # are hashable objects.
-        json['matrix']['m'] = tuple(
-            tuple(row) for row in json['matrix']['m']
-        )
+        json['matrix']['m'] = to_hashable_matrix(json['matrix']['m'])
         json['matrix'] = HashableDict(json['matrix'])
         json['molecule'] = HashableDict(json['molecule'])
         json['constructedMolecule'] = HashableDict(
@@ -287,9 +289,7 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         ))
 
         def make_hashable(json):
-            json['matrix']['m'] = tuple(
-                tuple(row) for row in json['matrix']['m']
-            )
+            json['matrix']['m'] = to_hashable_matrix(json['matrix']['m'])
             json['matrix'] = HashableDict(json['matrix'])
             json['molecule'] = HashableDict(json['molecule'])
             return HashableDict(json)
@@ -300,6 +300,33 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         ))
         return self._put(HashableDict(json))
 
+    def _has_building_block(self, reference):
+        """
+        Check if a building block is already in the database.
+
+        Parameters
+        ----------
+        reference : :class:`.HashableDict`
+            The keys of the building block.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the molecule and the position matrix of the
+            building block are in the database.
+
+        """
+
+        if not reference:
+            # An empty reference matches any document.
+            return False
+        if reference in self._stored_building_blocks:
+            return True
+        return (
+            self._molecules.find_one(reference) is not None
+            and self._position_matrices.find_one(reference) is not None
+        )
+
     def _put(self, json):
         # insert_one() corrupts the state of the dict it is passed
         # as an argument (it adds various items to it).
@@ -318,13 +345,21 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         self._constructed_molecules.insert_one(
             document=dict(json['constructedMolecule']),
         )
-        for building_block_json in json['buildingBlocks']:
+        # Building blocks already in the database are only stored as
+        # references, held in json['constructedMolecule']['BB'].
+        for reference, building_block_json in zip(
+            json['constructedMolecule']['BB'],
+            json['buildingBlocks'],
+        ):
+            if self._has_building_block(reference):
+                continue
             self._molecules.insert_one(
                 document=dict(building_block_json['molecule']),
             )
             self._position_matrices.insert_one(
                 document=dict(building_block_json['matrix']),
             )
+            self._stored_building_blocks.add(reference)
 
     def get(self, key):
         # lru_cache requires that the parameters to the cached function
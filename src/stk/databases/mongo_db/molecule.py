@@ -11,7 +11,7 @@ from stk.serialization import (
     MoleculeDejsonizer,
 )
 from ..molecule import MoleculeDatabase
-from .utilities import HashableDict
+from .utilities import HashableDict, to_hashable_matrix
 
 
 class MoleculeMongoDb(MoleculeDatabase):
@@ -254,9 +254,7 @@ class MoleculeMongoDb(MoleculeDatabase):
         json = self._jsonizer.to_json(molecule)
         # lru_cache requires that the parameters to the cached function
         # are hashable objects.
-        json['matrix']['m'] = tuple(
-            tuple(row) for row in json['matrix']['m']
-        )
+        json['matrix']['m'] = to_hashable_matrix(json['matrix']['m'])
         json['matrix'] = HashableDict(json['matrix'])
         json['molecule'] = HashableDict(json['molecule'])
         return self._put(HashableDict(json))
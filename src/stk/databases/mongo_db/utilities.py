@@ -4,3 +4,26 @@ class HashableDict(dict):
 
     def __eq__(self, other):
         return super().__eq__(other)
+
+
+def to_hashable_matrix(matrix):
+    """
+    Convert the JSON of a position matrix into a hashable object.
+
+    Parameters
+    ----------
+    matrix : :class:`list` or :class:`str`
+        The position matrix, either as a :class:`list` of rows, or
+        encoded as a :class:`str`.
+
+    Returns
+    -------
+    :class:`tuple` or :class:`str`
+        The position matrix, with every :class:`list` replaced by a
+        :class:`tuple`.
+
+    """
+
+    if isinstance(matrix, str):
+        return matrix
+    return tuple(map(tuple, matrix))
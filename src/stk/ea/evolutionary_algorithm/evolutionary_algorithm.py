@@ -60,6 +60,7 @@ class EvolutionaryAlgorithm:
         crossover_selector,
         fitness_normalizer=NullFitnessNormalizer(),
         key_maker=Inchi(),
+        molecule_filter=None,
         num_processes=None,
     ):
         """
@@ -96,6 +97,14 @@ class EvolutionaryAlgorithm:
             molecules in a generation return the same key, one of them
             is removed.
 
+        molecule_filter : :class:`callable`, optional
+            Takes a single parameter, `molecule`, and returns ``False``
+            if the molecule should be discarded. Offspring and mutants
+            are passed to it before their fitness values are
+            calculated, which makes it a good place for cheap checks,
+            such as :meth:`.OverlapChecker.has_overlaps`. If ``None``,
+            no molecules are discarded.
+
         num_processes : :class:`int`, optional
             The number of parallel processes the EA should create.
             If ``None``, all available cores will be used.
@@ -113,6 +122,7 @@ class EvolutionaryAlgorithm:
                 crossover_selector=crossover_selector,
                 fitness_normalizer=fitness_normalizer,
                 key_maker=key_maker,
+                molecule_filter=molecule_filter,
                 logger=logger,
             )
 
@@ -127,6 +137,7 @@ class EvolutionaryAlgorithm:
                 crossover_selector=crossover_selector,
                 fitness_normalizer=fitness_normalizer,
                 key_maker=key_maker,
+                molecule_filter=molecule_filter,
                 logger=logger,
                 num_processes=num_processes,
             )
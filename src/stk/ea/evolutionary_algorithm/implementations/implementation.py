@@ -1,4 +1,5 @@
 import itertools as it
+from operator import itemgetter
 
 from stk.utilities import dedupe
 from ...generation import Generation
@@ -21,6 +22,7 @@ class Implementation:
         crossover_selector,
         fitness_normalizer,
         key_maker,
+        molecule_filter,
         logger,
     ):
         """
@@ -37,14 +39,20 @@ class Implementation:
         self._crossover_selector = crossover_selector
         self._fitness_normalizer = fitness_normalizer
         self._key_maker = key_maker
+        self._molecule_filter = molecule_filter
         self._logger = logger
 
-    def _get_generations(self, num_generations, map_):
+    def _get_generations(self, num_generations, executor):
+        map_ = map if executor is None else executor.map
+
         def get_mutation_record(batch):
             return self._mutator.mutate(batch[0])
 
-        def get_key(record):
-            return self._key_maker.get_key(record.get_molecule())
+        def is_kept(record):
+            return (
+                self._molecule_filter is None
+                or self._molecule_filter(record.get_molecule())
+            )
 
         population = self._initial_population
 
@@ -80,21 +88,30 @@ class Implementation:
 
             self._logger.info('Calculating fitness values.')
 
-            offspring = (
+            offspring = filter(is_kept, (
                 record.get_molecule_record()
                 for record in crossover_records
-            )
-            mutants = (
+            ))
+            mutants = filter(is_kept, (
                 record.get_molecule_record()
                 for record in mutation_records
-            )
+            ))
 
+            records = tuple(it.chain(population, offspring, mutants))
+            # The keys of all records are made at once, so that they
+            # can be made in parallel.
+            keys = self._key_maker.get_keys(
+                molecules=(record.get_molecule() for record in records),
+                executor=executor,
+            )
             population = tuple(self._with_fitness_values(
                 map_=map_,
-                population=tuple(dedupe(
-                    iterable=it.chain(population, offspring, mutants),
-                    key=get_key,
-                )),
+                population=tuple(
+                    record for _, record in dedupe(
+                        iterable=zip(keys, records),
+                        key=itemgetter(0),
+                    )
+                ),
             ))
             population = tuple(
                 self._fitness_normalizer.normalize(population)
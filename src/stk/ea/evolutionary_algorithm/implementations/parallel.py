@@ -20,6 +20,7 @@ class Parallel(Implementation):
         crossover_selector,
         fitness_normalizer,
         key_maker,
+        molecule_filter,
         logger,
         num_processes,
     ):
@@ -34,10 +35,11 @@ class Parallel(Implementation):
             crossover_selector=crossover_selector,
             fitness_normalizer=fitness_normalizer,
             key_maker=key_maker,
+            molecule_filter=molecule_filter,
             logger=logger,
         )
         self._num_processes = num_processes
 
     def get_generations(self, num_generations):
         with pathos.pools.ProcessPool(self._num_processes) as pool:
-            yield from self._get_generations(num_generations, pool.map)
+            yield from self._get_generations(num_generations, pool)
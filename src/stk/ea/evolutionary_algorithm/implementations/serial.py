@@ -8,4 +8,4 @@ class Serial(Implementation):
     """
 
     def get_generations(self, num_generations):
-        yield from self._get_generations(num_generations, map)
+        yield from self._get_generations(num_generations, None)
@@ -77,7 +77,7 @@ class Batch:
         self._fitness_value = sum(map(fitness_values.get, records))
         molecules = (record.get_molecule() for record in records)
         self._identity_key = frozenset(
-            Counter(map(key_maker.get_key, molecules)).items()
+            Counter(key_maker.get_keys(molecules)).items()
         )
 
     def get_size(self):
@@ -40,7 +40,7 @@ class YieldedBatches:
         """
 
         molecules = (record.get_molecule() for record in batch)
-        self._molecules.update(map(self._key_maker.get_key, molecules))
+        self._molecules.update(self._key_maker.get_keys(molecules))
         self._batches.add(batch.get_identity_key())
         self._num += 1
         return self
@@ -5,3 +5,4 @@ from .atoms import *  # noqa
 from .bonds import *  # noqa
 from .reactions import *  # noqa
 from .key_makers import *  # noqa
+from .overlap_checkers import *  # noqa
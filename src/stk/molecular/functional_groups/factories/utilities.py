@@ -1,3 +1,4 @@
+from functools import lru_cache
 import rdkit.Chem.AllChem as rdkit
 
 
@@ -23,8 +24,31 @@ def _get_atom_ids(query, molecule):
 
     """
 
-    rdkit_mol = molecule.to_rdkit_mol()
-    rdkit.SanitizeMol(rdkit_mol)
-    yield from rdkit_mol.GetSubstructMatches(
-        query=rdkit.MolFromSmarts(query),
+    # The sanitized molecule is cached by the molecule, so that
+    # it is shared by every factory run on it.
+    yield from molecule._get_sanitized_rdkit_graph().GetSubstructMatches(
+        query=_get_query(query),
     )
+
+
+@lru_cache(maxsize=1024)
+def _get_query(smarts):
+    """
+    Get the compiled query of a SMARTS string.
+
+    Compiled queries are cached, so that each SMARTS string is
+    compiled only once, no matter how many molecules are queried.
+
+    Parameters
+    ----------
+    smarts : :class:`str`
+        A SMARTS string.
+
+    Returns
+    -------
+    :class:`rdkit.Mol`
+        The query. It must not be modified.
+
+    """
+
+    return rdkit.MolFromSmarts(smarts)
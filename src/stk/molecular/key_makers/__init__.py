@@ -2,3 +2,5 @@ from .molecule import *  # noqa
 from .inchi import *  # noqa
 from .inchi_key import *  # noqa
 from .smiles import *  # noqa
+from .graph_hash import *  # noqa
+from .construction_key import *  # noqa
@@ -0,0 +1,308 @@
+"""
+Construction Key
+================
+
+"""
+
+import hashlib
+from functools import partial
+
+from .molecule import MoleculeKeyMaker
+from .inchi_key import InchiKey
+from ..topology_graphs import TopologyGraph
+
+
+class ConstructionKey(MoleculeKeyMaker):
+    """
+    Used to get keys of constructed molecules from their ingredients.
+
+    The key of a :class:`.ConstructedMolecule` is made from the
+    :func:`repr` of the :class:`.TopologyGraph` used to construct it,
+    which holds the options of the topology graph, such as vertex
+    alignments, orientations and repeating units, together with the
+    key of the building block placed on each vertex. This means that
+    the constructed molecule itself never has to be canonicalized,
+    which makes the key much cheaper to make than, for example, an
+    InChIKey of a large constructed molecule. The building block keys
+    are stored on the building blocks, so they are only made once,
+    no matter how many constructed molecules share them.
+
+    Because the key depends only on the ingredients of construction,
+    it can also be made from a :class:`.TopologyGraph`, before
+    :meth:`.TopologyGraph.construct` is called.
+
+    Notes
+    -----
+    The key does not depend on the optimizer or the reaction factory
+    of the topology graph, so constructed molecules which differ only
+    in these will have the same key.
+
+    Only constructed molecules created with
+    :meth:`.ConstructedMolecule.__init__` have a key, because
+    constructed molecules created with :meth:`.ConstructedMolecule.init`
+    do not know their topology graph.
+
+    Examples
+    --------
+    *Finding Duplicates Before Construction*
+
+    .. code-block:: python
+
+        import stk
+
+        bb1 = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+        bb2 = stk.BuildingBlock('BrCNCBr', [stk.BromoFactory()])
+        construction_key = stk.ConstructionKey()
+
+        graph = stk.polymer.Linear((bb1, bb2), 'AB', 3)
+        key = construction_key.get_key(graph)
+
+        # The constructed molecule has the same key as the graph.
+        polymer = stk.ConstructedMolecule(graph)
+        polymer_key = construction_key.get_key(polymer)
+
+    *Using the Key in an Evolutionary Algorithm*
+
+    .. code-block:: python
+
+        selector = stk.Roulette(
+            num_batches=10,
+            key_maker=stk.ConstructionKey(),
+        )
+
+    """
+
+    def __init__(self, building_block_key_maker=InchiKey()):
+        """
+        Initialize a :class:`.ConstructionKey` instance.
+
+        Parameters
+        ----------
+        building_block_key_maker : :class:`.MoleculeKeyMaker`, optional
+            Used to make the keys of the building blocks.
+
+        """
+
+        self._building_block_key_maker = building_block_key_maker
+        super().__init__(
+            key_name='ConstructionKey',
+            get_key=partial(
+                _get_constructed_molecule_key,
+                building_block_key_maker=building_block_key_maker,
+            ),
+        )
+
+    def get_key(self, molecule):
+        """
+        Get the key of `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule` or \
+                :class:`.TopologyGraph`
+            The constructed molecule for which a key is needed, or the
+            topology graph which constructs it.
+
+        Returns
+        -------
+        :class:`str`
+            The key of `molecule`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `molecule` does not know its topology graph.
+
+        """
+
+        if isinstance(molecule, TopologyGraph):
+            return _get_key(
+                topology_graph_repr=repr(molecule),
+                vertex_building_blocks=(
+                    molecule._get_vertex_building_blocks()
+                ),
+                building_block_key_maker=(
+                    self._building_block_key_maker
+                ),
+            )
+        return super().get_key(molecule)
+
+    def get_keys(self, molecules, executor=None):
+        """
+        Get the keys of many molecules.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable`
+            The :class:`.ConstructedMolecule` or :class:`.TopologyGraph`
+            instances for which keys are needed.
+
+        executor : :class:`object`, optional
+            Used to make the keys of the building blocks in parallel.
+            It must have a ``map(function, iterable)`` method, which
+            returns the results in order. If ``None``, the keys are
+            made in the current process.
+
+        Yields
+        ------
+        :class:`str`
+            The key of each molecule in `molecules`, in order.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If a molecule does not know its topology graph.
+
+        """
+
+        molecules = tuple(molecules)
+        building_blocks = {}
+        for molecule in molecules:
+            if isinstance(molecule, TopologyGraph):
+                building_blocks.update(
+                    (id(building_block), building_block)
+                    for building_block in molecule.get_building_blocks()
+                )
+            else:
+                building_blocks.update(
+                    (id(building_block), building_block)
+                    for building_block
+                    in _get_vertex_building_blocks(molecule)
+                )
+        # Only the building block keys are expensive, so they are
+        # made, and stored, in bulk first.
+        tuple(self._building_block_key_maker.get_keys(
+            molecules=building_blocks.values(),
+            executor=executor,
+        ))
+
+        yield from map(self.get_key, molecules)
+
+    def _get_memo_key(self):
+        return (
+            self.get_key_name(),
+            self._building_block_key_maker._get_memo_key(),
+        )
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return (
+            'ConstructionKey('
+            f'building_block_key_maker={self._building_block_key_maker!r}'
+            ')'
+        )
+
+
+def _get_constructed_molecule_key(molecule, building_block_key_maker):
+    """
+    Get the key of a constructed molecule.
+
+    Parameters
+    ----------
+    molecule : :class:`.ConstructedMolecule`
+        The constructed molecule for which a key is needed.
+
+    building_block_key_maker : :class:`.MoleculeKeyMaker`
+        Used to make the keys of the building blocks.
+
+    Returns
+    -------
+    :class:`str`
+        The key.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If `molecule` does not know its topology graph.
+
+    """
+
+    return _get_key(
+        topology_graph_repr=molecule._topology_graph_repr,
+        vertex_building_blocks=_get_vertex_building_blocks(molecule),
+        building_block_key_maker=building_block_key_maker,
+    )
+
+
+def _get_vertex_building_blocks(molecule):
+    """
+    Get the building block placed on each vertex of a molecule.
+
+    Parameters
+    ----------
+    molecule : :class:`.ConstructedMolecule`
+        The constructed molecule.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`.BuildingBlock`
+        The building block placed on each vertex, ordered by vertex
+        id.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If `molecule` does not know its topology graph.
+
+    """
+
+    vertex_building_blocks = getattr(
+        molecule,
+        '_vertex_building_blocks',
+        None,
+    )
+    if vertex_building_blocks is None:
+        raise ValueError(
+            'The constructed molecule does not know the topology '
+            'graph used to construct it, so it has no construction '
+            'key.'
+        )
+    return vertex_building_blocks
+
+
+def _get_key(
+    topology_graph_repr,
+    vertex_building_blocks,
+    building_block_key_maker,
+):
+    """
+    Get a construction key.
+
+    Parameters
+    ----------
+    topology_graph_repr : :class:`str`
+        The :func:`repr` of the topology graph.
+
+    vertex_building_blocks : :class:`tuple` of :class:`.BuildingBlock`
+        The building block placed on each vertex, ordered by vertex
+        id.
+
+    building_block_key_maker : :class:`.MoleculeKeyMaker`
+        Used to make the keys of the building blocks.
+
+    Returns
+    -------
+    :class:`str`
+        The key.
+
+    """
+
+    # Each building block is usually placed on many vertices, so its
+    # key is only looked up once.
+    building_block_keys = {}
+    vertex_keys = []
+    for building_block in vertex_building_blocks:
+        key = building_block_keys.get(id(building_block))
+        if key is None:
+            key = building_block_keys[id(building_block)] = str(
+                building_block_key_maker.get_key(building_block)
+            )
+        vertex_keys.append(key)
+
+    key = hashlib.sha256(topology_graph_repr.encode())
+    for vertex_key in vertex_keys:
+        key.update(b'\n')
+        key.update(vertex_key.encode())
+    return key.hexdigest()
@@ -0,0 +1,132 @@
+"""
+Graph Hash
+==========
+
+"""
+
+from functools import partial
+
+from .molecule import MoleculeKeyMaker
+from .utilities import get_graph_hash
+
+
+class GraphHash(MoleculeKeyMaker):
+    """
+    Used to get a hash of the molecular graph of molecules.
+
+    The hash is a Weisfeiler-Lehman hash of the atoms and bonds of a
+    molecule, which is calculated with :mod:`numpy`, without using
+    :mod:`rdkit`. This makes it much faster to make than an InChI or
+    an InChIKey, especially for large molecules, and it can be made
+    for any molecule, including ones with metal atoms. It is a good
+    choice for finding duplicate molecules during a single run, for
+    example in an :class:`.EvolutionaryAlgorithm`.
+
+    Atoms are labelled by their atomic number and charge, and bonds
+    by their order, so the hash does not depend on stereochemistry
+    or atom ordering. Optionally, the hash can also depend on the
+    geometry of the molecule, through distances which do not change
+    when the molecule is rotated or reflected.
+
+    Notes
+    -----
+    Like other Weisfeiler-Lehman hashes, different molecules can have
+    the same hash if their graphs cannot be told apart by the
+    Weisfeiler-Lehman test. For example, the hash cannot tell apart
+    a molecule made of two disconnected rings of three carbon atoms
+    from one with a single ring of six. Such molecules are rare
+    among the molecules normally made with :mod:`stk`.
+
+    Examples
+    --------
+    *Finding Duplicates*
+
+    .. code-block:: python
+
+        import stk
+
+        graph_hash = stk.GraphHash()
+        # The two building blocks have the same hash.
+        hash1 = graph_hash.get_key(stk.BuildingBlock('NCCBr'))
+        hash2 = graph_hash.get_key(stk.BuildingBlock('BrCCN'))
+
+    *Using the Hash in an Evolutionary Algorithm*
+
+    The hash can be used by anything which takes a
+    :class:`.MoleculeKeyMaker`
+
+    .. code-block:: python
+
+        selector = stk.Roulette(
+            num_batches=10,
+            key_maker=stk.GraphHash(),
+        )
+
+    *Telling Apart Conformers*
+
+    If molecules with the same graph but different geometries should
+    have different hashes, distances can be included in the hash
+
+    .. code-block:: python
+
+        # Distances are rounded to the nearest 0.1 Angstrom.
+        graph_hash = stk.GraphHash(distance_precision=0.1)
+
+    Note that two molecules whose distances lie either side of a
+    rounding boundary will have different hashes, even if their
+    geometries are very similar.
+
+    """
+
+    def __init__(self, num_iterations=None, distance_precision=None):
+        """
+        Initialize a :class:`.GraphHash` instance.
+
+        Parameters
+        ----------
+        num_iterations : :class:`int`, optional
+            The number of Weisfeiler-Lehman iterations. If ``None``,
+            iterations are done until the groups of equivalent atoms
+            stop changing. For long chains, such as linear polymers,
+            this can take many iterations, and using a small, fixed
+            number is much faster, at the cost of telling apart
+            fewer molecules.
+
+        distance_precision : :class:`float`, optional
+            If not ``None``, the hash also depends on the distance of
+            each atom from the centroid of the molecule and on the
+            bond lengths, which are rounded to a multiple of
+            `distance_precision`, in Angstrom.
+
+        """
+
+        self._num_iterations = num_iterations
+        self._distance_precision = distance_precision
+        super().__init__(
+            key_name='GraphHash',
+            get_key=partial(
+                get_graph_hash,
+                num_iterations=num_iterations,
+                distance_precision=distance_precision,
+            ),
+        )
+
+    def _get_memo_key(self):
+        return (
+            self.get_key_name(),
+            self._num_iterations,
+            self._distance_precision,
+        )
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        parameters = []
+        if self._num_iterations is not None:
+            parameters.append(f'num_iterations={self._num_iterations}')
+        if self._distance_precision is not None:
+            parameters.append(
+                f'distance_precision={self._distance_precision}'
+            )
+        return f'GraphHash({", ".join(parameters)})'
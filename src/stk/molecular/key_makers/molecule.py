@@ -5,6 +5,8 @@ Molecule Key Maker
 .. toctree::
     :maxdepth: 2
 
+    Construction Key <stk.molecular.key_makers.construction_key>
+    Graph Hash <stk.molecular.key_makers.graph_hash>
     InChI <stk.molecular.key_makers.inchi>
     InChIKey <stk.molecular.key_makers.inchi_key>
     SMILES <stk.molecular.key_makers.smiles>
@@ -19,6 +21,12 @@ class MoleculeKeyMaker:
     Keys are used in :mod:`stk` to determine if two molecules are
     duplicates of each other.
 
+    Keys made with :meth:`get_key` are stored on the molecule, so
+    asking for the key of the same molecule, or one of its clones,
+    many times only makes it once. The stored keys are discarded when
+    the atomic positions, atom ordering or functional groups of the
+    molecule change.
+
     Notes
     -----
     You might notice that the public methods of this abstract base
@@ -59,6 +67,32 @@ class MoleculeKeyMaker:
         # Get the JSON representation of a molecule.
         json = jsonizer.to_json(stk.BuildingBlock('NCCN'))
 
+    Note that because keys are stored on molecules under the name of
+    the key, `get_key` must always return the same key for the same
+    molecule, and key makers with the same name must make the same
+    keys.
+
+    *Adding Known Keys*
+
+    If the keys of molecules are already known, for example because
+    they were loaded from a database, they can be stored on the
+    molecules, so that they never have to be made
+
+    .. code-block:: python
+
+        building_blocks = (
+            stk.BuildingBlock('NCCN'),
+            stk.BuildingBlock('BrCCBr'),
+        )
+        inchi_key = stk.InchiKey()
+        inchi_key.prefill(
+            molecules=building_blocks,
+            keys=(
+                'PIICEJLVQHRZGT-UHFFFAOYSA-N',
+                'PAAZPARNPHGIKF-UHFFFAOYSA-N',
+            ),
+        )
+
     """
 
     def __init__(self, key_name, get_key):
@@ -109,7 +143,135 @@ class MoleculeKeyMaker:
 
         """
 
-        return self._get_key(molecule)
+        keys = molecule._get_key_cache()
+        memo_key = self._get_memo_key()
+        key = keys.get(memo_key)
+        if key is None:
+            key = keys[memo_key] = self._get_key(molecule)
+        return key
+
+    def get_keys(self, molecules, executor=None):
+        """
+        Get the keys of many molecules.
+
+        Keys already stored on the molecules are reused, and each key
+        is only made once for molecules which share stored keys, such
+        as clones.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules for which keys are needed.
+
+        executor : :class:`object`, optional
+            Used to make the keys in parallel. It must have a
+            ``map(function, iterable)`` method, which returns the
+            results in order, for example a
+            :class:`pathos.pools.ProcessPool` or a
+            :class:`concurrent.futures.ProcessPoolExecutor`. If
+            ``None``, the keys are made in the current process.
+
+        Yields
+        ------
+        :class:`object`
+            The key of each molecule in `molecules`, in order.
+
+        Examples
+        --------
+        *Making Keys in Parallel*
+
+        Making keys with :mod:`rdkit`, for example InChIKeys, can
+        be slow for a large number of molecules, in which case many
+        processes can be used
+
+        .. code-block:: python
+
+            import stk
+            import pathos
+
+            building_blocks = [
+                stk.BuildingBlock('C'*i) for i in range(1, 100)
+            ]
+            with pathos.pools.ProcessPool(4) as pool:
+                keys = tuple(stk.InchiKey().get_keys(
+                    molecules=building_blocks,
+                    executor=pool,
+                ))
+
+        """
+
+        molecules = tuple(molecules)
+        if executor is None:
+            yield from map(self.get_key, molecules)
+            return
+
+        memo_key = self._get_memo_key()
+        key_caches = tuple(
+            molecule._get_key_cache() for molecule in molecules
+        )
+        # Molecules which share a key cache only need one of them to
+        # be sent to the executor.
+        missing = {}
+        for molecule, key_cache in zip(molecules, key_caches):
+            if key_cache.get(memo_key) is None:
+                missing.setdefault(id(key_cache), (molecule, key_cache))
+
+        made_keys = executor.map(
+            self._get_key,
+            [molecule for molecule, _ in missing.values()],
+        )
+        for (_, key_cache), key in zip(missing.values(), made_keys):
+            key_cache[memo_key] = key
+
+        for key_cache in key_caches:
+            yield key_cache[memo_key]
+
+    def prefill(self, molecules, keys=None):
+        """
+        Store the keys of many molecules.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules whose keys are stored.
+
+        keys : :class:`iterable` of :class:`object`, optional
+            The key of each molecule in `molecules`. These must be
+            the keys which :meth:`get_key` would return. If ``None``,
+            the keys are made.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        if keys is None:
+            for molecule in molecules:
+                self.get_key(molecule)
+            return
+
+        memo_key = self._get_memo_key()
+        for molecule, key in zip(molecules, keys):
+            molecule._get_key_cache()[memo_key] = key
+
+    def _get_memo_key(self):
+        """
+        Get the key under which keys are stored on molecules.
+
+        Key makers which return the same memo key share the keys
+        stored on molecules. Subclasses, whose keys depend on their
+        parameters as well as their name, must include the
+        parameters in the memo key.
+
+        Returns
+        -------
+        :class:`object`
+            The memo key. It is the name of the key, by default.
+
+        """
+
+        return self.get_key_name()
 
     def __str__(self):
         return repr(self)
@@ -1,3 +1,5 @@
+import hashlib
+import numpy as np
 import rdkit.Chem.AllChem as rdkit
 
 
@@ -76,3 +78,218 @@ def get_smiles(molecule):
         isomericSmiles=True,
         canonical=True,
     )
+
+
+# The constants used to scramble and combine 64-bit integers. They
+# are made once, because making numpy scalars is slow compared to
+# operating on the small arrays of a molecule.
+_shifts = np.array([30, 27, 31], dtype=np.uint64)
+_multipliers = np.array(
+    [0xbf58476d1ce4e5b9, 0x94d049bb133111eb],
+    dtype=np.uint64,
+)
+_golden_ratio = np.uint64(0x9e3779b97f4a7c15)
+
+
+def get_graph_hash(molecule, num_iterations, distance_precision):
+    """
+    Get a Weisfeiler-Lehman hash of the graph of `molecule`.
+
+    Every atom starts with a label made from its atomic number and
+    charge. In each iteration, the label of an atom is combined with
+    the multiset of labels of its neighbors, together with the orders
+    of the bonds to them. The hash is made from the sorted labels
+    of every iteration.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule whose hash is needed.
+
+    num_iterations : :class:`int`
+        The number of iterations. If ``None``, iterations are done
+        until they stop splitting atoms into new groups of
+        equivalent atoms.
+
+    distance_precision : :class:`float`
+        If not ``None``, the distance of each atom from the centroid
+        and the length of each bond, rounded to a multiple of
+        `distance_precision`, are added to the labels of the atoms and
+        bonds.
+
+    Returns
+    -------
+    :class:`str`
+        The hash.
+
+    """
+
+    atoms = np.array(
+        [
+            (atom.get_atomic_number(), atom.get_charge())
+            for atom in molecule.get_atoms()
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2).astype(np.uint64)
+    atom_labels = _combine(atoms[:, 0], atoms[:, 1])
+    bond_atom_ids = molecule._get_bond_atom_id_matrix()
+    bond_labels = np.array(
+        [bond.get_order() for bond in molecule.get_bonds()],
+        dtype=np.uint64,
+    )
+
+    if distance_precision is not None:
+        position_matrix = molecule.get_position_matrix()
+        atom_labels = _combine(
+            atom_labels,
+            _round(
+                values=np.linalg.norm(
+                    position_matrix - position_matrix.mean(axis=0),
+                    axis=1,
+                ),
+                precision=distance_precision,
+            ),
+        )
+        bond_labels = _combine(
+            bond_labels,
+            _round(
+                values=np.linalg.norm(
+                    position_matrix[bond_atom_ids[:, 0]]
+                    - position_matrix[bond_atom_ids[:, 1]],
+                    axis=1,
+                ),
+                precision=distance_precision,
+            ),
+        )
+
+    # Each bond sends a message to both of its atoms, so the bonds
+    # are listed once in each direction.
+    atom_ids = np.concatenate((bond_atom_ids[:, 0], bond_atom_ids[:, 1]))
+    neighbor_ids = np.concatenate((
+        bond_atom_ids[:, 1],
+        bond_atom_ids[:, 0],
+    ))
+    bond_labels = _mix(np.concatenate((bond_labels, bond_labels)))
+
+    graph_hash = hashlib.sha256(
+        np.array(
+            [len(atom_labels), len(bond_atom_ids)],
+            dtype='<u8',
+        ).tobytes()
+    )
+    sorted_labels = np.sort(atom_labels)
+    graph_hash.update(sorted_labels.astype('<u8').tobytes())
+    num_groups = _get_num_groups(sorted_labels)
+    iterations = (
+        range(len(atom_labels))
+        if num_iterations is None
+        else range(num_iterations)
+    )
+    for _ in iterations:
+        # Summing the messages makes their order irrelevant.
+        neighbor_labels = np.zeros_like(atom_labels)
+        np.add.at(
+            neighbor_labels,
+            atom_ids,
+            _mix(atom_labels[neighbor_ids]*_golden_ratio + bond_labels),
+        )
+        atom_labels = _combine(atom_labels, neighbor_labels)
+        sorted_labels = np.sort(atom_labels)
+        graph_hash.update(sorted_labels.astype('<u8').tobytes())
+
+        if num_iterations is None:
+            new_num_groups = _get_num_groups(sorted_labels)
+            if new_num_groups == num_groups:
+                break
+            num_groups = new_num_groups
+
+    return graph_hash.hexdigest()
+
+
+def _get_num_groups(sorted_labels):
+    """
+    Get the number of groups of atoms with the same label.
+
+    Parameters
+    ----------
+    sorted_labels : :class:`numpy.ndarray`
+        The sorted labels of the atoms.
+
+    Returns
+    -------
+    :class:`int`
+        The number of different labels.
+
+    """
+
+    return int(np.count_nonzero(np.diff(sorted_labels))) + 1
+
+
+def _mix(values):
+    """
+    Scramble the bits of 64-bit integers.
+
+    This is the finalizer of the SplitMix64 generator.
+
+    Parameters
+    ----------
+    values : :class:`numpy.ndarray`
+        The values to scramble, with a :class:`numpy.uint64`
+        dtype.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The scrambled values.
+
+    """
+
+    values = (values ^ (values >> _shifts[0])) * _multipliers[0]
+    values = (values ^ (values >> _shifts[1])) * _multipliers[1]
+    return values ^ (values >> _shifts[2])
+
+
+def _combine(values1, values2):
+    """
+    Combine two arrays of 64-bit integers into one.
+
+    Parameters
+    ----------
+    values1 : :class:`numpy.ndarray`
+        The first values, with a :class:`numpy.uint64` dtype.
+
+    values2 : :class:`numpy.ndarray`
+        The second values, with a :class:`numpy.uint64` dtype.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The combined values. Swapping `values1` and `values2` gives
+        different values.
+
+    """
+
+    return _mix(values1*_golden_ratio + _mix(values2))
+
+
+def _round(values, precision):
+    """
+    Round values to a multiple of `precision`.
+
+    Parameters
+    ----------
+    values : :class:`numpy.ndarray`
+        The values to round.
+
+    precision : :class:`float`
+        The precision of the rounded values.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The number of multiples of `precision` in each value, with a
+        :class:`numpy.uint64` dtype.
+
+    """
+
+    return np.round(values/precision).astype(np.int64).astype(np.uint64)
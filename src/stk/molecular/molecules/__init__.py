@@ -1,3 +1,7 @@
 from .molecule import *  # noqa
 from .building_block import *  # noqa
 from .constructed_molecule import *  # noqa
+from .conformer_ensemble import *  # noqa
+from .embedding_cache import *  # noqa
+from .building_block_library import *  # noqa
+from .multi_molecule_writer import *  # noqa
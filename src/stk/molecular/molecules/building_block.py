@@ -7,16 +7,18 @@ Building Block
 
 import logging
 import os
+import hashlib
+import pathos
 import rdkit.Chem.AllChem as rdkit
 from functools import partial
 import warnings
 import numpy as np
 
-from ..functional_groups import FunctionalGroup
+from ..functional_groups import FunctionalGroup, GenericFunctionalGroup
 from ..atoms import Atom
 from ..bonds import Bond
 from .molecule import Molecule
-from ...utilities import remake, flatten
+from ...utilities import remake, flatten, set_conformer_positions
 
 
 logger = logging.getLogger(__name__)
@@ -64,6 +66,7 @@ class BuildingBlock(Molecule):
         placer_ids=None,
         random_seed=None,
         position_matrix=None,
+        embedding_cache=None,
     ):
         """
         Initialize a :class:`.BuildingBlock`.
@@ -121,6 +124,13 @@ class BuildingBlock(Molecule):
             ``None``, :func:`rdkit.ETKDGv2` will be used to calculate
             it.
 
+        embedding_cache : :class:`.EmbeddingCache`, optional
+            If `position_matrix` is ``None``, the position matrix is
+            taken from this cache, if it holds one for the molecule.
+            Otherwise, the molecule is embedded and the position
+            matrix is added to the cache. If ``None``, the molecule
+            is always embedded.
+
         Raises
         ------
         :class:`RuntimeError`
@@ -142,7 +152,24 @@ class BuildingBlock(Molecule):
             random_seed = 4
 
         molecule = rdkit.AddHs(rdkit.MolFromSmiles(smiles))
-        if position_matrix is None:
+        if position_matrix is None and embedding_cache is not None:
+            cached_position_matrix = (
+                embedding_cache._get_position_matrix(
+                    molecule=molecule,
+                    random_seed=random_seed,
+                )
+            )
+        else:
+            cached_position_matrix = None
+
+        if cached_position_matrix is not None:
+            conformer = set_conformer_positions(
+                conformer=rdkit.Conformer(molecule.GetNumAtoms()),
+                position_matrix=cached_position_matrix,
+            )
+            molecule.AddConformer(conformer)
+            rdkit.Kekulize(molecule)
+        elif position_matrix is None:
             params = rdkit.ETKDGv2()
             params.randomSeed = random_seed
             if rdkit.EmbedMolecule(molecule, params) == -1:
@@ -150,6 +177,8 @@ class BuildingBlock(Molecule):
                     f'Embedding with seed value of {random_seed} '
                     'failed.'
                 )
+            if embedding_cache is not None:
+                embedding_cache._add(molecule, random_seed)
             rdkit.Kekulize(molecule)
         else:
             # Make sure the position matrix always holds floats.
@@ -157,9 +186,10 @@ class BuildingBlock(Molecule):
                 position_matrix,
                 dtype=np.float64,
             )
-            conformer = rdkit.Conformer(molecule.GetNumAtoms())
-            for atom_id, position in enumerate(position_matrix):
-                conformer.SetAtomPosition(atom_id, position)
+            conformer = set_conformer_positions(
+                conformer=rdkit.Conformer(molecule.GetNumAtoms()),
+                position_matrix=position_matrix,
+            )
             molecule.AddConformer(conformer)
 
         self._init_from_rdkit_mol(
@@ -168,6 +198,93 @@ class BuildingBlock(Molecule):
             placer_ids=placer_ids,
         )
 
+    @classmethod
+    def init_many(
+        cls,
+        smiles,
+        functional_groups=(),
+        embedding_cache=None,
+        num_processes=None,
+        chunk_size=16,
+    ):
+        """
+        Initialize many building blocks from SMILES, in parallel.
+
+        Embedding and functional group detection are done by a pool
+        of processes. Each process is given chunks of SMILES.
+
+        Examples
+        --------
+        *Creating a Building Block Library*
+
+        .. code-block:: python
+
+            import stk
+
+            smiles = ('NCCN', 'NC1CCC(N)CC1', 'Nc1ccc(N)cc1')
+            building_blocks = tuple(stk.BuildingBlock.init_many(
+                smiles=smiles,
+                functional_groups=[stk.PrimaryAminoFactory()],
+            ))
+
+        *Handling Failures*
+
+        If a building block cannot be created, the error raised while
+        creating it is yielded in its place, and the remaining
+        building blocks are still created
+
+        .. code-block:: python
+
+            for smiles, building_block in zip(
+                smiles,
+                stk.BuildingBlock.init_many(smiles),
+            ):
+                if isinstance(building_block, Exception):
+                    print(f'{smiles} failed: {building_block}')
+
+        Parameters
+        ----------
+        smiles : :class:`iterable` of :class:`str`
+            The SMILES of the building blocks.
+
+        functional_groups : :class:`iterable`, optional
+            An :class:`iterable` of :class:`.FunctionalGroup` or
+            :class:`.FunctionalGroupFactory` or both, which is
+            used for every building block. See :meth:`__init__`.
+
+        embedding_cache : :class:`.EmbeddingCache`, optional
+            The cache used to skip embedding, if it holds the
+            position matrix of a building block. See
+            :meth:`__init__`.
+
+        num_processes : :class:`int`, optional
+            The number of processes to use. If ``None``, the number
+            of CPUs is used. If ``1``, no processes are created.
+
+        chunk_size : :class:`int`, optional
+            The number of SMILES given to a process at a time.
+
+        Yields
+        ------
+        :class:`.BuildingBlock` or :class:`Exception`
+            A building block, or the error raised while creating it.
+            These are yielded in the same order as `smiles`.
+
+        """
+
+        init = partial(
+            _init_building_block,
+            cls=cls,
+            functional_groups=tuple(functional_groups),
+            embedding_cache=embedding_cache,
+        )
+        if num_processes == 1:
+            yield from map(init, smiles)
+            return
+
+        with pathos.pools.ProcessPool(num_processes) as pool:
+            yield from pool.imap(init, smiles, chunksize=chunk_size)
+
     @classmethod
     def init_from_molecule(
         cls,
@@ -350,9 +467,10 @@ class BuildingBlock(Molecule):
                 position_matrix,
                 dtype=np.float64,
             )
-            conformer = rdkit.Conformer(rdkit_molecule.GetNumAtoms())
-            for atom_id, position in enumerate(position_matrix):
-                conformer.SetAtomPosition(atom_id, position)
+            conformer = set_conformer_positions(
+                conformer=rdkit.Conformer(rdkit_molecule.GetNumAtoms()),
+                position_matrix=position_matrix,
+            )
             rdkit_molecule.AddConformer(conformer)
 
         rdkit.Kekulize(rdkit_molecule)
@@ -736,6 +854,17 @@ class BuildingBlock(Molecule):
         self._functional_groups = tuple(
             fg.with_atoms(atom_map) for fg in functional_groups
         )
+        self._core_atom_ids = None
+        self._placement_atom_ids = None
+        self._content_hash = None
+        # Keys can depend on the functional groups. The geometry
+        # cache is shared with clones, so it is replaced, rather than
+        # modified.
+        self._geometry_cache = {
+            key: value
+            for key, value in self._geometry_cache.items()
+            if key != 'keys'
+        }
         return self
 
     def with_functional_groups(self, functional_groups):
@@ -758,7 +887,7 @@ class BuildingBlock(Molecule):
         return self.clone()._with_functional_groups(functional_groups)
 
     def _with_canonical_atom_ordering(self):
-        ordering = rdkit.CanonicalRankAtoms(self.to_rdkit_mol())
+        ordering = self._get_canonical_ordering().tolist()
         super()._with_canonical_atom_ordering()
         atom_map = {
             old_id: self._atoms[new_id]
@@ -769,9 +898,11 @@ class BuildingBlock(Molecule):
             for functional_group in self._functional_groups
         )
         self._placer_ids = tuple(
-            atom_map[placer_id].get_id()
-            for placer_id in self._placer_ids
+            ordering[placer_id] for placer_id in self._placer_ids
         )
+        self._core_atom_ids = None
+        self._placement_atom_ids = None
+        self._content_hash = None
         return self
 
     def get_num_functional_groups(self):
@@ -818,8 +949,131 @@ class BuildingBlock(Molecule):
         clone = super().clone()
         clone._functional_groups = self._functional_groups
         clone._placer_ids = self._placer_ids
+        clone._core_atom_ids = self._core_atom_ids
+        clone._placement_atom_ids = self._placement_atom_ids
+        clone._content_hash = self._content_hash
         return clone
 
+    def get_content_hash(self, include_positions=False):
+        """
+        Get a hash of the content of the building block.
+
+        The hash depends on the atoms, bonds, functional groups and
+        *placer* ids of the building block and, optionally, its
+        atomic positions. It is calculated once and cached.
+
+        Building blocks keep being hashed and compared by identity,
+        so that distinct instances stay distinct, for example, in
+        topology graphs. The content hash can be used in their place,
+        when equivalent building blocks should be treated as one.
+
+        Examples
+        --------
+        *Removing Duplicate Building Blocks*
+
+        .. code-block:: python
+
+            import stk
+
+            building_blocks = (
+                stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                stk.BuildingBlock('BrCCBr'),
+            )
+            unique = {
+                building_block.get_content_hash(): building_block
+                for building_block in building_blocks
+            }
+            # The first two building blocks are equivalent.
+            assert len(unique) == 2
+
+        Parameters
+        ----------
+        include_positions : :class:`bool`, optional
+            Toggles if the atomic positions are hashed too. If
+            ``True``, building blocks are equivalent only if their
+            positions are exactly equal.
+
+        Returns
+        -------
+        :class:`str`
+            The hash, as a string of hexadecimal digits.
+
+        """
+
+        if self._content_hash is None:
+            self._content_hash = self._make_content_hash()
+
+        if not include_positions:
+            return self._content_hash
+
+        # Stored in the geometry cache, so that it is reset whenever
+        # the positions change. The key includes the content hash,
+        # because clones with different functional groups share the
+        # geometry cache.
+        key = ('content_hash', self._content_hash)
+        content_hash = self._geometry_cache.get(key)
+        if content_hash is None:
+            content_hash = hashlib.sha256(self._content_hash.encode())
+            content_hash.update(np.ascontiguousarray(
+                self._position_matrix,
+                dtype=np.float64,
+            ).tobytes())
+            content_hash = self._geometry_cache[key] = (
+                content_hash.hexdigest()
+            )
+        return content_hash
+
+    def _make_content_hash(self):
+        """
+        Make a hash of the atoms, bonds and functional groups.
+
+        Returns
+        -------
+        :class:`str`
+            The hash, as a string of hexadecimal digits.
+
+        """
+
+        content_hash = hashlib.sha256()
+        _update_hash(content_hash, [
+            (atom.get_atomic_number(), atom.get_charge())
+            for atom in self._atoms
+        ])
+        _update_hash(content_hash, self._get_bond_atom_id_matrix())
+        _update_hash(
+            content_hash,
+            [bond.get_order() for bond in self._bonds],
+            np.float64,
+        )
+        _update_hash(
+            content_hash,
+            [bond.get_periodicity() for bond in self._bonds],
+        )
+        for functional_group in self._functional_groups:
+            name = type(functional_group).__qualname__.encode()
+            _update_hash(content_hash, list(name))
+            _update_hash(content_hash, functional_group.get_atom_ids())
+            _update_hash(
+                content_hash,
+                functional_group.get_placer_ids(),
+            )
+            _update_hash(
+                content_hash,
+                functional_group.get_core_atom_ids(),
+            )
+            if isinstance(functional_group, GenericFunctionalGroup):
+                _update_hash(
+                    content_hash,
+                    functional_group.get_bonder_ids(),
+                )
+                _update_hash(
+                    content_hash,
+                    functional_group.get_deleter_ids(),
+                )
+        _update_hash(content_hash, self._placer_ids)
+        return content_hash.hexdigest()
+
     def get_placer_ids(self):
         """
         Yield the ids of *placer* atoms.
@@ -859,6 +1113,21 @@ class BuildingBlock(Molecule):
 
         """
 
+        if self._core_atom_ids is None:
+            self._core_atom_ids = tuple(self._make_core_atom_ids())
+        yield from self._core_atom_ids
+
+    def _make_core_atom_ids(self):
+        """
+        Yield ids of atoms which form the core of the building block.
+
+        Yields
+        ------
+        :class:`int`
+            The id of a core atom.
+
+        """
+
         functional_group_atom_ids = {
             atom_id
             for functional_group in self._functional_groups
@@ -873,6 +1142,286 @@ class BuildingBlock(Molecule):
             for atom_id in functional_group.get_core_atom_ids():
                 yield atom_id
 
+    def get_centroid(self, atom_ids=None):
+        """
+        Return the centroid.
+
+        The centroids of all atoms, of the *placer* atoms and of the
+        core atoms are cached, see :meth:`_get_placement_descriptor`.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are used to calculate the
+            centroid. Can be a single :class:`int`, if a single
+            atom is to be used, or ``None`` if all atoms are to be
+            used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The centroid of atoms specified by `atom_ids`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        return np.array(self._get_placement_descriptor(
+            name='centroid',
+            atom_ids=atom_ids,
+            calculate=super().get_centroid,
+        ))
+
+    def get_maximum_diameter(self, atom_ids=None):
+        """
+        Return the maximum diameter.
+
+        This method does not account for the van der Waals radius of
+        atoms. The maximum diameters of all atoms, of the *placer*
+        atoms and of the core atoms are cached, see
+        :meth:`_get_placement_descriptor`.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are considered when looking for the
+            maximum diameter. Can be a single :class:`int`, if a
+            single atom is to be used, or ``None``, if all atoms are to
+            be used.
+
+        Returns
+        -------
+        :class:`float`
+            The maximum diameter in the molecule.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        return self._get_placement_descriptor(
+            name='maximum_diameter',
+            atom_ids=atom_ids,
+            calculate=super().get_maximum_diameter,
+        )
+
+    def get_plane_normal(self, atom_ids=None):
+        """
+        Return the normal to the plane of best fit.
+
+        The normals of all atoms, of the *placer* atoms and of the
+        core atoms are cached, see :meth:`_get_placement_descriptor`.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which should be used to calculate the
+            plane. Can be a single :class:`int`, if a
+            single atom is to be used, or ``None``, if all atoms are to
+            be used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Vector orthonormal to the plane of the molecule.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        return np.array(self._get_placement_descriptor(
+            name='plane_normal',
+            atom_ids=atom_ids,
+            calculate=self._get_plane_normal,
+        ))
+
+    def _get_plane_normal(self, atom_ids):
+        """
+        Calculate the normal to the plane of best fit.
+
+        Unlike :meth:`.Molecule.get_plane_normal`, the centroid is
+        calculated from the positions, rather than taken from the
+        cache. A cached centroid, which was moved with the building
+        block, can differ from a calculated one by a rounding error,
+        which is enough to flip the normal of three atoms.
+
+        Parameters
+        ----------
+        atom_ids : :class:`tuple` of :class:`int`
+            The ids of atoms which should be used to calculate the
+            plane. If ``None``, all atoms are used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Vector orthonormal to the plane of the atoms.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        if atom_ids is None:
+            atom_ids = tuple(range(len(self._atoms)))
+
+        if len(atom_ids) == 0:
+            raise ValueError('atom_ids was of length 0.')
+
+        pos = self._position_matrix[:, list(atom_ids)].T
+        centroid = super().get_centroid(atom_ids)
+        return np.linalg.svd(pos - centroid)[-1][2, :]
+
+    def _get_placement_descriptor(self, name, atom_ids, calculate):
+        """
+        Get a descriptor used to place the building block.
+
+        Topology graphs place the same building block many times, so
+        descriptors of all atoms, and of the *placer* and core atoms
+        given by :meth:`_get_placement_atom_ids`, are cached. They
+        are kept in the ``'placement'`` :class:`dict` of the geometry
+        cache, which is shared by clones and carried over by rigid
+        motions. Descriptors of any other atoms are not cached.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the descriptor.
+
+        atom_ids : :class:`iterable` of :class:`int`
+            The ids of atoms used to calculate the descriptor. Can be
+            a single :class:`int`, if a single atom is used, or
+            ``None``, if all atoms are used.
+
+        calculate : :class:`callable`
+            Takes a single parameter, `atom_ids`, and returns the
+            descriptor.
+
+        Returns
+        -------
+        :class:`object`
+            The descriptor.
+
+        """
+
+        if isinstance(atom_ids, int):
+            atom_ids = (atom_ids, )
+        elif atom_ids is not None and not isinstance(atom_ids, tuple):
+            atom_ids = tuple(atom_ids)
+
+        if (
+            atom_ids is not None
+            and atom_ids not in self._get_placement_atom_ids()
+        ):
+            return calculate(atom_ids)
+
+        placement = self._geometry_cache.setdefault('placement', {})
+        key = (name, atom_ids)
+        descriptor = placement.get(key)
+        if descriptor is None:
+            descriptor = placement[key] = calculate(atom_ids)
+        return descriptor
+
+    def _get_placement_atom_ids(self):
+        """
+        Get the groups of atoms whose descriptors are cached.
+
+        Returns
+        -------
+        :class:`frozenset` of :class:`tuple`
+            The *placer* ids, the core atom ids and the *placer* ids
+            of each functional group.
+
+        """
+
+        if self._placement_atom_ids is None:
+            self._placement_atom_ids = frozenset((
+                tuple(self._placer_ids),
+                tuple(self.get_core_atom_ids()),
+                *(
+                    tuple(functional_group.get_placer_ids())
+                    for functional_group in self._functional_groups
+                ),
+            ))
+        return self._placement_atom_ids
+
+    def _get_displaced_geometry_cache(self, displacement):
+        """
+        Get the geometry cache to use after a displacement.
+
+        Cached centroids are displaced. Plane normals and maximum
+        diameters do not change.
+
+        Parameters
+        ----------
+        displacement : :class:`numpy.ndarray`
+            The displacement applied to the building block.
+
+        Returns
+        -------
+        :class:`dict`
+            The new geometry cache.
+
+        """
+
+        placement = self._geometry_cache.get('placement')
+        if not placement:
+            return {}
+        return {
+            'placement': {
+                key: (
+                    descriptor + displacement
+                    if key[0] == 'centroid'
+                    else descriptor
+                )
+                for key, descriptor in placement.items()
+            },
+        }
+
+    def _get_rotated_geometry_cache(self, rotation_matrix):
+        """
+        Get the geometry cache to use after a rotation.
+
+        Only cached centroids are kept, and rotated. The sign of a
+        plane normal, given by the singular value decomposition,
+        does not rotate with the building block, so a rotated normal
+        can differ from a recalculated one. Maximum diameters are
+        calculated from bounding boxes, which are not invariant to
+        rotation. Both are calculated again, when needed.
+
+        Parameters
+        ----------
+        rotation_matrix : :class:`numpy.ndarray`
+            The rotation applied to the building block, about the
+            origin.
+
+        Returns
+        -------
+        :class:`dict`
+            The new geometry cache.
+
+        """
+
+        placement = self._geometry_cache.get('placement')
+        if not placement:
+            return {}
+        return {
+            'placement': {
+                key: rotation_matrix @ descriptor
+                for key, descriptor in placement.items()
+                if key[0] == 'centroid'
+            },
+        }
+
     def __str__(self):
         if self._functional_groups:
             fg_repr = f', {self._functional_groups!r}'
@@ -886,3 +1435,72 @@ class BuildingBlock(Molecule):
 
     def __repr__(self):
         return str(self)
+
+
+def _init_building_block(
+    smiles,
+    cls,
+    functional_groups,
+    embedding_cache,
+):
+    """
+    Initialize a building block, catching any error raised.
+
+    Parameters
+    ----------
+    smiles : :class:`str`
+        The SMILES of the building block.
+
+    cls : :class:`type`
+        The building block class.
+
+    functional_groups : :class:`tuple`
+        The functional groups and functional group factories of the
+        building block.
+
+    embedding_cache : :class:`.EmbeddingCache`
+        The cache used to skip embedding. Can be ``None``.
+
+    Returns
+    -------
+    :class:`.BuildingBlock` or :class:`Exception`
+        The building block, or the error raised while creating it.
+
+    """
+
+    try:
+        return cls(
+            smiles=smiles,
+            functional_groups=functional_groups,
+            embedding_cache=embedding_cache,
+        )
+    except Exception as error:
+        return error
+
+
+def _update_hash(content_hash, values, dtype=np.int64):
+    """
+    Add an array to a hash.
+
+    Parameters
+    ----------
+    content_hash : :class:`hashlib.sha256`
+        The hash to update.
+
+    values : :class:`iterable`
+        The values of the array.
+
+    dtype : :class:`type`, optional
+        The type of the array.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    array = np.array(list(values), dtype=dtype)
+    # The shape is added too, so that the boundaries between arrays
+    # are part of the hash.
+    content_hash.update(np.array(array.shape, dtype=np.int64).tobytes())
+    content_hash.update(array.tobytes())
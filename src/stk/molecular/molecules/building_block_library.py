@@ -0,0 +1,770 @@
+"""
+Building Block Library
+======================
+
+"""
+
+import inspect
+import importlib
+import json
+import struct
+from functools import reduce
+
+import numpy as np
+
+from ..atoms import Atom
+from ..bonds import Bond
+from ..key_makers import InchiKey, Smiles
+from .building_block import BuildingBlock
+
+
+class BuildingBlockLibrary:
+    """
+    Provides random access to building blocks stored in a single file.
+
+    The atoms, bonds, positions, functional groups and *placer* ids
+    of all building blocks are stored in concatenated arrays, with
+    an offset index giving the part of each array which belongs to a
+    given building block. The arrays are memory mapped, which means
+    only the data of the building blocks which are retrieved is ever
+    read from disk, no matter how large the library is.
+
+    The library also holds a key column for every
+    :class:`.MoleculeKeyMaker` used when it was written, along with
+    its sort order, so that building blocks can be looked up by
+    key with a binary search.
+
+    Notes
+    -----
+    Functional groups are stored by recording their class and the
+    ids of the atoms passed to each parameter of its initializer.
+    This means that any :class:`.FunctionalGroup` can be stored,
+    as long as each initializer parameter, for example ``bonders``,
+    is kept by the instance in an attribute of the same name with a
+    leading underscore, for example ``_bonders``. This is the case
+    for all functional groups defined by :mod:`stk`.
+
+    Examples
+    --------
+    *Writing a Library*
+
+    .. code-block:: python
+
+        import stk
+
+        library = stk.BuildingBlockLibrary.init_from_building_blocks(
+            path='building_blocks.stklib',
+            building_blocks=(
+                stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                stk.BuildingBlock('BrCCCBr', [stk.BromoFactory()]),
+            ),
+        )
+
+    *Reading a Library*
+
+    Opening a library is cheap, because none of the building blocks
+    are loaded until they are asked for
+
+    .. code-block:: python
+
+        library = stk.BuildingBlockLibrary('building_blocks.stklib')
+        building_block = library.get_building_block(1)
+
+    Building blocks can also be retrieved by any of their keys
+
+    .. code-block:: python
+
+        building_block = library.get({'SMILES': 'BrCCCBr'})
+
+    *Using a Library for Mutation*
+
+    A library can be used to select random building blocks without
+    loading all of them
+
+    .. code-block:: python
+
+        import numpy as np
+
+        generator = np.random.RandomState(4)
+        building_block = library.get_building_block(
+            index=generator.randint(library.get_num_building_blocks()),
+        )
+
+    """
+
+    # Identifies the file format.
+    _magic = b'STKLIB01'
+
+    # The byte boundary each array is aligned to.
+    _alignment = 64
+
+    def __init__(self, path):
+        """
+        Initialize a :class:`.BuildingBlockLibrary` instance.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path to a library file, written by
+            :meth:`.init_from_building_blocks`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `path` does not hold a library.
+
+        """
+
+        with open(path, 'rb') as f:
+            magic = f.read(len(self._magic))
+            if magic != self._magic:
+                raise ValueError(
+                    f'{path} is not a building block library.'
+                )
+            header_size, = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(header_size).decode())
+
+        self._path = path
+        self._num_building_blocks = header['num_building_blocks']
+        self._key_names = tuple(header['key_names'])
+        self._functional_group_types = tuple(
+            (
+                _get_class(module, qualname),
+                tuple(
+                    (name, is_sequence)
+                    for name, is_sequence in parameters
+                ),
+            )
+            for module, qualname, parameters
+            in header['functional_group_types']
+        )
+        # The arrays are plain arrays viewing a single memory map,
+        # because slicing a numpy.memmap has a much larger overhead.
+        memory_map = np.memmap(path, dtype=np.uint8, mode='r')
+        self._arrays = {
+            name: np.ndarray(
+                shape=tuple(array['shape']),
+                dtype=array['dtype'],
+                buffer=memory_map,
+                offset=array['offset'],
+            )
+            for name, array in header['arrays'].items()
+        }
+
+    @classmethod
+    def init_from_building_blocks(
+        cls,
+        path,
+        building_blocks,
+        key_makers=(InchiKey(), Smiles()),
+    ):
+        """
+        Write a library file and open it.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path into which the library is written. Any existing
+            file is overwritten.
+
+        building_blocks : :class:`iterable` of :class:`.BuildingBlock`
+            The building blocks to store in the library.
+
+        key_makers : :class:`tuple` of :class:`.MoleculeKeyMaker`
+            Used to make the keys by which the building blocks can be
+            looked up.
+
+        Returns
+        -------
+        :class:`.BuildingBlockLibrary`
+            The library.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the functional groups of a building block cannot be
+            stored.
+
+        """
+
+        writer = _LibraryWriter(key_makers)
+        for building_block in building_blocks:
+            writer.add(building_block)
+        writer.write(path, cls._magic, cls._alignment)
+        return cls(path)
+
+    def get_num_building_blocks(self):
+        """
+        Get the number of building blocks in the library.
+
+        Returns
+        -------
+        :class:`int`
+            The number of building blocks.
+
+        """
+
+        return self._num_building_blocks
+
+    def get_key_names(self):
+        """
+        Get the names of the keys which can be used for look up.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`str`
+            The names of the keys.
+
+        """
+
+        return self._key_names
+
+    def get_building_block(self, index):
+        """
+        Get a building block by its index.
+
+        Parameters
+        ----------
+        index : :class:`int`
+            The index of the building block in the library. This is
+            the position of the building block in the `building_blocks`
+            passed to :meth:`.init_from_building_blocks`.
+
+        Returns
+        -------
+        :class:`.BuildingBlock`
+            The building block.
+
+        Raises
+        ------
+        :class:`IndexError`
+            If `index` is out of range.
+
+        """
+
+        index = int(index)
+        if not 0 <= index < self._num_building_blocks:
+            raise IndexError(
+                f'The library has no building block with index {index}.'
+            )
+
+        arrays = self._arrays
+        atom_start, atom_end = _get_slice(arrays['atom_offsets'], index)
+        atoms = tuple(
+            Atom(id, atomic_number, charge)
+            for id, (atomic_number, charge) in enumerate(zip(
+                arrays['atomic_numbers'][atom_start:atom_end].tolist(),
+                arrays['charges'][atom_start:atom_end].tolist(),
+            ))
+        )
+
+        bond_start, bond_end = _get_slice(arrays['bond_offsets'], index)
+        bonds = tuple(
+            Bond(atoms[atom1], atoms[atom2], order, tuple(periodicity))
+            for (atom1, atom2), order, periodicity in zip(
+                arrays['bond_atom_ids'][bond_start:bond_end].tolist(),
+                arrays['bond_orders'][bond_start:bond_end].tolist(),
+                arrays['periodicities'][bond_start:bond_end].tolist(),
+            )
+        )
+
+        placer_start, placer_end = _get_slice(
+            offsets=arrays['placer_offsets'],
+            index=index,
+        )
+        return BuildingBlock.init(
+            atoms=atoms,
+            bonds=bonds,
+            position_matrix=arrays['positions'][atom_start:atom_end],
+            functional_groups=self._get_functional_groups(index, atoms),
+            placer_ids=tuple(
+                arrays['placer_ids'][placer_start:placer_end].tolist()
+            ),
+        )
+
+    def get(self, key):
+        """
+        Get a building block by one of its keys.
+
+        Parameters
+        ----------
+        key : :class:`dict`
+            Holds a single item, mapping the name of a key to the
+            value it should have, for example
+            ``{'InChIKey': 'LNAZSHAWQACDHT-UHFFFAOYSA-N'}``.
+
+        Returns
+        -------
+        :class:`.BuildingBlock`
+            The building block. If many building blocks have the key,
+            the one with the lowest index is returned.
+
+        Raises
+        ------
+        :class:`KeyError`
+            If no building block in the library has the key.
+
+        """
+
+        (key_name, value), = key.items()
+        if key_name not in self._key_names:
+            raise KeyError(
+                f'The library has no key called {key_name!r}.'
+            )
+
+        column = self._key_names.index(key_name)
+        offsets = self._arrays[f'key_offsets_{column}']
+        data = self._arrays[f'key_data_{column}']
+        order = self._arrays[f'key_order_{column}']
+        value = str(value).encode()
+
+        def get_value(index):
+            start, end = _get_slice(offsets, index)
+            return data[start:end].tobytes()
+
+        # Find the first position in the sort order whose value is not
+        # less than the one looked for.
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low+high) // 2
+            if get_value(order[middle]) < value:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == len(order) or get_value(order[low]) != value:
+            raise KeyError(
+                'No building block found in the library with a key '
+                f'of: {key}'
+            )
+        return self.get_building_block(order[low])
+
+    def get_building_blocks(self):
+        """
+        Yield the building blocks in the library.
+
+        Yields
+        ------
+        :class:`.BuildingBlock`
+            A building block.
+
+        """
+
+        for index in range(self._num_building_blocks):
+            yield self.get_building_block(index)
+
+    def _get_functional_groups(self, index, atoms):
+        """
+        Yield the functional groups of a building block.
+
+        Parameters
+        ----------
+        index : :class:`int`
+            The index of the building block.
+
+        atoms : :class:`tuple` of :class:`.Atom`
+            The atoms of the building block.
+
+        Yields
+        ------
+        :class:`.FunctionalGroup`
+            A functional group of the building block.
+
+        """
+
+        arrays = self._arrays
+        start, end = _get_slice(arrays['functional_group_offsets'], index)
+        id_start = int(arrays['functional_group_id_offsets'][start])
+        id_end = int(arrays['functional_group_id_offsets'][end])
+        ids = iter(
+            arrays['functional_group_ids'][id_start:id_end].tolist()
+        )
+        for type_index in (
+            arrays['functional_group_types'][start:end].tolist()
+        ):
+            functional_group_class, parameters = (
+                self._functional_group_types[type_index]
+            )
+            kwargs = {}
+            for name, is_sequence in parameters:
+                if is_sequence:
+                    # Sequences are stored as their length, followed
+                    # by their atom ids.
+                    kwargs[name] = tuple(
+                        atoms[next(ids)] for _ in range(next(ids))
+                    )
+                else:
+                    kwargs[name] = atoms[next(ids)]
+            yield functional_group_class(**kwargs)
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._path!r})'
+
+
+class _LibraryWriter:
+    """
+    Collects the arrays of a library file.
+
+    """
+
+    def __init__(self, key_makers):
+        """
+        Initialize a :class:`._LibraryWriter` instance.
+
+        Parameters
+        ----------
+        key_makers : :class:`tuple` of :class:`.MoleculeKeyMaker`
+            Used to make the key columns of the library.
+
+        """
+
+        self._key_makers = tuple(key_makers)
+        self._num_building_blocks = 0
+        self._atomic_numbers = []
+        self._charges = []
+        self._positions = []
+        self._num_atoms = []
+        self._bond_atom_ids = []
+        self._bond_orders = []
+        self._periodicities = []
+        self._num_bonds = []
+        self._placer_ids = []
+        self._num_placers = []
+        self._functional_group_types = {}
+        self._functional_group_type_ids = []
+        self._functional_group_ids = []
+        self._num_functional_group_ids = []
+        self._num_functional_groups = []
+        self._keys = [[] for _ in self._key_makers]
+
+    def add(self, building_block):
+        """
+        Add a building block.
+
+        Parameters
+        ----------
+        building_block : :class:`.BuildingBlock`
+            The building block to add.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the functional groups of `building_block` cannot be
+            stored.
+
+        """
+
+        self._num_building_blocks += 1
+        atoms = tuple(building_block.get_atoms())
+        self._num_atoms.append(len(atoms))
+        self._atomic_numbers.extend(
+            atom.get_atomic_number() for atom in atoms
+        )
+        self._charges.extend(atom.get_charge() for atom in atoms)
+        self._positions.append(building_block.get_position_matrix())
+
+        bonds = tuple(building_block.get_bonds())
+        self._num_bonds.append(len(bonds))
+        for bond in bonds:
+            self._bond_atom_ids.append((
+                bond.get_atom1().get_id(),
+                bond.get_atom2().get_id(),
+            ))
+            self._bond_orders.append(bond.get_order())
+            self._periodicities.append(bond.get_periodicity())
+
+        placer_ids = tuple(building_block.get_placer_ids())
+        self._num_placers.append(len(placer_ids))
+        self._placer_ids.extend(placer_ids)
+
+        self._num_functional_groups.append(
+            building_block.get_num_functional_groups()
+        )
+        for functional_group in building_block.get_functional_groups():
+            self._add_functional_group(functional_group)
+
+        for keys, key_maker in zip(self._keys, self._key_makers):
+            keys.append(str(key_maker.get_key(building_block)).encode())
+
+    def _add_functional_group(self, functional_group):
+        """
+        Add a functional group.
+
+        Parameters
+        ----------
+        functional_group : :class:`.FunctionalGroup`
+            The functional group to add.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `functional_group` cannot be stored.
+
+        """
+
+        functional_group_class = type(functional_group)
+        parameters = []
+        ids = []
+        for name in inspect.signature(
+            functional_group_class
+        ).parameters:
+            try:
+                value = getattr(functional_group, f'_{name}')
+            except AttributeError:
+                raise ValueError(
+                    f'{functional_group_class.__name__} cannot be '
+                    'stored in a library, because it has no '
+                    f'attribute called _{name}.'
+                )
+            if isinstance(value, Atom):
+                parameters.append((name, False))
+                ids.append(value.get_id())
+            elif (
+                isinstance(value, tuple)
+                and all(isinstance(atom, Atom) for atom in value)
+            ):
+                parameters.append((name, True))
+                ids.append(len(value))
+                ids.extend(atom.get_id() for atom in value)
+            else:
+                raise ValueError(
+                    f'{functional_group_class.__name__} cannot be '
+                    f'stored in a library, because its _{name} '
+                    'attribute does not hold atoms.'
+                )
+
+        functional_group_type = (
+            functional_group_class.__module__,
+            functional_group_class.__qualname__,
+            tuple(parameters),
+        )
+        self._functional_group_type_ids.append(
+            self._functional_group_types.setdefault(
+                functional_group_type,
+                len(self._functional_group_types),
+            )
+        )
+        self._num_functional_group_ids.append(len(ids))
+        self._functional_group_ids.extend(ids)
+
+    def write(self, path, magic, alignment):
+        """
+        Write the library file.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path into which the library is written.
+
+        magic : :class:`bytes`
+            Written at the start of the file to identify its format.
+
+        alignment : :class:`int`
+            The byte boundary each array is aligned to.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        arrays = {
+            'atom_offsets': _get_offsets(self._num_atoms),
+            'atomic_numbers': np.array(
+                self._atomic_numbers,
+                dtype=np.uint8,
+            ),
+            'charges': np.array(self._charges, dtype=np.int8),
+            'positions': np.concatenate(
+                [np.empty((0, 3))] + self._positions,
+            ).astype(np.float64),
+            'bond_offsets': _get_offsets(self._num_bonds),
+            'bond_atom_ids': np.array(
+                self._bond_atom_ids,
+                dtype=np.int32,
+            ).reshape(-1, 2),
+            'bond_orders': np.array(self._bond_orders, dtype=np.int8),
+            'periodicities': np.array(
+                self._periodicities,
+                dtype=np.int8,
+            ).reshape(-1, 3),
+            'placer_offsets': _get_offsets(self._num_placers),
+            'placer_ids': np.array(self._placer_ids, dtype=np.int32),
+            'functional_group_offsets': _get_offsets(
+                self._num_functional_groups,
+            ),
+            'functional_group_types': np.array(
+                self._functional_group_type_ids,
+                dtype=np.int32,
+            ),
+            'functional_group_id_offsets': _get_offsets(
+                self._num_functional_group_ids,
+            ),
+            'functional_group_ids': np.array(
+                self._functional_group_ids,
+                dtype=np.int32,
+            ),
+        }
+        for column, keys in enumerate(self._keys):
+            arrays[f'key_offsets_{column}'] = _get_offsets(
+                map(len, keys),
+            )
+            arrays[f'key_data_{column}'] = np.frombuffer(
+                b''.join(keys),
+                dtype=np.uint8,
+            )
+            arrays[f'key_order_{column}'] = np.array(
+                sorted(range(len(keys)), key=keys.__getitem__),
+                dtype=np.int64,
+            )
+
+        # The header holds the offset of each array, which depends on
+        # the size of the header, so the size is fixed first.
+        header = {
+            'num_building_blocks': self._num_building_blocks,
+            'key_names': [
+                key_maker.get_key_name()
+                for key_maker in self._key_makers
+            ],
+            'functional_group_types': [
+                [module, qualname, parameters]
+                for module, qualname, parameters
+                in self._functional_group_types
+            ],
+            'arrays': {
+                name: {
+                    'dtype': array.dtype.str,
+                    'shape': array.shape,
+                    'offset': 0,
+                }
+                for name, array in arrays.items()
+            },
+        }
+        prefix_size = len(magic) + 8
+        # Leave room for offsets of any size.
+        header_size = _align(
+            size=(
+                prefix_size
+                + len(json.dumps(header))
+                + 20*len(arrays)
+            ),
+            alignment=alignment,
+        ) - prefix_size
+        offset = prefix_size + header_size
+        for name, array in arrays.items():
+            header['arrays'][name]['offset'] = offset
+            offset = _align(offset+array.nbytes, alignment)
+
+        with open(path, 'wb') as f:
+            f.write(magic)
+            f.write(struct.pack('<Q', header_size))
+            f.write(json.dumps(header).encode().ljust(header_size))
+            for name, array in arrays.items():
+                f.seek(header['arrays'][name]['offset'])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(offset)
+
+
+def _get_offsets(sizes):
+    """
+    Get the offsets of consecutive sections of an array.
+
+    Parameters
+    ----------
+    sizes : :class:`iterable` of :class:`int`
+        The size of each section.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The start of every section, followed by the end of the last
+        one.
+
+    """
+
+    return np.concatenate((
+        [0],
+        np.cumsum(np.fromiter(sizes, dtype=np.int64)),
+    )).astype(np.int64)
+
+
+def _get_slice(offsets, index):
+    """
+    Get the start and end of a section of an array.
+
+    Parameters
+    ----------
+    offsets : :class:`numpy.ndarray`
+        The offsets of the sections of the array.
+
+    index : :class:`int`
+        The index of the section.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`int`
+        The start and end of the section.
+
+    """
+
+    start, end = offsets[index:index+2].tolist()
+    return start, end
+
+
+def _align(size, alignment):
+    """
+    Round a size up to a multiple of an alignment.
+
+    Parameters
+    ----------
+    size : :class:`int`
+        The size, in bytes.
+
+    alignment : :class:`int`
+        The alignment, in bytes.
+
+    Returns
+    -------
+    :class:`int`
+        The aligned size.
+
+    """
+
+    return -(-size // alignment) * alignment
+
+
+def _get_class(module, qualname):
+    """
+    Get a class from its module and qualified name.
+
+    Parameters
+    ----------
+    module : :class:`str`
+        The name of the module holding the class.
+
+    qualname : :class:`str`
+        The qualified name of the class.
+
+    Returns
+    -------
+    :class:`type`
+        The class.
+
+    """
+
+    return reduce(
+        getattr,
+        qualname.split('.'),
+        importlib.import_module(module),
+    )
@@ -0,0 +1,644 @@
+"""
+Conformer Ensemble
+==================
+
+"""
+
+import numpy as np
+
+from stk.utilities import rotation_matrix_arbitrary_axis
+
+
+class ConformerEnsemble:
+    """
+    Holds many conformers of a molecule.
+
+    The atoms and bonds of the molecule are stored once, while the
+    positions of the conformers are held in a single ``(k, n, 3)``
+    array, where ``k`` is the number of conformers and ``n`` is the
+    number of atoms. This means geometric operations on the
+    conformers are done with a single :mod:`numpy` call.
+
+    Examples
+    --------
+    *Creating an Ensemble*
+
+    .. code-block:: python
+
+        import stk
+        import numpy as np
+
+        building_block = stk.BuildingBlock('NCCN')
+        ensemble = stk.ConformerEnsemble(
+            molecule=building_block,
+            position_matrices=np.array([
+                building_block.get_position_matrix(),
+                building_block.with_rotation_about_axis(
+                    angle=np.pi/2,
+                    axis=np.array([0., 0., 1.]),
+                    origin=np.zeros(3),
+                ).get_position_matrix(),
+            ]),
+        )
+
+    An ensemble can also be created from molecules which share the
+    same atoms and bonds
+
+    .. code-block:: python
+
+        ensemble = stk.ConformerEnsemble.init_from_molecules(
+            molecules=(
+                building_block,
+                building_block.with_centroid(np.zeros(3)),
+            ),
+        )
+
+    *Loading a Trajectory*
+
+    Every frame of a multi-frame ``.xyz`` file can be loaded into an
+    ensemble
+
+    .. code-block:: python
+
+        ensemble = stk.ConformerEnsemble.init_from_file(
+            molecule=building_block,
+            path='trajectory.xyz',
+        )
+
+    *Using Conformers*
+
+    Any conformer can be retrieved as a regular molecule, which is
+    an instance of the same class as the molecule the ensemble was
+    created from
+
+    .. code-block:: python
+
+        conformer = ensemble.get_conformer(1)
+        conformer.write('conformer_1.mol')
+
+    *Comparing Conformers*
+
+    .. code-block:: python
+
+        # Get the RMSD of every conformer to the first one.
+        rmsds = ensemble.get_rmsds(reference_id=0)
+        # Get the maximum diameter of every conformer.
+        diameters = ensemble.get_maximum_diameters()
+
+    """
+
+    def __init__(self, molecule, position_matrices):
+        """
+        Initialize a :class:`.ConformerEnsemble` instance.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule whose conformers are held. Its atoms and
+            bonds are used by every conformer.
+
+        position_matrices : :class:`numpy.ndarray`
+            A ``(k, n, 3)`` array holding the position matrix of
+            every conformer, where ``k`` is the number of conformers
+            and ``n`` is the number of atoms in `molecule`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `position_matrices` does not have the shape
+            ``(k, n, 3)``.
+
+        """
+
+        position_matrices = np.array(position_matrices, dtype=np.float64)
+        num_atoms = molecule.get_num_atoms()
+        if (
+            position_matrices.ndim != 3
+            or position_matrices.shape[1:] != (num_atoms, 3)
+        ):
+            raise ValueError(
+                'position_matrices must have the shape '
+                f'(k, {num_atoms}, 3), but has the shape '
+                f'{position_matrices.shape}.'
+            )
+
+        self._molecule = molecule
+        self._position_matrices = position_matrices
+
+    @classmethod
+    def init_from_molecules(cls, molecules):
+        """
+        Initialize from molecules with the same atoms and bonds.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The conformers. The atoms and bonds of the first molecule
+            are used for every conformer.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            The ensemble.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `molecules` is empty or the molecules have a different
+            number of atoms.
+
+        """
+
+        molecules = tuple(molecules)
+        if len(molecules) == 0:
+            raise ValueError('molecules was of length 0.')
+
+        return cls(
+            molecule=molecules[0],
+            position_matrices=np.array([
+                molecule.get_position_matrix() for molecule in molecules
+            ]),
+        )
+
+    @classmethod
+    def init_from_file(cls, molecule, path, extension=None):
+        """
+        Initialize from the structures held by a file.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule whose conformers are held by the file.
+
+        path : :class:`str`
+            The path to the file. Supported file types are the same as
+            for :meth:`.Molecule.get_position_matrices_from_file`.
+
+        extension : :class:`str`, optional
+            If you want to treat the file as though it has a
+            particular extension, put it here. Include the dot.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            The ensemble, holding a conformer for every structure in
+            the file.
+
+        Raises
+        ------
+        :class:`RuntimeError`
+            If the number of atoms in a structure does not match the
+            number of atoms in `molecule` or if atom elements in a
+            structure do not agree with the atom elements in
+            `molecule`.
+
+        """
+
+        return cls(
+            molecule=molecule,
+            position_matrices=np.array(list(
+                molecule.get_position_matrices_from_file(
+                    path=path,
+                    extension=extension,
+                )
+            )).reshape(-1, molecule.get_num_atoms(), 3),
+        )
+
+    def clone(self):
+        """
+        Return a clone.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            The clone.
+
+        """
+
+        clone = self.__class__.__new__(self.__class__)
+        clone._molecule = self._molecule
+        clone._position_matrices = np.array(self._position_matrices)
+        return clone
+
+    def get_num_conformers(self):
+        """
+        Get the number of conformers.
+
+        Returns
+        -------
+        :class:`int`
+            The number of conformers.
+
+        """
+
+        return len(self._position_matrices)
+
+    def get_num_atoms(self):
+        """
+        Get the number of atoms in each conformer.
+
+        Returns
+        -------
+        :class:`int`
+            The number of atoms in each conformer.
+
+        """
+
+        return self._position_matrices.shape[1]
+
+    def get_position_matrices(self):
+        """
+        Get the position matrices of the conformers.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A ``(k, n, 3)`` array holding the position matrix of
+            every conformer.
+
+        """
+
+        return np.array(self._position_matrices)
+
+    def get_conformer(self, conformer_id):
+        """
+        Get a conformer as a molecule.
+
+        Parameters
+        ----------
+        conformer_id : :class:`int`
+            The id of the conformer.
+
+        Returns
+        -------
+        :class:`.Molecule`
+            The conformer. It is of the same class as the molecule
+            the ensemble was created from and shares its atoms and
+            bonds.
+
+        """
+
+        return self._molecule.with_position_matrix(
+            position_matrix=self._position_matrices[conformer_id],
+        )
+
+    def get_conformers(self):
+        """
+        Yield the conformers as molecules.
+
+        Yields
+        ------
+        :class:`.Molecule`
+            A conformer, in order of conformer id.
+
+        """
+
+        for conformer_id in range(len(self._position_matrices)):
+            yield self.get_conformer(conformer_id)
+
+    def get_centroids(self, atom_ids=None):
+        """
+        Get the centroid of every conformer.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are used to calculate the
+            centroids. Can be a single :class:`int`, if a single
+            atom is to be used, or ``None`` if all atoms are to be
+            used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A ``(k, 3)`` array holding the centroid of every
+            conformer.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        atom_ids = self._normalize_atom_ids(atom_ids)
+        return self._position_matrices[:, atom_ids].mean(axis=1)
+
+    def get_maximum_diameters(self, atom_ids=None):
+        """
+        Get the maximum diameter of every conformer.
+
+        This method does not account for the van der Waals radius of
+        atoms.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are considered when looking for
+            the maximum diameter. Can be a single :class:`int`, if a
+            single atom is to be used, or ``None``, if all atoms are
+            to be used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The maximum diameter of every conformer.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        atom_ids = self._normalize_atom_ids(atom_ids)
+        coords = self._position_matrices[:, atom_ids]
+        return np.linalg.norm(
+            coords.max(axis=1) - coords.min(axis=1),
+            axis=1,
+        )
+
+    def get_rmsds(self, reference_id=0, atom_ids=None):
+        """
+        Get the RMSD of every conformer to a reference conformer.
+
+        The RMSD is calculated after the conformers are optimally
+        superimposed on the reference, using the Kabsch algorithm.
+
+        Parameters
+        ----------
+        reference_id : :class:`int`, optional
+            The id of the reference conformer.
+
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are used to superimpose the
+            conformers and calculate the RMSD. Can be a single
+            :class:`int`, if a single atom is to be used, or ``None``,
+            if all atoms are to be used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The RMSD of every conformer to the reference conformer.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        atom_ids = self._normalize_atom_ids(atom_ids)
+        coords = self._position_matrices[:, atom_ids]
+        coords = coords - coords.mean(axis=1, keepdims=True)
+        reference = coords[reference_id]
+        rotation_matrices = _get_kabsch_rotation_matrices(
+            coords=coords,
+            reference=reference,
+        )
+        aligned = coords @ rotation_matrices.transpose(0, 2, 1)
+        return np.sqrt(
+            np.square(aligned - reference).sum(axis=2).mean(axis=1)
+        )
+
+    def _with_displacement(self, displacement):
+        """
+        Modify the ensemble.
+
+        """
+
+        self._position_matrices += displacement
+        return self
+
+    def with_displacement(self, displacement):
+        """
+        Return a displaced clone.
+
+        Parameters
+        ----------
+        displacement : :class:`numpy.ndarray`
+            The displacement vector to be applied to every conformer.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            A displaced clone.
+
+        """
+
+        return self.clone()._with_displacement(displacement)
+
+    def _with_centroid(self, position, atom_ids):
+        """
+        Modify the ensemble.
+
+        """
+
+        centroids = self.get_centroids(atom_ids)
+        self._position_matrices += (position - centroids)[:, np.newaxis]
+        return self
+
+    def with_centroid(self, position, atom_ids=None):
+        """
+        Return a clone where every conformer has its centroid moved.
+
+        Parameters
+        ----------
+        position : :class:`numpy.ndarray`
+            The desired centroid of every conformer.
+
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are used to calculate the
+            centroids. Can be a single :class:`int`, if a single
+            atom is to be used, or ``None`` if all atoms are to be
+            used.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            A clone with the centroid of every conformer at
+            `position`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        return self.clone()._with_centroid(position, atom_ids)
+
+    def _with_rotation_about_axis(self, angle, axis, origin):
+        """
+        Modify the ensemble.
+
+        """
+
+        rot_mat = rotation_matrix_arbitrary_axis(angle, axis)
+        self._position_matrices = (
+            (self._position_matrices - origin) @ rot_mat.T + origin
+        )
+        return self
+
+    def with_rotation_about_axis(self, angle, axis, origin):
+        """
+        Return a clone with every conformer rotated about an axis.
+
+        Parameters
+        ----------
+        angle : :class:`float`
+            The size of the rotation in radians.
+
+        axis : :class:`numpy.ndarray`
+            The axis about which the rotation happens. Must have unit
+            magnitude.
+
+        origin : :class:`numpy.ndarray`
+            The origin about which the rotation happens.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            A rotated clone.
+
+        """
+
+        return self.clone()._with_rotation_about_axis(
+            angle=angle,
+            axis=axis,
+            origin=origin,
+        )
+
+    def _with_aligned_conformers(self, reference_id, atom_ids):
+        """
+        Modify the ensemble.
+
+        """
+
+        atom_ids = self._normalize_atom_ids(atom_ids)
+        coords = self._position_matrices[:, atom_ids]
+        centroids = coords.mean(axis=1, keepdims=True)
+        coords = coords - centroids
+        reference = coords[reference_id]
+        reference_centroid = centroids[reference_id]
+        rotation_matrices = _get_kabsch_rotation_matrices(
+            coords=coords,
+            reference=reference,
+        )
+        self._position_matrices = (
+            (self._position_matrices - centroids)
+            @ rotation_matrices.transpose(0, 2, 1)
+            + reference_centroid
+        )
+        return self
+
+    def with_aligned_conformers(self, reference_id=0, atom_ids=None):
+        """
+        Return a clone with the conformers superimposed.
+
+        Every conformer is optimally superimposed on a reference
+        conformer, using the Kabsch algorithm.
+
+        Parameters
+        ----------
+        reference_id : :class:`int`, optional
+            The id of the reference conformer.
+
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The ids of atoms which are used to superimpose the
+            conformers. Can be a single :class:`int`, if a single
+            atom is to be used, or ``None``, if all atoms are to be
+            used.
+
+        Returns
+        -------
+        :class:`.ConformerEnsemble`
+            A clone with the conformers superimposed.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        return self.clone()._with_aligned_conformers(
+            reference_id=reference_id,
+            atom_ids=atom_ids,
+        )
+
+    def _normalize_atom_ids(self, atom_ids):
+        """
+        Get `atom_ids` as a :class:`list`.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`
+            Some atom ids. Can be a single :class:`int` or ``None``,
+            if all atoms are to be used.
+
+        Returns
+        -------
+        :class:`list`
+            The atom ids.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `atom_ids` has a length of ``0``.
+
+        """
+
+        if atom_ids is None:
+            atom_ids = range(self._position_matrices.shape[1])
+        elif isinstance(atom_ids, int):
+            atom_ids = (atom_ids, )
+
+        atom_ids = list(atom_ids)
+        if len(atom_ids) == 0:
+            raise ValueError('atom_ids was of length 0.')
+        return atom_ids
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}({self._molecule!r}, '
+            f'num_conformers={len(self._position_matrices)})'
+        )
+
+
+def _get_kabsch_rotation_matrices(coords, reference):
+    """
+    Get the rotations which superimpose `coords` on `reference`.
+
+    Parameters
+    ----------
+    coords : :class:`numpy.ndarray`
+        A ``(k, n, 3)`` array holding ``k`` sets of centered
+        coordinates.
+
+    reference : :class:`numpy.ndarray`
+        A ``(n, 3)`` array of centered coordinates.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        A ``(k, 3, 3)`` array. Applying rotation matrix ``i`` to the
+        coordinates in set ``i`` minimizes their RMSD to `reference`.
+
+    References
+    ----------
+    https://en.wikipedia.org/wiki/Kabsch_algorithm
+
+    """
+
+    covariances = coords.transpose(0, 2, 1) @ reference
+    u, _, vt = np.linalg.svd(covariances)
+    v = vt.transpose(0, 2, 1)
+    ut = u.transpose(0, 2, 1)
+    # Flip the last axis where needed, to prevent reflections.
+    correction = np.ones((len(coords), 1, 3))
+    correction[np.linalg.det(v @ ut) < 0, 0, 2] = -1
+    return (v * correction) @ ut
@@ -5,12 +5,17 @@ Constructed Molecule
 """
 
 import logging
-import rdkit.Chem.AllChem as rdkit
+import numpy as np
 
 from .molecule import Molecule
 from ..atoms import AtomInfo
 from ..bonds import BondInfo
-from .utilities import get_bond_info_atom_ids, sort_bond_atoms_by_id
+from .utilities import (
+    sort_bond_atoms_by_id,
+    get_bond_atom_id_matrix,
+    get_sorted_bond_indices,
+    LazyComponent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +64,15 @@ class ConstructedMolecule(Molecule):
 
     """
 
+    # Only used by constructed molecules created with
+    # _init_lazily(). All other constructed molecules set these
+    # attributes directly.
+    _atoms = LazyComponent()
+    _bonds = LazyComponent()
+    _atom_infos = LazyComponent()
+    _bond_infos = LazyComponent()
+    _num_building_blocks = LazyComponent()
+
     def __init__(self, topology_graph):
         """
         Initialize a :class:`.ConstructedMolecule`.
@@ -83,6 +97,12 @@ class ConstructedMolecule(Molecule):
                 topology_graph.get_num_building_block(building_block)
             for building_block in topology_graph.get_building_blocks()
         }
+        # Used by key makers, which identify the molecule by how it
+        # was constructed.
+        self._topology_graph_repr = repr(topology_graph)
+        self._vertex_building_blocks = (
+            topology_graph._get_vertex_building_blocks()
+        )
 
     @classmethod
     def init(
@@ -125,11 +145,103 @@ class ConstructedMolecule(Molecule):
 
         """
 
+        return cls._init_from_components(
+            atoms=atoms,
+            bonds=bonds,
+            position_matrix=np.array(position_matrix.T, dtype=np.float64),
+            atom_infos=atom_infos,
+            bond_infos=bond_infos,
+            num_building_blocks=num_building_blocks,
+        )
+
+    @classmethod
+    def _init_from_components(
+        cls,
+        atoms,
+        bonds,
+        position_matrix,
+        atom_infos,
+        bond_infos,
+        num_building_blocks,
+    ):
+        """
+        Initialize, without copying `position_matrix`.
+
+        Parameters
+        ----------
+        atoms : :class:`tuple` of :class:`.Atom`
+            The atoms of the molecule.
+
+        bond : :class:`tuple` of :class:`.Bond`
+            The bonds of the molecule.
+
+        position_matrix : :class:`numpy.ndarray`
+            A ``(3, n)`` position matrix of the molecule, see
+            :meth:`.Molecule._init`.
+
+        atom_infos : :class:`tuple` of :class:`.AtomInfo`
+            The atom infos of the molecule.
+
+        bond_infos : :class:`tuple` of :class:`.BondInfo`
+            The bond infos of the molecule.
+
+        num_building_blocks : :class:`dict`
+            Maps each building block of the constructed molecule to
+            the number of times it is present in it.
+
+        Returns
+        -------
+        :class:`.ConstructedMolecule`
+            The constructed molecule.
+
+        """
+
         molecule = cls.__new__(cls)
-        Molecule.__init__(molecule, atoms, bonds, position_matrix)
+        Molecule._init(molecule, atoms, bonds, position_matrix)
         molecule._atom_infos = atom_infos
         molecule._bond_infos = bond_infos
         molecule._num_building_blocks = dict(num_building_blocks)
+        molecule._topology_graph_repr = None
+        molecule._vertex_building_blocks = None
+        return molecule
+
+    @classmethod
+    def _init_lazily(cls, position_matrix, components):
+        """
+        Initialize a constructed molecule, which loads its components.
+
+        Parameters
+        ----------
+        position_matrix : :class:`numpy.ndarray`
+            A ``(3, n)`` position matrix of the molecule, see
+            :meth:`.Molecule._init`.
+
+        components : :class:`object`
+            Loads the components of the molecule, the first time they
+            are needed. It must have the methods ``get_atoms()``,
+            ``get_bonds()``, ``get_atom_infos()``, ``get_bond_infos()``
+            and ``get_num_building_blocks()``, which take no
+            arguments and return the values of the matching parameters
+            of :meth:`init`, with ``get_num_building_blocks()``
+            returning a :class:`dict`. The atoms returned by
+            ``get_atoms()`` must be the ones held by the bonds and
+            atom infos, and the bonds returned by ``get_bonds()``
+            must be the ones held by the bond infos.
+
+        Returns
+        -------
+        :class:`.ConstructedMolecule`
+            The constructed molecule.
+
+        """
+
+        molecule = cls.__new__(cls)
+        molecule._components = components
+        molecule._position_matrix = position_matrix
+        molecule._graph_cache = {}
+        molecule._geometry_cache = {}
+        molecule._topology_graph_repr = None
+        molecule._vertex_building_blocks = None
         return molecule
 
     def clone(self):
@@ -137,6 +249,8 @@ class ConstructedMolecule(Molecule):
         clone._atom_infos = self._atom_infos
         clone._bond_infos = self._bond_infos
         clone._num_building_blocks = dict(self._num_building_blocks)
+        clone._topology_graph_repr = self._topology_graph_repr
+        clone._vertex_building_blocks = self._vertex_building_blocks
         return clone
 
     def get_building_blocks(self):
@@ -218,25 +332,30 @@ class ConstructedMolecule(Molecule):
         yield from self._bond_infos
 
     def _with_canonical_atom_ordering(self):
-        ordering = rdkit.CanonicalRankAtoms(self.to_rdkit_mol())
-        id_map = {
-            new_id: atom.get_id()
-            for new_id, atom in zip(ordering, self._atoms)
-        }
+        ordering = self._get_canonical_ordering()
+        # Maps the new id of each atom to its old id.
+        old_ids = np.argsort(ordering).tolist()
+        bond_info_atom_ids = ordering[get_bond_atom_id_matrix(
+            bonds=(info.get_bond() for info in self._bond_infos),
+        )]
         super()._with_canonical_atom_ordering()
         atom_map = {
             old_id: self._atoms[new_id]
-            for old_id, new_id in enumerate(ordering)
+            for old_id, new_id in enumerate(ordering.tolist())
         }
         old_atom_infos = self._atom_infos
-
-        def get_atom_info(atom):
-            info = old_atom_infos[id_map[atom.get_id()]]
-            return AtomInfo(
+        self._atom_infos = tuple(
+            AtomInfo(
                 atom=atom,
-                building_block=info.get_building_block(),
-                building_block_id=info.get_building_block_id(),
+                building_block=(
+                    old_atom_infos[old_id].get_building_block()
+                ),
+                building_block_id=(
+                    old_atom_infos[old_id].get_building_block_id()
+                ),
             )
+            for atom, old_id in zip(self._atoms, old_ids)
+        )
 
         def get_bond_info(info):
             return BondInfo(
@@ -247,9 +366,11 @@ class ConstructedMolecule(Molecule):
                 building_block_id=info.get_building_block_id(),
             )
 
-        self._atom_infos = tuple(map(get_atom_info, self._atoms))
-        self._bond_infos = tuple(sorted(
-            map(get_bond_info, self._bond_infos),
-            key=get_bond_info_atom_ids,
-        ))
+        old_bond_infos = self._bond_infos
+        self._bond_infos = tuple(
+            get_bond_info(old_bond_infos[bond_index])
+            for bond_index in get_sorted_bond_indices(
+                bond_atom_ids=bond_info_atom_ids,
+            ).tolist()
+        )
         return self
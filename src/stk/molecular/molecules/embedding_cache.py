@@ -0,0 +1,327 @@
+"""
+Embedding Cache
+===============
+
+"""
+
+import os
+import hashlib
+import tempfile
+import rdkit.Chem.AllChem as rdkit
+from rdkit import __version__ as rdkit_version
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Stores the embedded structures of building blocks on disk.
+
+    Entries are keyed by the canonical SMILES of a molecule, the
+    embedding parameters, the random seed and the :mod:`rdkit`
+    version. Each entry holds the position matrix of a molecule in
+    canonical atom order, in the ``.npy`` format, so that molecules
+    created from any equivalent SMILES can use it.
+
+    Once the cache grows beyond its maximum size, the least recently
+    used entries are removed, until it is at most three quarters
+    full.
+
+    Examples
+    --------
+    *Reusing Embeddings Between Runs*
+
+    Building blocks created with the same cache will only be embedded
+    once, even across different Python sessions
+
+    .. code-block:: python
+
+        import stk
+
+        cache = stk.EmbeddingCache('embeddings')
+        building_block = stk.BuildingBlock(
+            smiles='NCCN',
+            functional_groups=[stk.PrimaryAminoFactory()],
+            embedding_cache=cache,
+        )
+
+    """
+
+    # Identifies the embedding parameters used by BuildingBlock.
+    _embedding_parameters = 'ETKDGv2'
+
+    def __init__(self, directory, max_size=2**30):
+        """
+        Initialize an :class:`.EmbeddingCache` instance.
+
+        Parameters
+        ----------
+        directory : :class:`str`
+            The directory in which the entries are stored. It is
+            created if it does not exist.
+
+        max_size : :class:`int`, optional
+            The maximum number of bytes the entries can take up.
+
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_size = max_size
+
+    def get_num_entries(self):
+        """
+        Get the number of entries in the cache.
+
+        Returns
+        -------
+        :class:`int`
+            The number of entries.
+
+        """
+
+        return len(self._get_entries())
+
+    def get_size(self):
+        """
+        Get the number of bytes taken up by the entries.
+
+        The directory is scanned on every call, so that entries
+        added or removed by other processes are counted.
+
+        Returns
+        -------
+        :class:`int`
+            The size of the cache.
+
+        """
+
+        return sum(stat.st_size for stat, _ in self._get_entries())
+
+    def clear(self):
+        """
+        Remove every entry.
+
+        Returns
+        -------
+        :class:`.EmbeddingCache`
+            The cache.
+
+        """
+
+        for _, path in self._get_entries():
+            _remove(path)
+        return self
+
+    def _get_position_matrix(self, molecule, random_seed):
+        """
+        Get the cached position matrix of a molecule.
+
+        Parameters
+        ----------
+        molecule : :class:`rdkit.Mol`
+            The molecule, with explicit hydrogen atoms.
+
+        random_seed : :class:`int`
+            The random seed used for embedding.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The position matrix of `molecule`, or ``None`` if
+            the cache holds no entry for it.
+
+        """
+
+        path = self._get_path(molecule, random_seed)
+        try:
+            canonical_position_matrix = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        if len(canonical_position_matrix) != molecule.GetNumAtoms():
+            return None
+
+        # Mark the entry as recently used.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Removed by another process after it was loaded.
+            return None
+        return canonical_position_matrix[_get_ranks(molecule)]
+
+    def _add(self, molecule, random_seed):
+        """
+        Add the position matrix of an embedded molecule.
+
+        Parameters
+        ----------
+        molecule : :class:`rdkit.Mol`
+            The embedded molecule, with explicit hydrogen atoms.
+
+        random_seed : :class:`int`
+            The random seed used for embedding.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        canonical_position_matrix = np.empty(
+            shape=(molecule.GetNumAtoms(), 3),
+        )
+        canonical_position_matrix[_get_ranks(molecule)] = (
+            molecule.GetConformer().GetPositions()
+        )
+
+        # Write into a temporary file first, so that other processes
+        # using the same directory never see a partial entry.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory,
+            suffix='.tmp',
+        )
+        with os.fdopen(file_descriptor, 'wb') as f:
+            np.save(f, canonical_position_matrix)
+        os.replace(
+            temporary_path,
+            self._get_path(molecule, random_seed),
+        )
+
+        # The directory is scanned again, rather than keeping a
+        # running total, because other processes may share it.
+        entries = self._get_entries()
+        if sum(stat.st_size for stat, _ in entries) > self._max_size:
+            self._evict(entries)
+
+    def _evict(self, entries):
+        """
+        Remove the least recently used entries.
+
+        Parameters
+        ----------
+        entries : :class:`list` of :class:`tuple`
+            The entries in the cache, as returned by
+            :meth:`_get_entries`.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        entries = sorted(entries, key=lambda entry: entry[0].st_mtime)
+        size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if size <= 3*self._max_size // 4:
+                break
+            _remove(path)
+            size -= stat.st_size
+
+    def _get_entries(self):
+        """
+        Get the entries in the cache.
+
+        Entries removed by another process while the directory is
+        being scanned are skipped.
+
+        Returns
+        -------
+        :class:`list` of :class:`tuple`
+            For each entry, its :class:`os.stat_result` and its
+            path.
+
+        """
+
+        entries = []
+        with os.scandir(self._directory) as directory:
+            for entry in directory:
+                if not entry.name.endswith('.npy'):
+                    continue
+                try:
+                    entries.append((entry.stat(), entry.path))
+                except FileNotFoundError:
+                    pass
+        return entries
+
+    def _get_path(self, molecule, random_seed):
+        """
+        Get the path of the entry of a molecule.
+
+        Parameters
+        ----------
+        molecule : :class:`rdkit.Mol`
+            The molecule, with explicit hydrogen atoms.
+
+        random_seed : :class:`int`
+            The random seed used for embedding.
+
+        Returns
+        -------
+        :class:`str`
+            The path of the entry.
+
+        """
+
+        key = '\n'.join((
+            rdkit.MolToSmiles(molecule),
+            self._embedding_parameters,
+            str(random_seed),
+            rdkit_version,
+        ))
+        return os.path.join(
+            self._directory,
+            f'{hashlib.sha256(key.encode()).hexdigest()}.npy',
+        )
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}({self._directory!r}, '
+            f'max_size={self._max_size})'
+        )
+
+
+def _remove(path):
+    """
+    Remove a file, unless another process already removed it.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path of the file.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _get_ranks(molecule):
+    """
+    Get the canonical rank of every atom in a molecule.
+
+    Parameters
+    ----------
+    molecule : :class:`rdkit.Mol`
+        The molecule.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The canonical rank of every atom. Ties are broken, so
+        that equivalent molecules have atoms with matching ranks.
+
+    """
+
+    return np.array(
+        list(rdkit.CanonicalRankAtoms(molecule)),
+        dtype=np.int64,
+    )
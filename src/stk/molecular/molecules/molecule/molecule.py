@@ -11,17 +11,27 @@ Molecule
 """
 
 import os
+import tempfile
+import itertools as it
 import numpy as np
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import euclidean
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 import rdkit.Chem.AllChem as rdkit
 
 from stk.utilities import (
     vector_angle,
     rotation_matrix,
     rotation_matrix_arbitrary_axis,
+    set_conformer_positions,
 )
 from .utilities import writers, updaters
-from ..utilities import sort_bond_atoms_by_id, get_bond_atom_ids
+from ..utilities import (
+    sort_bond_atoms_by_id,
+    get_bond_atom_id_matrix,
+    get_sorted_bond_indices,
+)
 
 
 class Molecule:
@@ -57,24 +67,67 @@ class Molecule:
 
         """
 
-        self._atoms = atoms
-        self._bonds = bonds
         # Take the transpose because it will make some matrix
         # multiplications faster.
-        self._position_matrix = np.array(
-            position_matrix.T,
-            dtype=np.float64,
+        self._init(
+            atoms=atoms,
+            bonds=bonds,
+            position_matrix=np.array(position_matrix.T, dtype=np.float64),
         )
 
+    def _init(self, atoms, bonds, position_matrix):
+        """
+        Initialize the molecule, without copying `position_matrix`.
+
+        Parameters
+        ----------
+        atoms : :class:`tuple` of :class:`.Atom`
+            The atoms which compose the molecule.
+
+        bonds : :class:`tuple` of :class:`.Bond`
+            The bonds of the molecule.
+
+        position_matrix : :class:`numpy.ndarray`
+            A ``(3, n)`` matrix of ``float64`` values, holding the
+            position of every atom in the molecule. It is used
+            directly, so it can be a view of a buffer, and it must
+            not be modified afterwards.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._atoms = atoms
+        self._bonds = bonds
+        self._position_matrix = position_matrix
+        # Holds data which depends only on the atoms and bonds of the
+        # molecule, such as its rdkit graph. Clones with the same
+        # atoms and bonds share this dict, so the data only needs to
+        # be calculated once.
+        self._graph_cache = {}
+        # Holds data which depends on the atomic positions, such as
+        # a spatial index. Any change to the positions must replace
+        # this dict, rather than modify it, because it is shared with
+        # clones. The new dict is made by
+        # _get_displaced_geometry_cache and
+        # _get_rotated_geometry_cache after a rigid motion.
+        self._geometry_cache = {}
+
     def _with_displacement(self, displacement):
         """
         Modify molecule.
 
         """
 
-        self._position_matrix = (
-            self._position_matrix.T + displacement
-        ).T
+        self._position_matrix = _apply(
+            function=lambda positions: (positions.T + displacement).T,
+            position_matrix=self._position_matrix,
+        )
+        self._geometry_cache = self._get_displaced_geometry_cache(
+            displacement=displacement,
+        )
         return self
 
     def with_displacement(self, displacement):
@@ -108,7 +161,13 @@ class Molecule:
 
         # Apply the rotation matrix on the position matrix, to get the
         # new position matrix.
-        self._position_matrix = rot_mat @ self._position_matrix
+        self._position_matrix = _apply(
+            function=lambda positions: rot_mat @ positions,
+            position_matrix=self._position_matrix,
+        )
+        self._geometry_cache = self._get_rotated_geometry_cache(
+            rotation_matrix=rot_mat,
+        )
 
         # Return the centroid of the molecule to the original position.
         self._with_displacement(origin)
@@ -159,7 +218,13 @@ class Molecule:
 
         # Apply the rotation matrix to the atomic positions to yield
         # the new atomic positions.
-        self._position_matrix = rot_mat @ self._position_matrix
+        self._position_matrix = _apply(
+            function=lambda positions: rot_mat @ positions,
+            position_matrix=self._position_matrix,
+        )
+        self._geometry_cache = self._get_rotated_geometry_cache(
+            rotation_matrix=rot_mat,
+        )
 
         # Restore original position.
         self._with_displacement(origin)
@@ -305,7 +370,13 @@ class Molecule:
             angle = 2*np.pi - angle
 
         rotation_matrix = rotation_matrix_arbitrary_axis(angle, axis)
-        self._position_matrix = rotation_matrix @ self._position_matrix
+        self._position_matrix = _apply(
+            function=lambda positions: rotation_matrix @ positions,
+            position_matrix=self._position_matrix,
+        )
+        self._geometry_cache = self._get_rotated_geometry_cache(
+            rotation_matrix=rotation_matrix,
+        )
         self._with_displacement(origin)
         return self
 
@@ -375,12 +446,11 @@ class Molecule:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        Molecule.__init__(
-            self=clone,
-            atoms=self._atoms,
-            bonds=self._bonds,
-            position_matrix=self._position_matrix.T,
-        )
+        clone._atoms = self._atoms
+        clone._bonds = self._bonds
+        clone._position_matrix = _apply(np.array, self._position_matrix)
+        clone._graph_cache = self._graph_cache
+        clone._geometry_cache = self._geometry_cache
         return clone
 
     def get_atomic_positions(self, atom_ids=None):
@@ -479,6 +549,108 @@ class Molecule:
 
         return len(self._bonds)
 
+    def get_adjacency_matrix(self):
+        """
+        Get the adjacency matrix of the molecule.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            A symmetric ``(n, n)`` matrix, where ``n`` is the number
+            of atoms. An element is non-zero if the atoms, whose ids
+            match its row and column, are bonded. The column indices
+            of each row are sorted.
+
+        """
+
+        return self._get_adjacency_matrix().copy()
+
+    def get_neighbor_ids(self, atom_id):
+        """
+        Yield the ids of atoms bonded to an atom.
+
+        Parameters
+        ----------
+        atom_id : :class:`int`
+            The id of the atom whose neighbors are desired.
+
+        Yields
+        ------
+        :class:`int`
+            The id of an atom bonded to the atom with `atom_id`. Ids
+            are yielded in ascending order.
+
+        """
+
+        adjacency = self._get_adjacency_matrix()
+        start, end = adjacency.indptr[atom_id:atom_id+2]
+        yield from adjacency.indices[start:end].tolist()
+
+    def get_atom_ids_within_bonds(self, atom_ids, num_bonds):
+        """
+        Yield the ids of atoms within `num_bonds` bonds of `atom_ids`.
+
+        Parameters
+        ----------
+        atom_ids : :class:`iterable` of :class:`int`
+            The ids of the atoms from which the bonds are counted.
+            Can be a single :class:`int`.
+
+        num_bonds : :class:`int`
+            The maximum number of bonds between a yielded atom and
+            the nearest atom in `atom_ids`.
+
+        Yields
+        ------
+        :class:`int`
+            The id of an atom within `num_bonds` bonds of an atom in
+            `atom_ids`, including the atoms in `atom_ids`. Ids are
+            yielded in ascending order.
+
+        """
+
+        if isinstance(atom_ids, int):
+            atom_ids = (atom_ids, )
+
+        adjacency = self._get_adjacency_matrix()
+        reached = np.zeros(len(self._atoms), dtype=bool)
+        reached[list(atom_ids)] = True
+        for _ in range(num_bonds):
+            expanded = reached | (adjacency @ reached != 0)
+            if np.array_equal(expanded, reached):
+                break
+            reached = expanded
+
+        yield from np.flatnonzero(reached).tolist()
+
+    def get_connected_components(self):
+        """
+        Yield the groups of atoms connected by bonds.
+
+        Yields
+        ------
+        :class:`tuple` of :class:`int`
+            The ids of atoms in a connected component, in ascending
+            order. Components are yielded in order of their smallest
+            atom id.
+
+        """
+
+        labels = self._graph_cache.get('connected_components')
+        if labels is None:
+            _, labels = connected_components(
+                csgraph=self._get_adjacency_matrix(),
+                directed=False,
+            )
+            self._graph_cache['connected_components'] = labels
+
+        # Atoms sorted by component, where components appear in the
+        # order of their first atom.
+        atom_ids = np.argsort(labels, kind='stable')
+        _, starts = np.unique(labels[atom_ids], return_index=True)
+        for component in np.split(atom_ids, starts[1:]):
+            yield tuple(component.tolist())
+
     def get_centroid(self, atom_ids=None):
         """
         Return the centroid.
@@ -514,7 +686,13 @@ class Molecule:
             raise ValueError('atom_ids was of length 0.')
 
         return np.divide(
-            self._position_matrix[:, atom_ids].sum(axis=1),
+            sum(
+                positions.sum(axis=1)
+                for positions in _get_chunks(
+                    position_matrix=self._position_matrix,
+                    atom_ids=atom_ids,
+                )
+            ),
             len(atom_ids)
         )
 
@@ -591,8 +769,14 @@ class Molecule:
         if len(atom_ids) == 0:
             raise ValueError('atom_ids was of length 0.')
 
-        coords = self._position_matrix[:, atom_ids]
-        return float(euclidean(coords.min(axis=1), coords.max(axis=1)))
+        chunks = tuple(
+            (positions.min(axis=1), positions.max(axis=1))
+            for positions in _get_chunks(self._position_matrix, atom_ids)
+        )
+        return float(euclidean(
+            np.min([minimum for minimum, _ in chunks], axis=0),
+            np.max([maximum for _, maximum in chunks], axis=0),
+        ))
 
     def get_plane_normal(self, atom_ids=None):
         """
@@ -646,6 +830,231 @@ class Molecule:
 
         return np.array(self._position_matrix.T)
 
+    def get_atom_ids_within(self, position, radius, cell=None):
+        """
+        Yield the ids of atoms within `radius` of `position`.
+
+        Parameters
+        ----------
+        position : :class:`numpy.ndarray`
+            The position around which atoms are found.
+
+        radius : :class:`float`
+            The maximum distance of an atom from `position`.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the distance to the nearest periodic image of each atom
+            is used. `radius` must not be larger than the width of
+            the cell.
+
+        Yields
+        ------
+        :class:`int`
+            The id of an atom within `radius` of `position`. Ids are
+            yielded in ascending order.
+
+        """
+
+        tree = self._get_kd_tree(cell)
+        positions = _get_query_positions(position, cell)
+        atom_ids = set()
+        for ids in tree.query_ball_point(positions, radius):
+            atom_ids.update(ids)
+        yield from sorted(atom_ids)
+
+    def get_nearest_atom_ids(self, position, num_atoms=1, cell=None):
+        """
+        Yield the ids of the atoms nearest to `position`.
+
+        Parameters
+        ----------
+        position : :class:`numpy.ndarray`
+            The position for which the nearest atoms are found.
+
+        num_atoms : :class:`int`, optional
+            The number of atom ids to yield.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the distance to the nearest periodic image of each atom
+            is used.
+
+        Yields
+        ------
+        :class:`int`
+            The id of an atom. Ids are yielded in order of increasing
+            distance from `position`.
+
+        """
+
+        num_atoms = min(num_atoms, len(self._atoms))
+        if num_atoms < 1:
+            return
+
+        tree = self._get_kd_tree(cell)
+        positions = _get_query_positions(position, cell)
+        distances, atom_ids = tree.query(positions, k=num_atoms)
+        distances = distances.reshape(-1)
+        atom_ids = atom_ids.reshape(-1)
+        # Keep only the nearest image of each atom.
+        order = np.lexsort((distances, atom_ids))
+        atom_ids, first = np.unique(atom_ids[order], return_index=True)
+        distances = distances[order][first]
+        nearest = atom_ids[np.argsort(distances, kind='stable')]
+        yield from nearest[:num_atoms].tolist()
+
+    def get_atom_pairs_within(self, distance, cell=None):
+        """
+        Yield pairs of atoms within `distance` of each other.
+
+        Parameters
+        ----------
+        distance : :class:`float`
+            The maximum distance between the atoms of a pair.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the distance between the nearest periodic images of
+            atoms is used. `distance` must not be larger than the
+            width of the cell.
+
+        Yields
+        ------
+        :class:`tuple` of :class:`int`
+            The ids of two atoms within `distance` of each other. The
+            smaller id is always first and pairs are yielded in
+            ascending order.
+
+        """
+
+        pairs = self._get_atom_pairs_within(distance, cell)
+        for atom1_id, atom2_id in pairs.tolist():
+            yield atom1_id, atom2_id
+
+    def _get_atom_pairs_within(self, distance, cell=None):
+        """
+        Get the pairs of atoms within `distance` of each other.
+
+        Parameters
+        ----------
+        distance : :class:`float`
+            The maximum distance between the atoms of a pair.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the distance between the nearest periodic images of
+            atoms is used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A ``(n, 2)`` array holding the ids of two atoms in each
+            row. The smaller id is always first and the rows are
+            sorted in ascending order.
+
+        """
+
+        tree = self._get_kd_tree(cell)
+        pairs = tree.query_pairs(distance, output_type='ndarray')
+        if cell is None:
+            # The pairs are unique and the smaller id is already
+            # first, they only need to be sorted.
+            pairs = pairs.reshape(-1, 2).astype(np.int64, copy=False)
+            return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+        image_pairs = tree.sparse_distance_matrix(
+            other=self._get_image_kd_tree(cell),
+            max_distance=distance,
+            output_type='ndarray',
+        )
+        pairs = np.concatenate((
+            pairs.reshape(-1, 2),
+            np.stack(
+                arrays=(
+                    image_pairs['i'],
+                    # Map the images back to the atoms they belong
+                    # to, see _get_image_kd_tree().
+                    image_pairs['j'] % len(self._atoms),
+                ),
+                axis=1,
+            ),
+        ))
+        pairs = np.sort(pairs, axis=1)
+        # An atom is never paired with its own image.
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        return np.unique(pairs, axis=0).astype(np.int64, copy=False)
+
+    def _get_kd_tree(self, cell=None):
+        """
+        Get a spatial index of the atomic positions.
+
+        The index is created once and reused until the atomic
+        positions change.
+
+        Parameters
+        ----------
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the atomic positions are wrapped into the cell before
+            being indexed.
+
+        Returns
+        -------
+        :class:`scipy.spatial.cKDTree`
+            A k-d tree holding the position of every atom.
+
+        """
+
+        if cell is None:
+            key = 'kd_tree'
+        else:
+            cell = np.array(cell, dtype=np.float64)
+            key = ('kd_tree', cell.tobytes())
+
+        tree = self._geometry_cache.get(key)
+        if tree is None:
+            positions = self._position_matrix.T
+            if cell is not None:
+                positions = _wrap_positions(positions, cell)
+            tree = self._geometry_cache[key] = cKDTree(positions)
+        return tree
+
+    def _get_image_kd_tree(self, cell):
+        """
+        Get a spatial index of the neighboring periodic images.
+
+        The index is created once and reused until the atomic
+        positions change.
+
+        Parameters
+        ----------
+        cell : :class:`tuple` of :class:`numpy.ndarray`
+            The a, b and c vectors of a periodic cell.
+
+        Returns
+        -------
+        :class:`scipy.spatial.cKDTree`
+            A k-d tree holding the wrapped position of every atom in
+            each of the 26 neighbors of the cell. The images of the
+            atoms in one neighbor follow those in the previous one,
+            so that point ``i`` is an image of atom
+            ``i % num_atoms``.
+
+        """
+
+        cell = np.array(cell, dtype=np.float64)
+        key = ('image_kd_tree', cell.tobytes())
+        tree = self._geometry_cache.get(key)
+        if tree is None:
+            positions = self._get_kd_tree(cell).data
+            tree = self._geometry_cache[key] = cKDTree(np.concatenate([
+                positions + shift
+                for shift in _get_image_shifts(cell)
+                if shift.any()
+            ]))
+        return tree
+
     def _with_centroid(self, position, atom_ids):
         centroid = self.get_centroid(atom_ids=atom_ids)
         self._with_displacement(position-centroid)
@@ -683,7 +1092,16 @@ class Molecule:
 
         """
 
-        self._position_matrix = np.array(position_matrix.T)
+        if isinstance(self._position_matrix, np.memmap):
+            memory_map = _get_memory_map(
+                directory=os.path.dirname(self._position_matrix.filename),
+                shape=self._position_matrix.shape,
+            )
+            memory_map[:] = position_matrix.T
+            self._position_matrix = memory_map
+        else:
+            self._position_matrix = np.array(position_matrix.T)
+        self._geometry_cache = {}
         return self
 
     def with_position_matrix(self, position_matrix):
@@ -704,6 +1122,77 @@ class Molecule:
         """
         return self.clone()._with_position_matrix(position_matrix)
 
+    def _with_memory_mapped_positions(self, directory):
+        """
+        Modify molecule.
+
+        """
+
+        position_matrix = self._position_matrix
+        self._position_matrix = _get_memory_map(
+            directory=directory,
+            shape=position_matrix.shape,
+        )
+        start = 0
+        for positions in _get_chunks(position_matrix):
+            end = start + positions.shape[1]
+            self._position_matrix[:, start:end] = positions
+            start = end
+        return self
+
+    def with_memory_mapped_positions(self, directory=None):
+        """
+        Return a clone with its positions held in a file.
+
+        The position matrix of the clone is a :class:`numpy.memmap`,
+        backed by a temporary file, so that it does not have to be
+        held in memory. Displacements, rotations and the calculation
+        of centroids and maximum diameters are done on chunks of
+        atoms, and create new temporary files, in the same directory,
+        for the results. Writing the molecule to an ``.xyz``,
+        ``.mol`` or ``.sdf`` file also happens in chunks. Temporary
+        files are deleted once they are no longer used.
+
+        Note that other methods, such as
+        :meth:`get_position_matrix`, load all positions into memory.
+
+        Parameters
+        ----------
+        directory : :class:`str`, optional
+            The directory in which temporary files are created. If
+            ``None``, the default temporary directory is used.
+
+        Returns
+        -------
+        :class:`.Molecule`
+            The clone. Has the same type as the original molecule.
+
+        Examples
+        --------
+        *Writing a Very Large Molecule*
+
+        .. code-block:: python
+
+            import stk
+
+            cof = stk.ConstructedMolecule(
+                topology_graph=stk.cof.Honeycomb(
+                    building_blocks=(
+                        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                        stk.BuildingBlock(
+                            smiles='Brc1cc(Br)cc(Br)c1',
+                            functional_groups=[stk.BromoFactory()],
+                        ),
+                    ),
+                    lattice_size=(100, 100, 1),
+                ),
+            ).with_memory_mapped_positions('/scratch')
+            cof.with_centroid((0., 0., 0.)).write('cof.mol')
+
+        """
+
+        return self.clone()._with_memory_mapped_positions(directory)
+
     def to_rdkit_mol(self):
         """
         Return an :mod:`rdkit` representation.
@@ -715,10 +1204,153 @@ class Molecule:
 
         """
 
+        # Copying the cached graph is much cheaper than building
+        # a new one and gives the caller a molecule they can modify.
+        molecule = rdkit.Mol(self._get_rdkit_graph())
+        conformer = set_conformer_positions(
+            conformer=rdkit.Conformer(len(self._atoms)),
+            position_matrix=self._position_matrix.T,
+        )
+        molecule.AddConformer(conformer)
+        return molecule
+
+    def _get_rdkit_graph(self):
+        """
+        Get the cached :mod:`rdkit` graph of the molecule.
+
+        The returned molecule has no conformer and must not be
+        modified, as it is shared between clones.
+
+        Returns
+        -------
+        :class:`rdkit.Mol`
+            The molecular graph in :mod:`rdkit` format.
+
+        """
+
+        graph = self._graph_cache.get('rdkit')
+        if graph is None:
+            graph = self._graph_cache['rdkit'] = (
+                self._make_rdkit_graph()
+            )
+        return graph
+
+    def _get_sanitized_rdkit_graph(self):
+        """
+        Get the cached, sanitized :mod:`rdkit` graph of the molecule.
+
+        This graph is used for substructure matching, so that the
+        molecule only has to be sanitized once, no matter how many
+        queries are run on it. It has no conformer and must not be
+        modified, as it is shared between clones.
+
+        Returns
+        -------
+        :class:`rdkit.Mol`
+            The sanitized molecular graph in :mod:`rdkit` format.
+
+        """
+
+        graph = self._graph_cache.get('sanitized_rdkit')
+        if graph is None:
+            graph = rdkit.Mol(self._get_rdkit_graph())
+            rdkit.SanitizeMol(graph)
+            self._graph_cache['sanitized_rdkit'] = graph
+        return graph
+
+    def _get_key_cache(self):
+        """
+        Get the keys made for the molecule by key makers.
+
+        Keys are held in the geometry cache, because they can depend
+        on the atomic positions, for example through stereochemistry.
+        This means they are discarded whenever the positions change.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of a key to the key a
+            :class:`.MoleculeKeyMaker` made for the molecule.
+
+        """
+
+        return self._geometry_cache.setdefault('keys', {})
+
+    def _get_serialization_cache(self):
+        """
+        Get the data made for the molecule by serializers.
+
+        Like keys, the data is held in the geometry cache, which means
+        it is discarded whenever the atoms, bonds or positions change.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of each serialized form to the data.
+
+        """
+
+        return self._geometry_cache.setdefault('serialization', {})
+
+    def _get_displaced_geometry_cache(self, displacement):
+        """
+        Get the geometry cache to use after a displacement.
+
+        Subclasses can override this, to carry data which is cheap to
+        update over to the displaced molecule.
+
+        Parameters
+        ----------
+        displacement : :class:`numpy.ndarray`
+            The displacement applied to the molecule.
+
+        Returns
+        -------
+        :class:`dict`
+            The new geometry cache.
+
+        """
+
+        return {}
+
+    def _get_rotated_geometry_cache(self, rotation_matrix):
+        """
+        Get the geometry cache to use after a rotation.
+
+        Subclasses can override this, to carry data which is cheap to
+        update over to the rotated molecule.
+
+        Parameters
+        ----------
+        rotation_matrix : :class:`numpy.ndarray`
+            The rotation applied to the molecule, about the origin.
+
+        Returns
+        -------
+        :class:`dict`
+            The new geometry cache.
+
+        """
+
+        return {}
+
+    def _make_rdkit_graph(self):
+        """
+        Make an :mod:`rdkit` graph of the molecule.
+
+        Returns
+        -------
+        :class:`rdkit.Mol`
+            The molecular graph in :mod:`rdkit` format. It has no
+            conformer.
+
+        """
+
         mol = rdkit.EditableMol(rdkit.Mol())
         for atom in self._atoms:
             rdkit_atom = rdkit.Atom(atom.get_atomic_number())
             rdkit_atom.SetFormalCharge(atom.get_charge())
+            rdkit_atom.SetNoImplicit(True)
             mol.AddAtom(rdkit_atom)
 
         for bond in self._bonds:
@@ -731,13 +1363,7 @@ class Molecule:
                 ),
             )
 
-        mol = mol.GetMol()
-        rdkit_conf = rdkit.Conformer(len(self._atoms))
-        for atom_id, atom_coord in enumerate(self._position_matrix.T):
-            rdkit_conf.SetAtomPosition(atom_id, atom_coord)
-            mol.GetAtomWithIdx(atom_id).SetNoImplicit(True)
-        mol.AddConformer(rdkit_conf)
-        return mol
+        return mol.GetMol()
 
     def with_structure_from_file(self, path, extension=None):
         """
@@ -779,6 +1405,81 @@ class Molecule:
             '.coord': updaters._with_structure_from_turbomole,
         }[extension](self.clone(), path)
 
+    def get_position_matrices_from_file(self, path, extension=None):
+        """
+        Yield the position matrices held by a file.
+
+        Files which can hold multiple structures, such as ``.xyz``
+        trajectories, are read lazily, one structure at a time. Other
+        files yield a single position matrix. The supported file
+        types are the same as for :meth:`with_structure_from_file`.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path to a molecular structure file holding
+            coordinates for the :class:`.Molecule`.
+
+        extension : :class:`str`, optional
+            If you want to treat the file as though it has a
+            particular extension, put it here. Include the dot.
+
+        Yields
+        ------
+        :class:`numpy.ndarray`
+            A ``(n, 3)`` position matrix held by the file.
+
+        Raises
+        ------
+        :class:`RuntimeError`
+            If the number of atoms in a structure does not match the
+            number of atoms in the molecule or if atom elements in a
+            structure do not agree with the atom elements in the
+            molecule.
+
+        Examples
+        --------
+        *Loading an MD Trajectory*
+
+        .. code-block:: python
+
+            import stk
+
+            cage = stk.ConstructedMolecule(
+                topology_graph=stk.cage.FourPlusSix(
+                    building_blocks=(
+                        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                        stk.BuildingBlock(
+                            smiles='Brc1cc(Br)cc(Br)c1',
+                            functional_groups=[stk.BromoFactory()],
+                        ),
+                    ),
+                ),
+            )
+            for position_matrix in (
+                cage.get_position_matrices_from_file('trajectory.xyz')
+            ):
+                frame = cage.with_position_matrix(position_matrix)
+
+        To hold every frame in memory at once, use
+        :meth:`.ConformerEnsemble.init_from_file`.
+
+        """
+
+        if extension is None:
+            _, extension = os.path.splitext(path)
+
+        if extension == '.xyz':
+            yield from updaters._get_position_matrices_from_xyz(
+                self,
+                path,
+            )
+        else:
+            yield self.with_structure_from_file(
+                path=path,
+                extension=extension,
+            ).get_position_matrix()
+
     def with_canonical_atom_ordering(self):
         """
         Return a clone, with canonically ordered atoms.
@@ -798,33 +1499,124 @@ class Molecule:
 
         """
 
+        ordering = self._get_canonical_ordering()
+        # Maps the new id of each atom to its old id.
+        old_ids = np.argsort(ordering)
+
+        self._atoms = tuple(
+            self._atoms[old_id].with_id(new_id)
+            for new_id, old_id in enumerate(old_ids.tolist())
+        )
         atom_map = {
-            atom.get_id(): atom.with_id(new_id)
-            for new_id, atom in zip(
-                rdkit.CanonicalRankAtoms(self.to_rdkit_mol()),
-                self._atoms,
-            )
+            old_id: self._atoms[new_id]
+            for old_id, new_id in enumerate(ordering.tolist())
         }
-        self._atoms = tuple(sorted(
-            atom_map.values(),
-            key=lambda atom: atom.get_id()
-        ))
-        self._bonds = tuple(sorted(
-            (
-                sort_bond_atoms_by_id(bond.with_atoms(atom_map))
-                for bond in self._bonds
-            ),
-            key=get_bond_atom_ids,
-        ))
-        old_ids = {
-            atom.get_id(): old_id for old_id, atom in atom_map.items()
+        bond_indices = get_sorted_bond_indices(
+            bond_atom_ids=ordering[self._get_bond_atom_id_matrix()],
+        )
+        self._bonds = tuple(
+            sort_bond_atoms_by_id(
+                self._bonds[bond_index].with_atoms(atom_map)
+            )
+            for bond_index in bond_indices.tolist()
+        )
+        self._position_matrix = _apply(
+            function=lambda positions: positions,
+            position_matrix=self._position_matrix,
+            atom_ids=old_ids,
+        )
+        self._geometry_cache = {}
+        # The atoms and bonds have changed, so data shared with
+        # clones is no longer valid. However, the molecule is now
+        # canonically ordered, so its canonical ordering is known.
+        self._graph_cache = {
+            'canonical_ordering': np.arange(len(self._atoms)),
         }
-        self._position_matrix = np.array(np.array([
-            self._position_matrix.T[old_ids[new_id]]
-            for new_id in range(len(self._atoms))
-        ]).T)
         return self
 
+    def _get_canonical_ordering(self):
+        """
+        Get the canonical rank of every atom.
+
+        The ranking is calculated once and shared between clones.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Holds the canonical rank of every atom, indexed by atom
+            id.
+
+        """
+
+        ordering = self._graph_cache.get('canonical_ordering')
+        if ordering is None:
+            ordering = self._graph_cache['canonical_ordering'] = (
+                np.array(
+                    rdkit.CanonicalRankAtoms(
+                        rdkit.Mol(self._get_rdkit_graph()),
+                    ),
+                    dtype=np.int64,
+                )
+            )
+        return ordering
+
+    def _get_bond_atom_id_matrix(self):
+        """
+        Get a matrix holding the atom ids of every bond.
+
+        The matrix is calculated once and shared between clones.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A ``(m, 2)`` matrix of :class:`int`. Each row holds the
+            ids of the first and second atom of a bond.
+
+        """
+
+        bond_atom_ids = self._graph_cache.get('bond_atom_ids')
+        if bond_atom_ids is None:
+            bond_atom_ids = self._graph_cache['bond_atom_ids'] = (
+                get_bond_atom_id_matrix(self._bonds)
+            )
+        return bond_atom_ids
+
+    def _get_adjacency_matrix(self):
+        """
+        Get the adjacency matrix of the molecule.
+
+        The matrix is created once and shared between clones, so it
+        must not be modified.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            The adjacency matrix of the molecule.
+
+        """
+
+        adjacency = self._graph_cache.get('adjacency')
+        if adjacency is None:
+            bond_atom_ids = self._get_bond_atom_id_matrix()
+            num_atoms = len(self._atoms)
+            adjacency = csr_matrix(
+                (
+                    np.ones(2*len(bond_atom_ids), dtype=np.int64),
+                    (
+                        np.concatenate(
+                            (bond_atom_ids[:, 0], bond_atom_ids[:, 1]),
+                        ),
+                        np.concatenate(
+                            (bond_atom_ids[:, 1], bond_atom_ids[:, 0]),
+                        ),
+                    ),
+                ),
+                shape=(num_atoms, num_atoms),
+            )
+            adjacency.sum_duplicates()
+            adjacency = self._graph_cache['adjacency'] = adjacency
+        return adjacency
+
     def write(self, path, atom_ids=None):
         """
         Write the structure to a file.
@@ -864,6 +1656,19 @@ class Molecule:
         }[extension](self, path, atom_ids)
         return self
 
+    def __getstate__(self):
+        # The caches are not pickled, because they can be much larger
+        # than the molecule itself and are remade when needed.
+        state = dict(self.__dict__)
+        state.pop('_graph_cache', None)
+        state.pop('_geometry_cache', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._graph_cache = {}
+        self._geometry_cache = {}
+
     def __str__(self):
         return repr(self)
 
@@ -872,3 +1677,192 @@ class Molecule:
             f'{self.__class__.__name__}({self._atoms!r}, '
             f'{self._bonds!r}, {self._position_matrix!r})'
         )
+
+
+def _get_image_shifts(cell):
+    """
+    Get the displacements to neighboring periodic images.
+
+    Parameters
+    ----------
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The a, b and c vectors of a periodic cell.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        A ``(27, 3)`` matrix. Each row holds the displacement from
+        the cell to one of its neighbors, or to itself.
+
+    """
+
+    return np.array(
+        list(it.product((-1, 0, 1), repeat=3)),
+        dtype=np.float64,
+    ) @ np.array(cell, dtype=np.float64)
+
+
+def _wrap_positions(position_matrix, cell):
+    """
+    Move positions into a periodic cell.
+
+    Parameters
+    ----------
+    position_matrix : :class:`numpy.ndarray`
+        A ``(n, 3)`` matrix of positions.
+
+    cell : :class:`numpy.ndarray`
+        A ``(3, 3)`` matrix, holding the a, b and c vectors of the
+        cell in its rows.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The positions, translated by lattice vectors, so that they
+        lie inside the cell.
+
+    """
+
+    fractional = position_matrix @ np.linalg.inv(cell)
+    return (fractional - np.floor(fractional)) @ cell
+
+
+def _get_query_positions(position, cell):
+    """
+    Get the positions used to query a spatial index.
+
+    Parameters
+    ----------
+    position : :class:`numpy.ndarray`
+        The position being queried.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The a, b and c vectors of a periodic cell, or ``None``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        A ``(k, 3)`` matrix. If `cell` is ``None``, it holds only
+        `position`. Otherwise, it holds `position`, wrapped into
+        the cell, and its 26 neighboring images.
+
+    """
+
+    position = np.array(position, dtype=np.float64).reshape(1, 3)
+    if cell is None:
+        return position
+
+    cell = np.array(cell, dtype=np.float64)
+    return _wrap_positions(position, cell) - _get_image_shifts(cell)
+
+
+# The maximum number of atoms whose positions are loaded into memory
+# at a time, when the position matrix is memory mapped.
+_chunk_size = 2**20
+
+
+def _get_memory_map(directory, shape):
+    """
+    Get a memory-mapped array backed by a temporary file.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory in which the file is created. If ``None``, the
+        default temporary directory is used.
+
+    shape : :class:`tuple` of :class:`int`
+        The shape of the array.
+
+    Returns
+    -------
+    :class:`numpy.memmap`
+        The array. The file is deleted once the array is no longer
+        used.
+
+    """
+
+    with tempfile.NamedTemporaryFile(dir=directory) as f:
+        return np.memmap(f, dtype=np.float64, mode='w+', shape=shape)
+
+
+def _get_chunks(position_matrix, atom_ids=None):
+    """
+    Yield the positions of atoms in chunks.
+
+    Parameters
+    ----------
+    position_matrix : :class:`numpy.ndarray`
+        A ``(3, n)`` position matrix. If it is a :class:`numpy.memmap`
+        the positions are yielded in chunks of limited size,
+        otherwise they are yielded as a single chunk.
+
+    atom_ids : :class:`list` of :class:`int`, optional
+        The ids of atoms whose positions are yielded. If ``None``, the
+        positions of all atoms are yielded.
+
+    Yields
+    ------
+    :class:`numpy.ndarray`
+        A ``(3, k)`` matrix, holding the positions of ``k`` atoms.
+
+    """
+
+    if atom_ids is None:
+        atom_ids = slice(None)
+    if not isinstance(position_matrix, np.memmap):
+        yield position_matrix[:, atom_ids]
+        return
+
+    num_atoms = position_matrix.shape[1]
+    if isinstance(atom_ids, slice):
+        atom_ids = range(num_atoms)
+    for start in range(0, len(atom_ids), _chunk_size):
+        chunk = atom_ids[start:start+_chunk_size]
+        if isinstance(chunk, range):
+            chunk = slice(chunk.start, chunk.stop)
+        yield np.asarray(position_matrix[:, chunk])
+
+
+def _apply(function, position_matrix, atom_ids=None):
+    """
+    Apply a function to the positions of atoms.
+
+    Parameters
+    ----------
+    function : :class:`callable`
+        Takes a ``(3, k)`` matrix of positions and returns a matrix
+        of the same shape. It must act on each atom independently.
+
+    position_matrix : :class:`numpy.ndarray`
+        A ``(3, n)`` position matrix. If it is a :class:`numpy.memmap`,
+        `function` is applied to chunks of it and the result is
+        written into a new memory-mapped file, in the same directory.
+
+    atom_ids : :class:`list` of :class:`int`, optional
+        The ids of atoms whose positions are passed to `function`. If
+        ``None``, the positions of all atoms are used.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The results of `function`, in the order of `atom_ids`.
+
+    """
+
+    if not isinstance(position_matrix, np.memmap):
+        return function(next(_get_chunks(position_matrix, atom_ids)))
+
+    num_atoms = (
+        position_matrix.shape[1] if atom_ids is None else len(atom_ids)
+    )
+    result = _get_memory_map(
+        directory=os.path.dirname(position_matrix.filename),
+        shape=(3, num_atoms),
+    )
+    start = 0
+    for positions in _get_chunks(position_matrix, atom_ids):
+        end = start + positions.shape[1]
+        result[:, start:end] = function(positions)
+        start = end
+    return result
@@ -1,4 +1,7 @@
 from .mdl_mol import _with_structure_from_mol
 from .mae import _with_structure_from_mae
-from .xyz import _with_structure_from_xyz
+from .xyz import (
+    _with_structure_from_xyz,
+    _get_position_matrices_from_xyz,
+)
 from .turbomole import _with_structure_from_turbomole
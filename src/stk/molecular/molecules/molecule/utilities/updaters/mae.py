@@ -1,10 +1,22 @@
-from stk.utilities import mol_from_mae_file
+import re
+import numpy as np
+
+from .utilities import check_elements
+
+
+# Matches the start of the atom block, capturing the number of atoms.
+_atom_block = re.compile(r'\bm_atom\[(\d+)\]\s*\{')
+# Matches a single value in the atom block. String values can be
+# quoted, in which case they can hold whitespace.
+_value = re.compile(r'"(?:[^"\\]|\\.)*"|\S+')
 
 
 def _with_structure_from_mae(self, path):
     """
     Change structure to match an ``.mae`` file.
 
+    Only the atom block of the first structure in the file is read.
+
     Parameters
     ----------
     path : :class:`str`
@@ -16,9 +28,73 @@ def _with_structure_from_mae(self, path):
     :class:`.Molecule`
         The molecule.
 
+    Raises
+    ------
+    :class:`RuntimeError`
+        If the number of atoms in the file does not match the
+        number of atoms in the molecule or if atom elements in the
+        file do not agree with the atom elements in the molecule.
+
     """
 
-    molecule = mol_from_mae_file(path)
+    with open(path, 'r') as f:
+        content = f.read()
+
+    match = _atom_block.search(content)
+    if match is None:
+        raise RuntimeError(f'The mae file, {path}, has no atom block.')
+
+    num_atoms = len(self._atoms)
+    if int(match.group(1)) != num_atoms:
+        raise RuntimeError(
+            f'The number of atoms in the mae file, {match.group(1)}, '
+            'does not match the number of atoms in the molecule, '
+            f'{num_atoms}.'
+        )
+
+    # The atom block holds the column labels, followed by the rows of
+    # the atoms, with each section ending at ":::".
+    labels, rows, *_ = content[match.end():].split(':::', 2)
+    labels = [
+        label for label in map(str.strip, labels.splitlines())
+        if label and not label.startswith('#')
+    ]
+    try:
+        # The first column of each row holds the atom index, which
+        # does not have a label.
+        columns = [
+            labels.index(label) + 1
+            for label in (
+                'i_m_atomic_number',
+                'r_m_x_coord',
+                'r_m_y_coord',
+                'r_m_z_coord',
+            )
+        ]
+    except ValueError:
+        raise RuntimeError(
+            'The atom block of the mae file must hold the atomic '
+            'number and coordinates of every atom.'
+        )
+
+    values = _value.findall(rows)
+    num_columns = len(labels) + 1
+    if len(values) != num_columns*num_atoms:
+        raise RuntimeError(
+            'The number of values in the atom block of the mae file, '
+            f'{len(values)}, does not match {num_columns} columns '
+            f'for each of the {num_atoms} atoms in the molecule.'
+        )
+
+    elements, *coordinates = (
+        values[column::num_columns] for column in columns
+    )
+    check_elements(
+        atomic_numbers=np.array([
+            atom.get_atomic_number() for atom in self._atoms
+        ]),
+        elements=elements,
+    )
     return self._with_position_matrix(
-        position_matrix=molecule.GetConformer().GetPositions()
+        position_matrix=np.array(coordinates, dtype=np.float64).T,
     )
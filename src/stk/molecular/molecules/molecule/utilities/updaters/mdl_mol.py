@@ -1,12 +1,16 @@
-import rdkit.Chem.AllChem as rdkit
+import itertools as it
+import numpy as np
 
-from stk.utilities import remake
+from .utilities import check_elements
 
 
 def _with_structure_from_mol(self, path):
     """
     Change structure to match a ``.mol`` file.
 
+    Both V2000 and V3000 files are supported. Only the atom block
+    of the file is read.
+
     Parameters
     ----------
     path : :class:`str`
@@ -18,15 +22,208 @@ def _with_structure_from_mol(self, path):
     :class:`.Molecule`
         The molecule.
 
+    Raises
+    ------
+    :class:`RuntimeError`
+        If the number of atoms in the file does not match the
+        number of atoms in the molecule or if atom elements in the
+        file do not agree with the atom elements in the molecule.
+
     """
 
-    molecule = remake(
-        rdkit.MolFromMolFile(
-            molFileName=path,
-            sanitize=False,
-            removeHs=False,
-        )
+    num_atoms = len(self._atoms)
+    with open(path, 'r') as f:
+        # The counts line comes after the 3 lines of the header.
+        header = list(it.islice(f, 4))
+        if len(header) != 4:
+            raise RuntimeError(
+                f'The mol file, {path}, does not have a counts line.'
+            )
+
+        if 'V3000' in header[3]:
+            elements, position_matrix = _get_v3000_atoms(f, num_atoms)
+        else:
+            elements, position_matrix = _get_v2000_atoms(
+                lines=f,
+                counts_line=header[3],
+                num_atoms=num_atoms,
+            )
+
+    check_elements(
+        atomic_numbers=np.array([
+            atom.get_atomic_number() for atom in self._atoms
+        ]),
+        elements=elements,
     )
-    return self._with_position_matrix(
-        position_matrix=molecule.GetConformer().GetPositions()
+    return self._with_position_matrix(position_matrix)
+
+
+def _get_v2000_atoms(lines, counts_line, num_atoms):
+    """
+    Read the atom block of a V2000 ``.mol`` file.
+
+    Parameters
+    ----------
+    lines : :class:`iterable` of :class:`str`
+        The lines of the file, which come after the counts line.
+
+    counts_line : :class:`str`
+        The counts line of the file.
+
+    num_atoms : :class:`int`
+        The number of atoms in the molecule.
+
+    Returns
+    -------
+    :class:`tuple`
+        The first element is a :class:`list` holding the element of
+        every atom, as written in the file. The second is the
+        position matrix found in the file.
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If the number of atoms in the file does not match
+        `num_atoms`.
+
+    """
+
+    _check_num_atoms(int(counts_line[:3]), num_atoms)
+    lines = list(it.islice(lines, num_atoms))
+    _check_num_atom_lines(len(lines), num_atoms)
+
+    # The atom block has fixed width columns, so coordinates are not
+    # guaranteed to be separated by whitespace.
+    coordinates = [
+        line[start:start+10]
+        for line in lines
+        for start in (0, 10, 20)
+    ]
+    elements = [line[31:34].strip() for line in lines]
+    return (
+        elements,
+        np.array(coordinates, dtype=np.float64).reshape(-1, 3),
     )
+
+
+def _get_v3000_atoms(lines, num_atoms):
+    """
+    Read the atom block of a V3000 ``.mol`` file.
+
+    Parameters
+    ----------
+    lines : :class:`iterable` of :class:`str`
+        The lines of the file, which come after the counts line.
+
+    num_atoms : :class:`int`
+        The number of atoms in the molecule.
+
+    Returns
+    -------
+    :class:`tuple`
+        The first element is a :class:`list` holding the element of
+        every atom, as written in the file. The second is the
+        position matrix found in the file.
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If the number of atoms in the file does not match
+        `num_atoms`.
+
+    """
+
+    lines = iter(lines)
+    for line in lines:
+        if line.startswith('M  V30 COUNTS'):
+            _check_num_atoms(int(line.split()[3]), num_atoms)
+        elif line.startswith('M  V30 BEGIN ATOM'):
+            break
+    else:
+        raise RuntimeError('The mol file does not have an atom block.')
+
+    # Each atom line starts with "M  V30", followed by the atom id,
+    # the element and the coordinates. Any remaining fields hold
+    # optional atom properties, which are not split.
+    fields = [
+        line.split(maxsplit=7)[3:7]
+        for line in it.islice(lines, num_atoms)
+    ]
+    _check_num_atom_lines(len(fields), num_atoms)
+    fields = list(it.chain.from_iterable(fields))
+    if len(fields) != 4*num_atoms:
+        raise RuntimeError(
+            'Every atom line in the mol file must hold an element '
+            'and 3 coordinates.'
+        )
+
+    elements = fields[0::4]
+    # Only the coordinates are left once the elements are removed,
+    # which allows them to be converted in one go.
+    del fields[0::4]
+    return (
+        elements,
+        np.array(fields, dtype=np.float64).reshape(-1, 3),
+    )
+
+
+def _check_num_atoms(file_num_atoms, num_atoms):
+    """
+    Check that the atom count of a ``.mol`` file is correct.
+
+    Parameters
+    ----------
+    file_num_atoms : :class:`int`
+        The number of atoms given in the counts line of the file.
+
+    num_atoms : :class:`int`
+        The number of atoms in the molecule.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If `file_num_atoms` does not match `num_atoms`.
+
+    """
+
+    if file_num_atoms != num_atoms:
+        raise RuntimeError(
+            f'The number of atoms in the mol file, {file_num_atoms}, '
+            'does not match the number of atoms in the molecule, '
+            f'{num_atoms}.'
+        )
+
+
+def _check_num_atom_lines(num_atom_lines, num_atoms):
+    """
+    Check that a ``.mol`` file has the correct number of atom lines.
+
+    Parameters
+    ----------
+    num_atom_lines : :class:`int`
+        The number of atom lines found in the file.
+
+    num_atoms : :class:`int`
+        The number of atoms in the molecule.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If `num_atom_lines` does not match `num_atoms`.
+
+    """
+
+    if num_atom_lines != num_atoms:
+        raise RuntimeError(
+            f'The number of atom lines in the mol file, '
+            f'{num_atom_lines}, does not match the number of atoms '
+            f'in the molecule, {num_atoms}.'
+        )
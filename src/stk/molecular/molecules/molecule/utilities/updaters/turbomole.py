@@ -1,4 +1,7 @@
-from stk.utilities import periodic_table
+import itertools as it
+import numpy as np
+
+from .utilities import check_elements
 
 
 def _with_structure_from_turbomole(self, path):
@@ -30,39 +33,51 @@ def _with_structure_from_turbomole(self, path):
     bohr_to_ang = 0.5291772105638411
 
     with open(path, 'r') as f:
-        _, *content, __ = f.readlines()
+        for line in f:
+            if line.startswith('$coord'):
+                break
+        else:
+            raise RuntimeError(
+                f'The coord file, {path}, has no $coord section.'
+            )
+
+        # The section ends at the next line starting with "$".
+        lines = [
+            line for line in it.takewhile(
+                lambda line: not line.startswith('$'),
+                f,
+            )
+            if not line.isspace()
+        ]
 
     # Check the atom count is correct.
     num_atoms = len(self._atoms)
-    if len(content) != num_atoms:
+    if len(lines) != num_atoms:
         raise RuntimeError(
             'The number of atoms in the coord file, '
-            f'{len(content)}, does not match the number of atoms '
+            f'{len(lines)}, does not match the number of atoms '
             f'in the molecule, {num_atoms}.'
         )
 
-    # Save all the coords in the file.
-    new_coords = []
-    for i, line in enumerate(content):
-        *coords, element = line.split()
-        if element.isnumeric():
-            element = periodic_table[int(element)]
-
-        if element != self._atoms[i].__class__.__name__:
-            raise RuntimeError(
-                f'Atom {i} element does not match file.'
-            )
-
-        new_coords.append([float(i)*bohr_to_ang for i in coords])
-
-    # Check that the correct number of atom
-    # lines was present in the file.
-    if i+1 != num_atoms:
+    fields = ''.join(lines).split()
+    if len(fields) != 4*num_atoms:
         raise RuntimeError(
-            'The number of atoms lines in the coord file, '
-            f'{i+1}, does not match the number of atoms '
-            f'in the molecule, {num_atoms}.'
+            'Every atom line in the coord file must hold 3 '
+            'coordinates and an element.'
         )
 
-    # Update the structure.
-    return self._with_position_matrix(new_coords)
+    check_elements(
+        atomic_numbers=np.array([
+            atom.get_atomic_number() for atom in self._atoms
+        ]),
+        elements=fields[3::4],
+    )
+    # Only the coordinates are left once the elements are removed,
+    # which allows them to be converted in one go.
+    del fields[3::4]
+    return self._with_position_matrix(
+        position_matrix=(
+            np.array(fields, dtype=np.float64).reshape(-1, 3)
+            * bohr_to_ang
+        ),
+    )
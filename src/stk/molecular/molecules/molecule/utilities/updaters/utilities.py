@@ -0,0 +1,75 @@
+import numpy as np
+
+from stk.utilities import periodic_table
+
+
+# Maps the symbol of each element to its atomic number.
+_atomic_numbers = {
+    symbol: atomic_number
+    for atomic_number, symbol in periodic_table.items()
+}
+
+
+def get_atomic_numbers(elements):
+    """
+    Get the atomic numbers of elements found in a structure file.
+
+    Parameters
+    ----------
+    elements : :class:`list` of :class:`str`
+        The element of every atom, as written in a file. An element
+        can be given as a symbol, in any capitalization, or as an
+        atomic number.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The atomic number of every atom. Unknown elements are given
+        an atomic number of ``-1``.
+
+    """
+
+    # Files hold only a few distinct elements, so only those need to
+    # be converted in Python.
+    unique, inverse = np.unique(elements, return_inverse=True)
+    atomic_numbers = np.array([
+        int(element) if element.isnumeric()
+        else _atomic_numbers.get(element.title(), -1)
+        for element in unique.tolist()
+    ], dtype=np.int64)
+    return atomic_numbers[inverse.reshape(-1)]
+
+
+def check_elements(atomic_numbers, elements):
+    """
+    Check that the elements in a structure file match a molecule.
+
+    Parameters
+    ----------
+    atomic_numbers : :class:`numpy.ndarray`
+        The atomic number of every atom in the molecule.
+
+    elements : :class:`list` of :class:`str`
+        The element of every atom, as written in the file. An
+        element can be given as a symbol, in any capitalization, or
+        as an atomic number.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If an element in the file does not match the element of the
+        corresponding atom in the molecule.
+
+    """
+
+    mismatches = np.flatnonzero(
+        get_atomic_numbers(elements) != atomic_numbers
+    )
+    if mismatches.size:
+        raise RuntimeError(
+            f'Atom {mismatches[0]} element does not match file.'
+        )
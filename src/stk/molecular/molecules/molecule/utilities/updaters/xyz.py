@@ -1,16 +1,19 @@
+import itertools as it
 import numpy as np
 
-from stk.utilities import periodic_table
+from .utilities import check_elements
 
 
 def _with_structure_from_xyz(self, path):
     """
     Return a clone, with its structure taken from an ``.xyz`` file.
 
+    If the file holds multiple frames, the first one is used.
+
     Parameters
     ----------
     path : :class:`str`
-        The full path of the ``.mol`` file from which the structure
+        The full path of the ``.xyz`` file from which the structure
         should be updated.
 
     Returns
@@ -27,43 +30,91 @@ def _with_structure_from_xyz(self, path):
 
     """
 
-    with open(path, 'r') as f:
-        atom_count, _, *content = f.readlines()
+    position_matrix = next(
+        _get_position_matrices_from_xyz(self, path),
+        None,
+    )
+    if position_matrix is None:
+        raise RuntimeError(f'The xyz file, {path}, holds no frames.')
+    return self._with_position_matrix(position_matrix)
+
+
+def _get_position_matrices_from_xyz(self, path):
+    """
+    Yield the position matrix of every frame in an ``.xyz`` file.
+
+    Frames are read lazily, so that the file is never held in memory
+    in full. The atoms of each frame are parsed in bulk.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The full path of the ``.xyz`` file.
+
+    Yields
+    ------
+    :class:`numpy.ndarray`
+        The position matrix of a frame.
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If the number of atoms in a frame does not match the
+        number of atoms in the molecule or if atom elements in a
+        frame do not agree with the atom elements in the molecule.
+
+    """
 
-    # Check the atom count is correct.
     num_atoms = len(self._atoms)
-    if int(atom_count) != num_atoms:
-        raise RuntimeError(
-            f'The number of atoms in the xyz file, {atom_count}, '
-            'does not match the number of atoms in the '
-            f'molecule, {num_atoms}.'
-        )
-
-    # Save all the coords in the file.
-    new_coords = []
-    for i, line in enumerate(content):
-        element, *coords = line.split()
-        # Handle XYZ files with capitilisation of element symbols.
-        element = element.title()
-        if element.isnumeric():
-            element = periodic_table[int(element)]
-
-        if element != self._atoms[i].__class__.__name__:
-            raise RuntimeError(
-                f'Atom {i} element does not match file.'
-            )
-
-        new_coords.append([float(i) for i in coords])
-
-    # Check that the correct number of atom
-    # lines was present in the file.
-    if i+1 != num_atoms:
-        raise RuntimeError(
-            f'The number of atom lines in the xyz file, {i+1}, '
-            'does not match the number of atoms in the '
-            f'molecule, {num_atoms}.'
-        )
-
-    # Update the structure.
-    new_coords = np.array(new_coords)
-    return self._with_position_matrix(new_coords)
+    atomic_numbers = np.array([
+        atom.get_atomic_number() for atom in self._atoms
+    ])
+    # Holds the element column of the last frame which was checked.
+    # Trajectories almost always repeat the same elements in every
+    # frame, in which case the check does not have to be repeated.
+    checked_elements = None
+
+    with open(path, 'r') as f:
+        while True:
+            atom_count = f.readline()
+            # Stop at the end of the file or at trailing blank lines.
+            if not atom_count.strip():
+                return
+
+            # Check the atom count is correct.
+            if int(atom_count) != num_atoms:
+                raise RuntimeError(
+                    f'The number of atoms in the xyz file, '
+                    f'{atom_count.strip()}, does not match the number '
+                    f'of atoms in the molecule, {num_atoms}.'
+                )
+
+            # Skip the comment line.
+            f.readline()
+            lines = list(it.islice(f, num_atoms))
+
+            # Check that the correct number of atom lines was present
+            # in the file.
+            if len(lines) != num_atoms:
+                raise RuntimeError(
+                    f'The number of atom lines in the xyz file, '
+                    f'{len(lines)}, does not match the number of '
+                    f'atoms in the molecule, {num_atoms}.'
+                )
+
+            fields = ''.join(lines).split()
+            if len(fields) != 4*num_atoms:
+                raise RuntimeError(
+                    'Every atom line in the xyz file must hold an '
+                    'element and 3 coordinates.'
+                )
+
+            elements = fields[0::4]
+            if elements != checked_elements:
+                check_elements(atomic_numbers, elements)
+                checked_elements = elements
+
+            # Only the coordinates are left once the elements are
+            # removed, which allows them to be converted in one go.
+            del fields[0::4]
+            yield np.array(fields, dtype=np.float64).reshape(-1, 3)
@@ -1,3 +1,3 @@
-from .mdl_mol import _write_mdl_mol_file
+from .mdl_mol import _write_mdl_mol_file, _to_mdl_mol_block
 from .pdb import _write_pdb_file
-from .xyz import _write_xyz_file
+from .xyz import _write_xyz_file, _to_xyz_block
@@ -1,3 +1,8 @@
+import numpy as np
+
+from .utilities import format_lines, get_chunks
+
+
 def _write_mdl_mol_file(self, path, atom_ids):
     """
     Write to a V3000 ``.mol`` file.
@@ -22,7 +27,7 @@ def _write_mdl_mol_file(self, path, atom_ids):
     """
 
     with open(path, 'w') as f:
-        f.write(_to_mdl_mol_block(self, atom_ids))
+        f.writelines(_get_mdl_mol_block_parts(self, atom_ids))
 
 
 def _to_mdl_mol_block(self, atom_ids=None):
@@ -43,53 +48,88 @@ def _to_mdl_mol_block(self, atom_ids=None):
 
     """
 
+    return ''.join(_get_mdl_mol_block_parts(self, atom_ids))
+
+
+def _get_mdl_mol_block_parts(self, atom_ids):
+    """
+    Yield consecutive parts of a V3000 mol block of the molecule.
+
+    The atom lines are formatted in chunks, so that the positions
+    of a large molecule do not have to be held in memory all at
+    once.
+
+    Parameters
+    ----------
+    atom_ids : :class:`iterable` of :class:`int`
+        The atom ids of atoms to write. Can be a single
+        :class:`int`, if a single atom is to be used, or
+        ``None``, if all atoms are to be used.
+
+    Yields
+    ------
+    :class:`str`
+        A part of the V3000 mol block representing the molecule.
+
+    """
+
     if atom_ids is None:
         atom_ids = range(len(self._atoms))
     elif isinstance(atom_ids, int):
         atom_ids = (atom_ids, )
+    atom_ids = np.array(list(atom_ids), dtype=np.int64)
 
-    atom_lines = []
-    # This set gets used by bonds.
-    id_map = {}
-    for new_atom_id, old_atom_id in enumerate(atom_ids, 1):
-        id_map[old_atom_id] = new_atom_id
-
-        x, y, z = self._position_matrix[:, old_atom_id]
-        atom = self._atoms[old_atom_id]
-        symbol = atom.__class__.__name__
-        charge = atom.get_charge()
-        charge = f' CHG={charge}' if charge else ''
-        atom_lines.append(
-            f'M  V30 {new_atom_id} {symbol} {x:.4f} '
-            f'{y:.4f} {z:.4f} 0{charge}\n'
-        )
-    atom_block = ''.join(atom_lines)
-
-    bond_lines = []
-    for bond in self._bonds:
-        a1 = bond.get_atom1().get_id()
-        a2 = bond.get_atom2().get_id()
-        if a1 in id_map and a2 in id_map:
-            bond_lines.append(
-                f'M  V30 {len(bond_lines)+1} '
-                f'{int(bond.get_order())} '
-                f'{id_map[a1]} {id_map[a2]}\n'
-            )
-
-    num_bonds = len(bond_lines)
-    bond_block = ''.join(bond_lines)
-    return (
+    # Maps the id of every atom in the molecule to its id in the
+    # file, which is 0 if the atom is not written.
+    id_map = np.zeros(len(self._atoms), dtype=np.int64)
+    id_map[atom_ids] = np.arange(1, len(atom_ids)+1)
+
+    bond_atom_ids = id_map[self._get_bond_atom_id_matrix()]
+    # Only bonds between written atoms are written.
+    bond_ids = np.flatnonzero(bond_atom_ids.all(axis=1))
+
+    yield (
         '\n'
         '     RDKit          3D\n'
         '\n'
         '  0  0  0  0  0  0  0  0  0  0999 V3000\n'
         'M  V30 BEGIN CTAB\n'
-        f'M  V30 COUNTS {len(id_map)} {num_bonds} 0 0 0\n'
+        f'M  V30 COUNTS {len(atom_ids)} {len(bond_ids)} 0 0 0\n'
         'M  V30 BEGIN ATOM\n'
-        f'{atom_block}'
+    )
+
+    for start, chunk in get_chunks(atom_ids.tolist()):
+        atoms = [self._atoms[atom_id] for atom_id in chunk]
+        charges = (atom.get_charge() for atom in atoms)
+        x, y, z = self._position_matrix[:, chunk].tolist()
+        yield format_lines(
+            line='M  V30 %d %s %.4f %.4f %.4f 0%s\n',
+            columns=(
+                range(start+1, start+len(atoms)+1),
+                (atom.__class__.__name__ for atom in atoms),
+                x,
+                y,
+                z,
+                (f' CHG={charge}' if charge else '' for charge in charges),
+            ),
+        )
+
+    yield (
         'M  V30 END ATOM\n'
         'M  V30 BEGIN BOND\n'
-        f'{bond_block}'
+    )
+    yield format_lines(
+        line='M  V30 %d %d %d %d\n',
+        columns=(
+            range(1, len(bond_ids)+1),
+            np.array(
+                [bond.get_order() for bond in self._bonds],
+                dtype=np.float64,
+            )[bond_ids].astype(np.int64).tolist(),
+            *bond_atom_ids[bond_ids].T.tolist(),
+        ),
+    )
+    yield (
         'M  V30 END BOND\n'
         'M  V30 END CTAB\n'
         'M  END\n'
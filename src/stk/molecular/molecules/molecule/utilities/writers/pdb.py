@@ -1,3 +1,8 @@
+import numpy as np
+
+from .utilities import format_lines
+
+
 def _write_pdb_file(self, path, atom_ids):
     """
     Write to a ``.pdb`` file.
@@ -38,10 +43,10 @@ def _write_pdb_file(self, path, atom_ids):
     temp_factor = '0.00'
 
     coords = self._position_matrix
-    # This set will be used by bonds.
-    atoms = set()
+    # Marks the atoms which are written, for use by bonds.
+    written = np.zeros(len(self._atoms), dtype=bool)
     for atom in atom_ids:
-        atoms.add(atom)
+        written[atom] = True
 
         serial = atom+1
         element = self._atoms[atom].__class__.__name__
@@ -60,13 +65,13 @@ def _write_pdb_file(self, path, atom_ids):
         )
 
     conect = 'CONECT'
-    for bond in self._bonds:
-        a1 = bond.get_atom1().get_id()
-        a2 = bond.get_atom2().get_id()
-        if a1 in atoms and a2 in atoms:
-            lines.append(
-                f'{conect:<6}{a1+1:>5}{a2+1:>5}               \n'
-            )
+    bond_atom_ids = self._get_bond_atom_id_matrix()
+    # Only bonds between written atoms are written.
+    bond_atom_ids = bond_atom_ids[written[bond_atom_ids].all(axis=1)]
+    lines.append(format_lines(
+        line=f'{conect:<6}%5d%5d               \n',
+        columns=(bond_atom_ids+1).T.tolist(),
+    ))
 
     lines.append('END\n')
     with open(path, 'w') as f:
@@ -0,0 +1,54 @@
+import itertools as it
+
+
+# The number of atoms formatted at a time.
+_chunk_size = 2**16
+
+
+def format_lines(line, columns):
+    """
+    Format many lines of a file in one go.
+
+    Formatting a single large string with the ``%`` operator is much
+    faster than formatting each line separately.
+
+    Parameters
+    ----------
+    line : :class:`str`
+        A ``%`` style template for a single line.
+
+    columns : :class:`iterable`
+        Holds an :class:`iterable` for each placeholder in `line`.
+        Each of these holds the values of that placeholder for every
+        line.
+
+    Returns
+    -------
+    :class:`str`
+        The formatted lines.
+
+    """
+
+    rows = tuple(zip(*columns))
+    return (line*len(rows)) % tuple(it.chain.from_iterable(rows))
+
+
+def get_chunks(atom_ids):
+    """
+    Split atom ids into chunks.
+
+    Parameters
+    ----------
+    atom_ids : :class:`list` of :class:`int`
+        The atom ids to split.
+
+    Yields
+    ------
+    :class:`tuple`
+        Holds the index of the first atom id in the chunk, followed
+        by a :class:`list` holding the atom ids in the chunk.
+
+    """
+
+    for start in range(0, len(atom_ids), _chunk_size):
+        yield start, atom_ids[start:start+_chunk_size]
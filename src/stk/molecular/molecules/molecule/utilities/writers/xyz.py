@@ -1,3 +1,6 @@
+from .utilities import format_lines, get_chunks
+
+
 def _write_xyz_file(self, path, atom_ids):
     """
     Write to a ``.xyz`` file.
@@ -21,18 +24,71 @@ def _write_xyz_file(self, path, atom_ids):
 
     """
 
+    with open(path, 'w') as xyz:
+        xyz.writelines(_get_xyz_block_parts(self, atom_ids))
+
+
+def _to_xyz_block(self, atom_ids=None):
+    """
+    Return an ``.xyz`` block of the molecule.
+
+    Parameters
+    ----------
+    atom_ids : :class:`iterable` of :class:`int`, optional
+        The atom ids of atoms to write. Can be a single
+        :class:`int`, if a single atom is to be used, or
+        ``None``, if all atoms are to be used.
+
+    Returns
+    -------
+    :class:`str`
+        The ``.xyz`` block representing the molecule.
+
+    """
+
+    return ''.join(_get_xyz_block_parts(self, atom_ids))
+
+
+def _get_xyz_block_parts(self, atom_ids):
+    """
+    Yield consecutive parts of an ``.xyz`` block of the molecule.
+
+    The atom lines are formatted in chunks, so that the positions
+    of a large molecule do not have to be held in memory all at
+    once.
+
+    Parameters
+    ----------
+    atom_ids : :class:`iterable` of :class:`int`
+        The atom ids of atoms to write. Can be a single
+        :class:`int`, if a single atom is to be used, or
+        ``None``, if all atoms are to be used.
+
+    Yields
+    ------
+    :class:`str`
+        A part of the ``.xyz`` block representing the molecule.
+
+    """
+
     if atom_ids is None:
         atom_ids = range(len(self._atoms))
     elif isinstance(atom_ids, int):
         atom_ids = (atom_ids, )
+    atom_ids = list(atom_ids)
 
-    content = [0]
-    for i, atom_id in enumerate(atom_ids, 1):
-        x, y, z = self._position_matrix[:, atom_id]
-        symbol = self._atoms[atom_id].__class__.__name__
-        content.append(f'{symbol} {x:f} {y:f} {z:f}\n')
-    # Set first line to the atom_count.
-    content[0] = f'{i}\n\n'
-
-    with open(path, 'w') as xyz:
-        xyz.write(''.join(content))
+    yield f'{len(atom_ids)}\n\n'
+    for _, chunk in get_chunks(atom_ids):
+        x, y, z = self._position_matrix[:, chunk].tolist()
+        yield format_lines(
+            line='%s %f %f %f\n',
+            columns=(
+                (
+                    self._atoms[atom_id].__class__.__name__
+                    for atom_id in chunk
+                ),
+                x,
+                y,
+                z,
+            ),
+        )
@@ -0,0 +1,287 @@
+"""
+Multi-Molecule Writer
+=====================
+
+"""
+
+import os
+import functools
+import gzip
+import bz2
+import lzma
+import queue
+import threading
+
+from .molecule.utilities import writers
+
+
+class MultiMoleculeWriter:
+    """
+    Writes many molecules into a single file.
+
+    Molecules are written into ``.sdf`` files, or multi-frame ``.xyz``
+    files, which can be compressed. Formatted molecules are buffered,
+    so that the file is written in large chunks.
+
+    Examples
+    --------
+    *Writing Many Molecules*
+
+    The writer can be used as a context manager, which closes the
+    file once all molecules are written
+
+    .. code-block:: python
+
+        import stk
+
+        molecules = (
+            stk.BuildingBlock('NCCN'),
+            stk.BuildingBlock('BrCCBr'),
+            stk.BuildingBlock('NCCCN'),
+        )
+        with stk.MultiMoleculeWriter('molecules.sdf') as writer:
+            writer.write_many(molecules)
+
+    *Writing Compressed Files*
+
+    If the file ends with ``.gz``, ``.bz2`` or ``.xz``, it will be
+    compressed. Compression and writing can be moved into a worker
+    thread, so that they overlap with the formatting of molecules
+
+    .. code-block:: python
+
+        with stk.MultiMoleculeWriter(
+            path='molecules.xyz.gz',
+            use_thread=True,
+        ) as writer:
+            for molecule in molecules:
+                writer.write(molecule)
+
+    """
+
+    def __init__(
+        self,
+        path,
+        extension=None,
+        buffer_size=2**20,
+        use_thread=False,
+    ):
+        """
+        Initialize a :class:`.MultiMoleculeWriter` instance.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the file into which molecules are written.
+            If it ends with ``.gz``, ``.bz2`` or ``.xz``, the file
+            is compressed.
+
+        extension : :class:`str`, optional
+            If you want to treat the file as though it has a
+            particular extension, put it here. Include the dot. Can
+            be ``'.sdf'``, ``'.mol'`` or ``'.xyz'``. If ``None``, the
+            extension of `path`, ignoring any compression extension,
+            is used.
+
+        buffer_size : :class:`int`, optional
+            The number of characters which are formatted before they
+            are written into the file.
+
+        use_thread : :class:`bool`, optional
+            If ``True``, compression and writing is done in a worker
+            thread.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the file type is not supported.
+
+        """
+
+        root, compression = os.path.splitext(path)
+        open_ = {
+            # The default compression level of zlib is much faster
+            # than that of gzip, for a small increase in file size.
+            '.gz': functools.partial(gzip.open, compresslevel=6),
+            '.bz2': bz2.open,
+            '.xz': lzma.open,
+        }.get(compression)
+        if open_ is None:
+            root = path
+            open_ = open
+
+        if extension is None:
+            _, extension = os.path.splitext(root)
+
+        to_block = {
+            '.mol': writers._to_mdl_mol_block,
+            '.sdf': writers._to_mdl_mol_block,
+            '.xyz': writers._to_xyz_block,
+        }.get(extension)
+        if to_block is None:
+            raise ValueError(
+                f'Writing multiple molecules into "{extension}" files '
+                'is not supported.'
+            )
+
+        self._path = path
+        self._to_block = to_block
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._file = open_(path, 'wb')
+
+        self._thread = None
+        self._thread_error = None
+        if use_thread:
+            # Bounded, so that formatting cannot run arbitrarily far
+            # ahead of writing.
+            self._chunks = queue.Queue(maxsize=4)
+            self._thread = threading.Thread(
+                target=self._write_chunks,
+                daemon=True,
+            )
+            self._thread.start()
+
+    def write(self, molecule, atom_ids=None):
+        """
+        Write a molecule.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule to write.
+
+        atom_ids : :class:`iterable` of :class:`int`, optional
+            The atom ids of atoms to write. Can be a single
+            :class:`int`, if a single atom is to be used, or
+            ``None``, if all atoms are to be used.
+
+        Returns
+        -------
+        :class:`.MultiMoleculeWriter`
+            The writer.
+
+        """
+
+        block = self._to_block(molecule, atom_ids)
+        self._buffer.append(block)
+        self._buffered += len(block)
+        if self._buffered >= self._buffer_size:
+            self._flush()
+        return self
+
+    def write_many(self, molecules):
+        """
+        Write many molecules.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules to write.
+
+        Returns
+        -------
+        :class:`.MultiMoleculeWriter`
+            The writer.
+
+        """
+
+        for molecule in molecules:
+            self.write(molecule)
+        return self
+
+    def close(self):
+        """
+        Write any buffered molecules and close the file.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        if self._file is None:
+            return
+
+        try:
+            self._flush()
+            if self._thread is not None:
+                self._chunks.put(None)
+                self._thread.join()
+                self._raise_thread_error()
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _flush(self):
+        """
+        Write the buffered molecules.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        if not self._buffer:
+            return
+
+        chunk = ''.join(self._buffer).encode()
+        self._buffer = []
+        self._buffered = 0
+        if self._thread is None:
+            self._file.write(chunk)
+        else:
+            self._raise_thread_error()
+            self._chunks.put(chunk)
+
+    def _write_chunks(self):
+        """
+        Write chunks from the queue until ``None`` is found.
+
+        This method is run by the worker thread.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        while True:
+            chunk = self._chunks.get()
+            if chunk is None:
+                return
+            if self._thread_error is not None:
+                continue
+            try:
+                self._file.write(chunk)
+            except Exception as error:
+                # Raised by the main thread, the next time it
+                # interacts with the worker thread.
+                self._thread_error = error
+
+    def _raise_thread_error(self):
+        """
+        Raise an error raised by the worker thread, if any.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        if self._thread_error is not None:
+            raise self._thread_error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._path!r})'
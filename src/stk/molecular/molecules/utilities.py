@@ -3,6 +3,8 @@ This module defines utilities for molecules.
 
 """
 
+import numpy as np
+
 
 def sort_bond_atoms_by_id(bond):
     if bond.get_atom1().get_id() < bond.get_atom2().get_id():
@@ -16,12 +18,79 @@ def sort_bond_atoms_by_id(bond):
         )
 
 
-def get_bond_atom_ids(bond):
-    return sorted((
-        bond.get_atom1().get_id(), 
-        bond.get_atom2().get_id(),
-    ))
+def get_bond_atom_id_matrix(bonds):
+    """
+    Get a matrix holding the atom ids of `bonds`.
+
+    Parameters
+    ----------
+    bonds : :class:`iterable` of :class:`.Bond`
+        The bonds whose atom ids are needed.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        A ``(m, 2)`` matrix of :class:`int`. Each row holds the ids
+        of the first and second atom of a bond.
+
+    """
+
+    return np.array(
+        [
+            (bond.get_atom1().get_id(), bond.get_atom2().get_id())
+            for bond in bonds
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+
+def get_sorted_bond_indices(bond_atom_ids):
+    """
+    Get the indices which sort bonds by their atom ids.
+
+    Bonds are sorted by their lower atom id first, and their higher
+    atom id second.
+
+    Parameters
+    ----------
+    bond_atom_ids : :class:`numpy.ndarray`
+        A ``(m, 2)`` matrix holding the atom ids of each bond.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The indices of the bonds, in sorted order.
+
+    """
+
+    bond_atom_ids = np.sort(bond_atom_ids, axis=1)
+    return np.lexsort((bond_atom_ids[:, 1], bond_atom_ids[:, 0]))
+
+
+class LazyComponent:
+    """
+    An attribute, which is loaded the first time it is accessed.
+
+    The value is loaded by calling the method of the ``_components``
+    attribute of the instance, which has the name of the attribute,
+    without its leading underscore, prefixed with ``get``. For
+    example, ``_atoms`` is loaded with ``_components.get_atoms()``.
+
+    The value is stored on the instance, under the name of the
+    attribute, so that later accesses do not go through the
+    descriptor. This also means that instances, which set the
+    attribute directly, never use the descriptor.
+
+    """
+
+    def __set_name__(self, owner, name):
+        self._name = name
+        self._getter_name = f'get{name}'
 
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
 
-def get_bond_info_atom_ids(bond_info):
-    return get_bond_atom_ids(bond_info.get_bond())
+        value = getattr(instance._components, self._getter_name)()
+        instance.__dict__[self._name] = value
+        return value
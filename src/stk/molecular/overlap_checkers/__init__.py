@@ -0,0 +1 @@
+from .overlap_checker import *  # noqa
@@ -0,0 +1,348 @@
+"""
+Overlap Checker
+===============
+
+"""
+
+import itertools as it
+import numpy as np
+
+from .utilities import covalent_radii
+from ..molecules.utilities import get_bond_atom_id_matrix
+
+# The number of candidate pairs filtered at a time.
+_chunk_size = 4096
+
+
+class OverlapChecker:
+    """
+    Finds overlapping building blocks in constructed molecules.
+
+    Two atoms overlap if they come from different building blocks,
+    are not bonded to each other and are closer than the sum of their
+    covalent radii, multiplied by a scale factor.
+
+    Examples
+    --------
+    *Finding Overlapping Atoms*
+
+    .. code-block:: python
+
+        import stk
+
+        cage = stk.ConstructedMolecule(
+            topology_graph=stk.cage.FourPlusSix(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    stk.BuildingBlock(
+                        smiles='Brc1cc(Br)cc(Br)c1',
+                        functional_groups=[stk.BromoFactory()],
+                    ),
+                ),
+            ),
+        )
+        overlap_checker = stk.OverlapChecker()
+        for atom1_id, atom2_id in overlap_checker.get_overlaps(cage):
+            print(atom1_id, atom2_id)
+
+    *Discarding Overlapping Molecules During an EA*
+
+    Because :meth:`has_overlaps` is a lot cheaper than most fitness
+    calculations, it can be used to discard broken molecules
+    before their fitness is calculated
+
+    .. code-block:: python
+
+        overlap_checker = stk.OverlapChecker()
+        ea = stk.EvolutionaryAlgorithm(
+            # Other parameters...
+            molecule_filter=(
+                lambda molecule:
+                    not overlap_checker.has_overlaps(molecule)
+            ),
+        )
+
+    *Using Custom Radii*
+
+    The radii are given in a :class:`dict`, which maps the atomic
+    number of an element to its radius
+
+    .. code-block:: python
+
+        overlap_checker = stk.OverlapChecker(
+            radii={**stk.OverlapChecker.get_default_radii(), 6: 0.8},
+            scale=0.9,
+        )
+
+    """
+
+    def __init__(self, radii=None, scale=1.0):
+        """
+        Initialize a :class:`.OverlapChecker` instance.
+
+        Parameters
+        ----------
+        radii : :class:`dict`, optional
+            Maps the atomic number of an element to its covalent
+            radius, in Angstroms. If ``None``, the radii given by
+            :meth:`get_default_radii` are used.
+
+        scale : :class:`float`, optional
+            The sum of the radii of two atoms is multiplied by this
+            value to get the distance below which the atoms overlap.
+
+        """
+
+        if radii is None:
+            radii = covalent_radii
+
+        self._radii = dict(radii)
+        self._scale = scale
+        # Index an array with an atomic number to get the radius of
+        # the element. Unknown elements have a radius of nan.
+        self._radius_array = np.full(
+            shape=max(self._radii, default=0)+1,
+            fill_value=np.nan,
+        )
+        self._radius_array[list(self._radii)] = list(
+            self._radii.values()
+        )
+
+    @staticmethod
+    def get_default_radii():
+        """
+        Get the default covalent radii.
+
+        The radii are taken from Cordero et al., Dalton Trans., 2008,
+        2832-2838.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the atomic number of an element to its covalent
+            radius, in Angstroms.
+
+        """
+
+        return dict(covalent_radii)
+
+    def get_overlaps(self, molecule, cell=None):
+        """
+        Yield the pairs of overlapping atoms in `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule`
+            The molecule to check.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the distance between the nearest periodic images of
+            atoms is used.
+
+        Yields
+        ------
+        :class:`tuple` of :class:`int`
+            The ids of two overlapping atoms. The smaller id is
+            always first and pairs are yielded in ascending order.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `molecule` holds an element which does not have a
+            radius.
+
+        """
+
+        for pairs in self._get_overlap_chunks(molecule, cell):
+            for atom1_id, atom2_id in pairs.tolist():
+                yield atom1_id, atom2_id
+
+    def has_overlaps(self, molecule, cell=None):
+        """
+        Check if `molecule` has any overlapping atoms.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule`
+            The molecule to check.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`, optional
+            The a, b and c vectors of a periodic cell. If provided,
+            the distance between the nearest periodic images of
+            atoms is used.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if `molecule` has overlapping atoms.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `molecule` holds an element which does not have a
+            radius.
+
+        """
+
+        return any(
+            pairs.size for pairs in self._get_overlap_chunks(molecule, cell)
+        )
+
+    def _get_overlap_chunks(self, molecule, cell):
+        """
+        Yield the pairs of overlapping atoms, a chunk at a time.
+
+        The candidate pairs are filtered :data:`_chunk_size` pairs at
+        a time, so that a caller who only needs the first overlap
+        does not pay for filtering all of them.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule`
+            The molecule to check.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`
+            The a, b and c vectors of a periodic cell. Can be
+            ``None``.
+
+        Yields
+        ------
+        :class:`numpy.ndarray`
+            A ``(n, 2)`` array of overlapping atom ids, which may be
+            empty. The smaller id is always first and the rows of
+            all chunks are in ascending order.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `molecule` holds an element which does not have a
+            radius.
+
+        """
+
+        atomic_numbers = np.array([
+            atom.get_atomic_number() for atom in molecule.get_atoms()
+        ], dtype=np.int64)
+        radii = self._get_radii(atomic_numbers)
+        if radii.size == 0:
+            return
+
+        candidates = molecule._get_atom_pairs_within(
+            distance=self._scale*2*radii.max(),
+            cell=cell,
+        )
+        building_block_ids = np.array([
+            -1 if info.get_building_block_id() is None
+            else info.get_building_block_id()
+            for info in molecule.get_atom_infos()
+        ])
+        position_matrix = molecule.get_position_matrix()
+        # Bonded atoms are not overlapping. Each pair is encoded as a
+        # single integer, so that the bonded pairs can be removed
+        # in one go.
+        num_atoms = molecule.get_num_atoms()
+        bonded = np.sort(
+            a=get_bond_atom_id_matrix(molecule.get_bonds()),
+            axis=1,
+        )
+        bonded = bonded[:, 0]*num_atoms + bonded[:, 1]
+
+        for start in range(0, len(candidates), _chunk_size):
+            pairs = candidates[start:start+_chunk_size]
+            pair_building_block_ids = building_block_ids[pairs]
+            pairs = pairs[
+                (pair_building_block_ids != -1).all(axis=1)
+                & (
+                    pair_building_block_ids[:, 0]
+                    != pair_building_block_ids[:, 1]
+                )
+            ]
+            distances = self._get_distances(
+                position_matrix=position_matrix,
+                pairs=pairs,
+                cell=cell,
+            )
+            pairs = pairs[
+                distances < self._scale*radii[pairs].sum(axis=1)
+            ]
+            yield pairs[np.isin(
+                element=pairs[:, 0]*num_atoms + pairs[:, 1],
+                test_elements=bonded,
+                invert=True,
+            )]
+
+    def _get_radii(self, atomic_numbers):
+        """
+        Get the radius of every atom.
+
+        Parameters
+        ----------
+        atomic_numbers : :class:`numpy.ndarray`
+            The atomic number of every atom.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The radius of every atom.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If an element does not have a radius.
+
+        """
+
+        known = atomic_numbers < len(self._radius_array)
+        radii = np.full(atomic_numbers.shape, np.nan)
+        radii[known] = self._radius_array[atomic_numbers[known]]
+        missing = np.unique(atomic_numbers[np.isnan(radii)])
+        if missing.size:
+            raise ValueError(
+                'No radius is available for the elements with atomic '
+                f'numbers {missing.tolist()}.'
+            )
+        return radii
+
+    @staticmethod
+    def _get_distances(position_matrix, pairs, cell):
+        """
+        Get the distance between the atoms of every pair.
+
+        Parameters
+        ----------
+        position_matrix : :class:`numpy.ndarray`
+            The position of every atom.
+
+        pairs : :class:`numpy.ndarray`
+            A ``(n, 2)`` array of atom ids.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`
+            The a, b and c vectors of a periodic cell. Can be
+            ``None``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The distance between the atoms of every pair. If `cell`
+            is provided, the distance between their nearest periodic
+            images is used.
+
+        """
+
+        displacements = (
+            position_matrix[pairs[:, 1]] - position_matrix[pairs[:, 0]]
+        )
+        if cell is None:
+            return np.linalg.norm(displacements, axis=1)
+
+        cell = np.array(cell, dtype=np.float64)
+        # Wrap the displacements into the cell and then check the
+        # neighbouring images, to find the nearest one.
+        fractional = displacements @ np.linalg.inv(cell)
+        displacements = (fractional - np.round(fractional)) @ cell
+        shifts = np.array(list(it.product((-1, 0, 1), repeat=3))) @ cell
+        return np.linalg.norm(
+            displacements[:, np.newaxis, :] + shifts,
+            axis=2,
+        ).min(axis=1)
@@ -279,7 +279,7 @@ class Cof(TopologyGraph):
 
         self._check_building_block_vertices(
             num_vertices=(
-                np.product(lattice_size)*len(self._vertex_prototypes)
+                np.prod(lattice_size)*len(self._vertex_prototypes)
             ),
             building_block_vertices=building_block_vertices,
         )
@@ -327,6 +327,55 @@ class Cof(TopologyGraph):
         clone._periodic = self._periodic
         return clone
 
+    def get_periodic_cell(self):
+        """
+        Get the periodic cell of the constructed molecule.
+
+        The cell spans the entire lattice, so that periodic images
+        of the constructed molecule are displaced by the returned
+        vectors.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`numpy.ndarray`
+            The a, b and c vectors of the cell.
+
+        Examples
+        --------
+        You want to find atoms in a periodic COF, which are close
+        to each other across the boundaries of the cell
+
+        .. code-block:: python
+
+            import stk
+
+            topology_graph = stk.cof.Honeycomb(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    stk.BuildingBlock(
+                        smiles='BrCC(CBr)CBr',
+                        functional_groups=[stk.BromoFactory()],
+                    ),
+                ),
+                lattice_size=(3, 3, 1),
+                periodic=True,
+            )
+            cof = stk.ConstructedMolecule(topology_graph)
+            close_atoms = tuple(cof.get_atom_pairs_within(
+                distance=1.,
+                cell=topology_graph.get_periodic_cell(),
+            ))
+
+        """
+
+        return tuple(
+            np.array(constant, dtype=np.float64)*self._scale*dim
+            for constant, dim in zip(
+                self._get_lattice_constants(),
+                self._lattice_size,
+            )
+        )
+
     def _get_edge_groups(self, edges):
         """
         Get the edge groups for the COF.
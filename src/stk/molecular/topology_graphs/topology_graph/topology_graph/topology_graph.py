@@ -323,23 +323,36 @@ class TopologyGraph:
 
         """
 
+        yielded = set()
+        for building_block in self._get_vertex_building_blocks():
+            if building_block not in yielded:
+                yielded.add(building_block)
+                yield building_block
+
+    def _get_vertex_building_blocks(self):
+        """
+        Get the building block placed on each vertex.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.BuildingBlock`
+            The building block placed on each vertex, ordered by
+            vertex id.
+
+        """
+
         vertex_building_blocks = {}
-        num_vertices = 0
         for building_block, vertices in (
             self._building_block_vertices.items()
         ):
             for vertex in vertices:
-                num_vertices += 1
                 vertex_building_blocks[vertex.get_id()] = (
                     building_block
                 )
-
-        yielded = set()
-        for vertex_id in range(num_vertices):
-            building_block = vertex_building_blocks[vertex_id]
-            if building_block not in yielded:
-                yielded.add(building_block)
-                yield building_block
+        return tuple(
+            vertex_building_blocks[vertex_id]
+            for vertex_id in range(len(vertex_building_blocks))
+        )
 
     def get_num_building_block(self, building_block):
         """
@@ -1 +1,2 @@
 from .json import *  # noqa
+from .binary import *  # noqa
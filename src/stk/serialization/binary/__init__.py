@@ -0,0 +1,2 @@
+from .serializers import *  # noqa
+from .deserializers import *  # noqa
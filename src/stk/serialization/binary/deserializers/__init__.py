@@ -0,0 +1,4 @@
+from .molecule import MoleculeBinaryDeserializer  # noqa
+from .constructed_molecule import (  # noqa
+    ConstructedMoleculeBinaryDeserializer,
+)
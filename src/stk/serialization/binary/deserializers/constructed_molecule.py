@@ -0,0 +1,234 @@
+"""
+Constructed Molecule Binary Deserializer
+========================================
+
+"""
+
+from stk.molecular import ConstructedMolecule, AtomInfo, BondInfo
+
+from ..utilities import from_bytes, paused_garbage_collection
+from .utilities import to_atoms, to_bonds, to_infos
+from .molecule import MoleculeBinaryDeserializer
+
+
+class ConstructedMoleculeBinaryDeserializer:
+    """
+    Creates constructed molecules from the output of a binary serializer.
+
+    As with :class:`.MoleculeBinaryDeserializer`, the arrays held by
+    the data are used without being copied, so the data must not be
+    modified while the constructed molecule is in use.
+
+    See Also
+    --------
+    :class:`.ConstructedMoleculeBinarySerializer`
+
+    """
+
+    def __init__(self, lazy=False):
+        """
+        Initialize a :class:`.ConstructedMoleculeBinaryDeserializer`.
+
+        Parameters
+        ----------
+        lazy : :class:`bool`, optional
+            If ``True``, the atoms, bonds, atom infos, bond infos and
+            building blocks of a constructed molecule are only
+            created from the data the first time they are needed.
+            Creating a clone of the constructed molecule, which all
+            ``with_*`` methods do, creates all of them.
+
+        """
+
+        self._deserializer = MoleculeBinaryDeserializer()
+        self._lazy = lazy
+
+    def from_bytes(self, data):
+        """
+        Get a :class:`.ConstructedMolecule` from its binary representation.
+
+        Parameters
+        ----------
+        data : :class:`bytes`
+            The output of
+            :meth:`.ConstructedMoleculeBinarySerializer.to_bytes`.
+            Any object supporting the buffer protocol, such as a
+            :class:`memoryview` or a :class:`mmap.mmap`, can be used.
+
+        Returns
+        -------
+        :class:`.ConstructedMolecule`
+            The constructed molecule held in `data`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `data` does not hold a constructed molecule.
+
+        """
+
+        arrays = from_bytes(data, 'ConstructedMolecule')
+        components = _Components(arrays, self._deserializer)
+        if self._lazy:
+            return ConstructedMolecule._init_lazily(
+                position_matrix=arrays['position_matrix'],
+                components=components,
+            )
+
+        with paused_garbage_collection():
+            return ConstructedMolecule._init_from_components(
+                atoms=components.get_atoms(),
+                bonds=components.get_bonds(),
+                position_matrix=arrays['position_matrix'],
+                atom_infos=components.get_atom_infos(),
+                bond_infos=components.get_bond_infos(),
+                num_building_blocks=components.get_num_building_blocks(),
+            )
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        lazy = 'lazy=True' if self._lazy else ''
+        return f'{self.__class__.__name__}({lazy})'
+
+
+class _Components:
+    """
+    Creates the components of a constructed molecule from its arrays.
+
+    """
+
+    def __init__(self, arrays, deserializer):
+        """
+        Initialize a :class:`._Components` instance.
+
+        Parameters
+        ----------
+        arrays : :class:`dict`
+            The arrays of the constructed molecule.
+
+        deserializer : :class:`.MoleculeBinaryDeserializer`
+            Used to create the building blocks.
+
+        """
+
+        self._arrays = arrays
+        self._deserializer = deserializer
+        self._atoms = None
+        self._bonds = None
+        self._building_blocks = None
+
+    def get_atoms(self):
+        """
+        Get the atoms of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Atom`
+            The atoms, created on the first call.
+
+        """
+
+        if self._atoms is None:
+            with paused_garbage_collection():
+                self._atoms = to_atoms(self._arrays)
+        return self._atoms
+
+    def get_bonds(self):
+        """
+        Get the bonds of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Bond`
+            The bonds, created on the first call.
+
+        """
+
+        if self._bonds is None:
+            atoms = self.get_atoms()
+            with paused_garbage_collection():
+                self._bonds = to_bonds(atoms, self._arrays)
+        return self._bonds
+
+    def get_atom_infos(self):
+        """
+        Get the atom infos of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.AtomInfo`
+            An info for each atom, in the order of the atoms.
+
+        """
+
+        building_blocks = self._get_building_blocks()
+        atoms = self.get_atoms()
+        with paused_garbage_collection():
+            return to_infos(
+                info_type=AtomInfo,
+                items=atoms,
+                building_blocks=building_blocks,
+                indices=self._arrays['atom_info_building_blocks'],
+                ids=self._arrays['atom_info_building_block_ids'],
+            )
+
+    def get_bond_infos(self):
+        """
+        Get the bond infos of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.BondInfo`
+            An info for each bond, in the order of the bonds.
+
+        """
+
+        building_blocks = self._get_building_blocks()
+        bonds = self.get_bonds()
+        with paused_garbage_collection():
+            return to_infos(
+                info_type=BondInfo,
+                items=bonds,
+                building_blocks=building_blocks,
+                indices=self._arrays['bond_info_building_blocks'],
+                ids=self._arrays['bond_info_building_block_ids'],
+            )
+
+    def get_num_building_blocks(self):
+        """
+        Get the number of times each building block was used.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps each :class:`.Molecule` building block to the number
+            of times it was used in the construction.
+
+        """
+
+        return dict(zip(
+            self._get_building_blocks(),
+            self._arrays['num_building_blocks'].tolist(),
+        ))
+
+    def _get_building_blocks(self):
+        """
+        Get the building blocks of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Molecule`
+            The building blocks, created on the first call.
+
+        """
+
+        if self._building_blocks is None:
+            data = self._arrays['building_blocks'].data
+            offsets = self._arrays['building_block_offsets'].tolist()
+            self._building_blocks = tuple(
+                self._deserializer.from_bytes(data[start:end])
+                for start, end in zip(offsets, offsets[1:])
+            )
+        return self._building_blocks
@@ -0,0 +1,79 @@
+"""
+Molecule Binary Deserializer
+============================
+
+"""
+
+from stk.molecular import Molecule
+
+from ..utilities import from_bytes, paused_garbage_collection
+from .utilities import to_atoms, to_bonds
+
+
+class MoleculeBinaryDeserializer:
+    """
+    Creates molecules from the output of a binary serializer.
+
+    The arrays held by the data are used without being copied, so
+    the position matrix of a deserialized molecule is a view of the
+    data. This means that the data must not be modified while the
+    molecule is in use.
+
+    See Also
+    --------
+    :class:`.MoleculeBinarySerializer`
+
+    Examples
+    --------
+    *Loading a Molecule*
+
+    .. code-block:: python
+
+        import stk
+
+        deserializer = stk.MoleculeBinaryDeserializer()
+        with open('molecule.stkb', 'rb') as f:
+            molecule = deserializer.from_bytes(f.read())
+
+    """
+
+    def from_bytes(self, data):
+        """
+        Get a :class:`.Molecule` from its binary representation.
+
+        Parameters
+        ----------
+        data : :class:`bytes`
+            The output of :meth:`.MoleculeBinarySerializer.to_bytes`.
+            Any object supporting the buffer protocol, such as a
+            :class:`memoryview` or a :class:`mmap.mmap`, can be used.
+
+        Returns
+        -------
+        :class:`.Molecule`
+            The molecule held in `data`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `data` does not hold a molecule.
+
+        """
+
+        arrays = from_bytes(data, 'Molecule')
+        with paused_garbage_collection():
+            atoms = to_atoms(arrays)
+            bonds = to_bonds(atoms, arrays)
+        molecule = Molecule.__new__(Molecule)
+        molecule._init(
+            atoms=atoms,
+            bonds=bonds,
+            position_matrix=arrays['position_matrix'],
+        )
+        return molecule
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
@@ -0,0 +1,120 @@
+from stk.molecular import Atom, Bond, AtomInfo, BondInfo
+
+
+def to_atoms(arrays):
+    """
+    Get the atoms held by arrays.
+
+    Parameters
+    ----------
+    arrays : :class:`dict`
+        The arrays of a molecule.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`.Atom`
+        The atoms.
+
+    """
+
+    atomic_numbers = arrays['atomic_numbers'].tolist()
+    return tuple(map(
+        Atom,
+        range(len(atomic_numbers)),
+        atomic_numbers,
+        arrays['charges'].tolist(),
+    ))
+
+
+def to_bonds(atoms, arrays):
+    """
+    Get the bonds held by arrays.
+
+    Parameters
+    ----------
+    atoms : :class:`tuple` of :class:`.Atom`
+        The atoms of the molecule.
+
+    arrays : :class:`dict`
+        The arrays of the molecule.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`.Bond`
+        The bonds.
+
+    """
+
+    bond_atom_ids = arrays['bond_atom_ids']
+    return tuple(map(
+        Bond,
+        map(atoms.__getitem__, bond_atom_ids[:, 0].tolist()),
+        map(atoms.__getitem__, bond_atom_ids[:, 1].tolist()),
+        _to_orders(arrays['bond_orders']),
+        map(tuple, arrays['bond_periodicities'].tolist()),
+    ))
+
+
+def to_infos(info_type, items, building_blocks, indices, ids):
+    """
+    Get atom or bond infos.
+
+    Parameters
+    ----------
+    info_type : :class:`type`
+        Either :class:`.AtomInfo` or :class:`.BondInfo`.
+
+    items : :class:`tuple`
+        The atoms or bonds, which the infos are about.
+
+    building_blocks : :class:`tuple` of :class:`.Molecule`
+        The building blocks of the constructed molecule.
+
+    indices : :class:`numpy.ndarray`
+        The index of the building block of each info, or ``-1``
+        if the info has no building block.
+
+    ids : :class:`numpy.ndarray`
+        The building block id of each info, or ``-1`` if the info
+        has no building block id.
+
+    Returns
+    -------
+    :class:`tuple`
+        The infos.
+
+    """
+
+    building_blocks = (*building_blocks, None)
+    return tuple(map(
+        info_type,
+        items,
+        # -1 indexes the None at the end of building_blocks.
+        map(building_blocks.__getitem__, indices.tolist()),
+        (None if id == -1 else id for id in ids.tolist()),
+    ))
+
+
+def _to_orders(orders):
+    """
+    Get bond orders, using :class:`int` for integral values.
+
+    Parameters
+    ----------
+    orders : :class:`numpy.ndarray`
+        The bond orders.
+
+    Returns
+    -------
+    :class:`list`
+        The bond orders.
+
+    """
+
+    if (orders == orders.round()).all():
+        return orders.astype(int).tolist()
+    return [
+        int(order) if order.is_integer() else order
+        for order in orders.tolist()
+    ]
+
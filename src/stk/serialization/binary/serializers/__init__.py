@@ -0,0 +1,4 @@
+from .molecule import MoleculeBinarySerializer  # noqa
+from .constructed_molecule import (  # noqa
+    ConstructedMoleculeBinarySerializer,
+)
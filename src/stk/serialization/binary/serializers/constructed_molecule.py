@@ -0,0 +1,129 @@
+"""
+Constructed Molecule Binary Serializer
+======================================
+
+"""
+
+import numpy as np
+
+from ..utilities import to_bytes
+from .molecule import get_arrays
+
+
+class ConstructedMoleculeBinarySerializer:
+    """
+    Serializes constructed molecules into a compact binary format.
+
+    On top of the data stored by :class:`.MoleculeBinarySerializer`,
+    the atom and bond infos are stored as arrays of building block
+    indices and ids, and each building block is stored as a nested
+    :class:`.MoleculeBinarySerializer` buffer.
+
+    See Also
+    --------
+    :class:`.MoleculeBinarySerializer`
+
+    Examples
+    --------
+    *Saving a Constructed Molecule*
+
+    .. code-block:: python
+
+        import stk
+
+        polymer = stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                ),
+                repeating_unit='A',
+                num_repeating_units=3,
+            ),
+        )
+        serializer = stk.ConstructedMoleculeBinarySerializer()
+        data = serializer.to_bytes(polymer)
+
+        deserializer = stk.ConstructedMoleculeBinaryDeserializer()
+        polymer = deserializer.from_bytes(data)
+
+    """
+
+    def to_bytes(self, molecule):
+        """
+        Serialize `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule`
+            The constructed molecule to serialize.
+
+        Returns
+        -------
+        :class:`bytes`
+            The binary representation of `molecule`.
+
+        """
+
+        building_blocks = tuple(molecule.get_building_blocks())
+        building_block_indices = {
+            building_block: index
+            for index, building_block in enumerate(building_blocks)
+        }
+        # Missing building blocks and ids are stored as -1.
+        building_block_indices[None] = -1
+
+        def get_info_arrays(infos):
+            infos = tuple(infos)
+            return (
+                np.fromiter(
+                    (
+                        building_block_indices[info.get_building_block()]
+                        for info in infos
+                    ),
+                    dtype='<i4',
+                    count=len(infos),
+                ),
+                np.fromiter(
+                    (
+                        -1 if info.get_building_block_id() is None
+                        else info.get_building_block_id()
+                        for info in infos
+                    ),
+                    dtype='<i4',
+                    count=len(infos),
+                ),
+            )
+
+        building_block_buffers = [
+            to_bytes('Molecule', get_arrays(building_block))
+            for building_block in building_blocks
+        ]
+        arrays = get_arrays(molecule)
+        (
+            arrays['atom_info_building_blocks'],
+            arrays['atom_info_building_block_ids'],
+        ) = get_info_arrays(molecule.get_atom_infos())
+        (
+            arrays['bond_info_building_blocks'],
+            arrays['bond_info_building_block_ids'],
+        ) = get_info_arrays(molecule.get_bond_infos())
+        arrays['num_building_blocks'] = np.fromiter(
+            map(molecule.get_num_building_block, building_blocks),
+            dtype='<i8',
+            count=len(building_blocks),
+        )
+        arrays['building_block_offsets'] = np.cumsum(
+            [0, *map(len, building_block_buffers)],
+            dtype='<i8',
+        )
+        arrays['building_blocks'] = np.frombuffer(
+            b''.join(building_block_buffers),
+            dtype='<u1',
+        )
+        return to_bytes('ConstructedMolecule', arrays)
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
@@ -0,0 +1,116 @@
+"""
+Molecule Binary Serializer
+==========================
+
+"""
+
+import numpy as np
+
+from ..utilities import to_bytes
+
+
+class MoleculeBinarySerializer:
+    """
+    Serializes molecules into a compact binary format.
+
+    Unlike :class:`.MoleculeJsonizer`, no Python object is created
+    for any atom, bond or position. Instead, the atomic numbers,
+    charges, bonds and positions are stored as raw little-endian
+    buffers, following a small JSON header, which describes them.
+    This means that :class:`.MoleculeBinaryDeserializer` can view
+    the buffers directly, and the time taken to serialize a large
+    molecule is dominated by copying memory.
+
+    See Also
+    --------
+    :class:`.ConstructedMoleculeBinarySerializer`
+
+    Examples
+    --------
+    *Saving a Molecule*
+
+    .. code-block:: python
+
+        import stk
+
+        serializer = stk.MoleculeBinarySerializer()
+        with open('molecule.stkb', 'wb') as f:
+            f.write(serializer.to_bytes(stk.BuildingBlock('NCCN')))
+
+        deserializer = stk.MoleculeBinaryDeserializer()
+        with open('molecule.stkb', 'rb') as f:
+            molecule = deserializer.from_bytes(f.read())
+
+    """
+
+    def to_bytes(self, molecule):
+        """
+        Serialize `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule to serialize.
+
+        Returns
+        -------
+        :class:`bytes`
+            The binary representation of `molecule`.
+
+        """
+
+        return to_bytes('Molecule', get_arrays(molecule))
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+
+def get_arrays(molecule):
+    """
+    Get the arrays which describe a molecule.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule.
+
+    Returns
+    -------
+    :class:`dict`
+        Maps the name of each array to the array.
+
+    """
+
+    return {
+        'atomic_numbers': np.fromiter(
+            (atom.get_atomic_number() for atom in molecule.get_atoms()),
+            dtype='<u1',
+            count=molecule.get_num_atoms(),
+        ),
+        'charges': np.fromiter(
+            (atom.get_charge() for atom in molecule.get_atoms()),
+            dtype='<i4',
+            count=molecule.get_num_atoms(),
+        ),
+        # Stored with the layout of Molecule._position_matrix, so
+        # that it can be used without copying.
+        'position_matrix': np.ascontiguousarray(
+            molecule.get_position_matrix().T,
+            dtype='<f8',
+        ),
+        'bond_atom_ids': (
+            molecule._get_bond_atom_id_matrix().astype('<i4')
+        ),
+        'bond_orders': np.fromiter(
+            (bond.get_order() for bond in molecule.get_bonds()),
+            dtype='<f8',
+            count=molecule.get_num_bonds(),
+        ),
+        'bond_periodicities': np.array(
+            [bond.get_periodicity() for bond in molecule.get_bonds()],
+            dtype='<i1',
+        ).reshape(-1, 3),
+    }
@@ -0,0 +1,162 @@
+import gc
+import json
+import struct
+from contextlib import contextmanager
+
+import numpy as np
+
+# Identifies the format.
+_magic = b'STKBIN01'
+# The byte boundary each array is aligned to.
+_alignment = 8
+
+
+def to_bytes(type_name, arrays):
+    """
+    Pack arrays into the binary format.
+
+    The data starts with :data:`_magic` and the size of the header,
+    followed by the header, which is a JSON holding `type_name` and
+    the dtype, shape and offset of every array. The raw little-endian
+    buffers of the arrays follow the header.
+
+    Parameters
+    ----------
+    type_name : :class:`str`
+        The name of the serialized type.
+
+    arrays : :class:`dict`
+        Maps the name of each array to the array. Every array must
+        have a little-endian dtype.
+
+    Returns
+    -------
+    :class:`bytes`
+        The packed data.
+
+    """
+
+    header = {
+        'type': type_name,
+        'arrays': {},
+    }
+    # Offsets are relative to the end of the header, so that they
+    # do not depend on its size.
+    offset = 0
+    buffers = []
+    for name, array in arrays.items():
+        padding = _align(offset) - offset
+        buffers.append(bytes(padding))
+        offset += padding
+        header['arrays'][name] = {
+            'dtype': array.dtype.str,
+            'shape': array.shape,
+            'offset': offset,
+        }
+        buffers.append(np.ascontiguousarray(array).tobytes())
+        offset += array.nbytes
+
+    prefix_size = len(_magic) + 8
+    header = json.dumps(header, separators=(',', ':')).encode()
+    header = header.ljust(_align(prefix_size+len(header)) - prefix_size)
+    return b''.join((
+        _magic,
+        struct.pack('<Q', len(header)),
+        header,
+        *buffers,
+    ))
+
+
+def from_bytes(data, type_name):
+    """
+    Unpack arrays from the binary format.
+
+    Parameters
+    ----------
+    data : :class:`bytes`
+        The packed data. Any object supporting the buffer protocol,
+        such as a :class:`memoryview` or a :class:`mmap.mmap`, can
+        be used.
+
+    type_name : :class:`str`
+        The name of the serialized type `data` must hold.
+
+    Returns
+    -------
+    :class:`dict`
+        Maps the name of each array to the array. The arrays view
+        `data`, rather than copy it.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If `data` does not hold an instance of `type_name`.
+
+    """
+
+    data = memoryview(data).cast('B')
+    prefix_size = len(_magic) + 8
+    if bytes(data[:len(_magic)]) != _magic:
+        raise ValueError('The data is not in the stk binary format.')
+
+    header_size, = struct.unpack('<Q', data[len(_magic):prefix_size])
+    data_start = prefix_size + header_size
+    header = json.loads(bytes(data[prefix_size:data_start]))
+    if header['type'] != type_name:
+        raise ValueError(
+            f'The data holds a {header["type"]}, not a {type_name}.'
+        )
+
+    return {
+        name: np.frombuffer(
+            buffer=data,
+            dtype=array['dtype'],
+            count=int(np.prod(array['shape'], dtype=np.int64)),
+            offset=data_start+array['offset'],
+        ).reshape(array['shape'])
+        for name, array in header['arrays'].items()
+    }
+
+
+@contextmanager
+def paused_garbage_collection():
+    """
+    Pause the garbage collector, while the context is active.
+
+    Deserialization creates many objects, none of which are garbage,
+    but the creation of each one counts towards triggering a
+    collection. For large molecules, these collections take up most
+    of the time spent deserializing.
+
+    Yields
+    ------
+    None : :class:`NoneType`
+
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _align(size):
+    """
+    Round `size` up to the next multiple of :data:`_alignment`.
+
+    Parameters
+    ----------
+    size : :class:`int`
+        The size to round.
+
+    Returns
+    -------
+    :class:`int`
+        The rounded size.
+
+    """
+
+    return -(-size // _alignment) * _alignment
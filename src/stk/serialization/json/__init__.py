@@ -1,2 +1,3 @@
 from .serializers import *  # noqa
 from .deserializers import *  # noqa
+from .json_lines import *  # noqa
@@ -7,7 +7,14 @@ Constructed Molecule DeJSONizer
 import numpy as np
 from stk.molecular import ConstructedMolecule
 
-from .utilities import to_atom, to_bond, to_atom_info, to_bond_info
+from .utilities import (
+    to_atoms,
+    to_bonds,
+    to_atom_info,
+    to_bond_info,
+    to_position_matrix,
+    to_info_jsons,
+)
 from .molecule import MoleculeDejsonizer
 
 
@@ -27,15 +34,59 @@ class ConstructedMoleculeDejsonizer:
     subclasses. However, the default implementation can be used
     directly, if it suits your needs.
 
+    Examples
+    --------
+    *Loading Constructed Molecules Lazily*
+
+    If only some parts of the constructed molecules are needed, for
+    example their position matrices or building blocks, the
+    dejsonizer can delay the creation of everything else until it
+    is first used
+
+    .. code-block:: python
+
+        import stk
+
+        dejsonizer = stk.ConstructedMoleculeDejsonizer(lazy=True)
+        polymer = dejsonizer.from_json(
+            json=stk.ConstructedMoleculeJsonizer().to_json(
+                molecule=stk.ConstructedMolecule(
+                    topology_graph=stk.polymer.Linear(
+                        building_blocks=(
+                            stk.BuildingBlock(
+                                smiles='BrCCBr',
+                                functional_groups=[stk.BromoFactory()],
+                            ),
+                        ),
+                        repeating_unit='A',
+                        num_repeating_units=3,
+                    ),
+                ),
+            ),
+        )
+        # No atoms, bonds or atom and bond infos are created.
+        position_matrix = polymer.get_position_matrix()
+        building_blocks = tuple(polymer.get_building_blocks())
+
     """
 
-    def __init__(self):
+    def __init__(self, lazy=False):
         """
         Initialize a :class:`.ConstructedMoleculeDejsonizer` instance.
 
+        Parameters
+        ----------
+        lazy : :class:`bool`, optional
+            If ``True``, the atoms, bonds, atom infos, bond infos and
+            building blocks of a constructed molecule are only
+            created from the JSON the first time they are needed.
+            Creating a clone of the constructed molecule, which all
+            ``with_*`` methods do, creates all of them.
+
         """
 
         self._dejsonizer = MoleculeDejsonizer()
+        self._lazy = lazy
 
     def from_json(self, json):
         """
@@ -53,53 +104,170 @@ class ConstructedMoleculeDejsonizer:
 
         """
 
-        building_blocks = tuple(map(
-            self._dejsonizer.from_json,
-            json['buildingBlocks'],
-        ))
-
-        num_building_blocks = (
-            (building_block, num)
-            for building_block, num in zip(
-                building_blocks,
-                json['constructedMolecule']['nBB'],
+        components = _Components(json, self._dejsonizer)
+        position_matrix = to_position_matrix(json['matrix'])
+        if self._lazy:
+            return ConstructedMolecule._init_lazily(
+                # Transposed, see Molecule._init().
+                position_matrix=np.ascontiguousarray(position_matrix.T),
+                components=components,
             )
-        )
-        atoms = tuple(
-            to_atom(atom_id, atom_json)
-            for atom_id, atom_json in enumerate(json['molecule']['a'])
-        )
-        bonds = tuple(
-            to_bond(atoms, bond_json)
-            for bond_json in json['molecule']['b']
-        )
+
         return ConstructedMolecule.init(
-            atoms=atoms,
-            bonds=bonds,
-            position_matrix=np.array(json['matrix']['m']),
-            atom_infos=tuple(
-                to_atom_info(
-                    building_blocks=building_blocks,
-                    atom=atoms[atom_id],
-                    json=atom_info_json,
-                )
-                for atom_id, atom_info_json
-                in enumerate(json['constructedMolecule']['aI'])
-            ),
-            bond_infos=tuple(
-                to_bond_info(
-                    building_blocks=building_blocks,
-                    bond=bonds[bond_id],
-                    json=bond_info_json,
-                )
-                for bond_id, bond_info_json
-                in enumerate(json['constructedMolecule']['bI'])
-            ),
-            num_building_blocks=num_building_blocks,
+            atoms=components.get_atoms(),
+            bonds=components.get_bonds(),
+            position_matrix=position_matrix,
+            atom_infos=components.get_atom_infos(),
+            bond_infos=components.get_bond_infos(),
+            num_building_blocks=components.get_num_building_blocks(),
         )
 
     def __str__(self):
         return repr(self)
 
     def __repr__(self):
-        return f'{self.__class__.__name__}()'
+        lazy = 'lazy=True' if self._lazy else ''
+        return f'{self.__class__.__name__}({lazy})'
+
+
+class _Components:
+    """
+    Creates the components of a constructed molecule from its JSON.
+
+    """
+
+    def __init__(self, json, dejsonizer):
+        """
+        Initialize a :class:`._Components` instance.
+
+        Parameters
+        ----------
+        json : :class:`dict`
+            A JSON of the constructed molecule.
+
+        dejsonizer : :class:`.MoleculeDejsonizer`
+            Used to create the building blocks.
+
+        """
+
+        self._json = json
+        self._dejsonizer = dejsonizer
+        self._atoms = None
+        self._bonds = None
+        self._building_blocks = None
+
+    def get_atoms(self):
+        """
+        Get the atoms of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Atom`
+            The atoms, created on the first call.
+
+        """
+
+        if self._atoms is None:
+            self._atoms = to_atoms(self._json['molecule'])
+        return self._atoms
+
+    def get_bonds(self):
+        """
+        Get the bonds of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Bond`
+            The bonds, created on the first call.
+
+        """
+
+        if self._bonds is None:
+            atoms = self.get_atoms()
+            self._bonds = to_bonds(atoms, self._json['molecule'])
+        return self._bonds
+
+    def get_atom_infos(self):
+        """
+        Get the atom infos of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.AtomInfo`
+            An info for each atom, in the order of the atoms.
+
+        """
+
+        building_blocks = self._get_building_blocks()
+        atoms = self.get_atoms()
+        return tuple(
+            to_atom_info(
+                building_blocks=building_blocks,
+                atom=atoms[atom_id],
+                json=atom_info_json,
+            )
+            for atom_id, atom_info_json in enumerate(to_info_jsons(
+                json=self._json['constructedMolecule'],
+                name='aI',
+            ))
+        )
+
+    def get_bond_infos(self):
+        """
+        Get the bond infos of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.BondInfo`
+            An info for each bond, in the order of the bonds.
+
+        """
+
+        building_blocks = self._get_building_blocks()
+        bonds = self.get_bonds()
+        return tuple(
+            to_bond_info(
+                building_blocks=building_blocks,
+                bond=bonds[bond_id],
+                json=bond_info_json,
+            )
+            for bond_id, bond_info_json in enumerate(to_info_jsons(
+                json=self._json['constructedMolecule'],
+                name='bI',
+            ))
+        )
+
+    def get_num_building_blocks(self):
+        """
+        Get the number of times each building block was used.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps each :class:`.Molecule` building block to the number
+            of times it was used in the construction.
+
+        """
+
+        return dict(zip(
+            self._get_building_blocks(),
+            self._json['constructedMolecule']['nBB'],
+        ))
+
+    def _get_building_blocks(self):
+        """
+        Get the building blocks of the constructed molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Molecule`
+            The building blocks, created on the first call.
+
+        """
+
+        if self._building_blocks is None:
+            self._building_blocks = tuple(map(
+                self._dejsonizer.from_json,
+                self._json['buildingBlocks'],
+            ))
+        return self._building_blocks
@@ -4,10 +4,9 @@ Molecule DeJSONizer
 
 """
 
-import numpy as np
 from stk.molecular import Molecule
 
-from .utilities import to_atom, to_bond
+from .utilities import to_atoms, to_bonds, to_position_matrix
 
 
 class MoleculeDejsonizer:
@@ -44,17 +43,11 @@ class MoleculeDejsonizer:
 
         """
 
-        atoms = tuple(
-            to_atom(atom_id, atom_json)
-            for atom_id, atom_json in enumerate(json['molecule']['a'])
-        )
+        atoms = to_atoms(json['molecule'])
         return Molecule(
             atoms=atoms,
-            bonds=tuple(
-                to_bond(atoms, bond_json)
-                for bond_json in json['molecule']['b']
-            ),
-            position_matrix=np.array(json['matrix']['m']),
+            bonds=to_bonds(atoms, json['molecule']),
+            position_matrix=to_position_matrix(json['matrix']),
         )
 
     def __str__(self):
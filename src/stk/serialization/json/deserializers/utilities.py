@@ -1,3 +1,7 @@
+import base64
+import itertools as it
+
+import numpy as np
 from stk.molecular import Atom, Bond, AtomInfo, BondInfo
 
 
@@ -36,3 +40,60 @@ def to_bond_info(building_blocks, bond, json):
         ),
         building_block_id=json[1],
     )
+
+
+def to_atoms(json):
+    if json.get('v', 1) == 1:
+        return tuple(
+            to_atom(atom_id, atom_json)
+            for atom_id, atom_json in enumerate(json['a'])
+        )
+
+    charges = [0]*len(json['a'])
+    for atom_id, charge in zip(*json['c']):
+        charges[atom_id] = charge
+    return tuple(map(
+        Atom,
+        range(len(json['a'])),
+        json['a'],
+        charges,
+    ))
+
+
+def to_bonds(atoms, json):
+    if json.get('v', 1) == 1:
+        return tuple(to_bond(atoms, bond_json) for bond_json in json['b'])
+
+    periodicities = [(0, 0, 0)]*len(json['o'])
+    bond_ids, directions = json['p']
+    for index, bond_id in enumerate(bond_ids):
+        periodicities[bond_id] = tuple(directions[3*index:3*index+3])
+    return tuple(map(
+        Bond,
+        map(atoms.__getitem__, json['b'][0::2]),
+        map(atoms.__getitem__, json['b'][1::2]),
+        json['o'],
+        periodicities,
+    ))
+
+
+def to_position_matrix(json):
+    if isinstance(json['m'], str):
+        # Version 2 holds base64 encoded float64 values.
+        return np.frombuffer(
+            buffer=base64.b64decode(json['m']),
+            dtype='<f8',
+        ).reshape(-1, 3).astype(np.float64)
+    return np.array(json['m'], dtype=np.float64)
+
+
+def to_info_jsons(json, name):
+    if json.get('v', 1) == 1:
+        return json[name]
+    # Version 2 holds the run-length encoding of the infos, as a
+    # column of building block indices, a column of building block
+    # ids and a column of run lengths.
+    return it.chain.from_iterable(
+        it.repeat((index, id_), length)
+        for index, id_, length in zip(*json[name])
+    )
@@ -0,0 +1,2 @@
+from .writer import JsonLinesWriter  # noqa
+from .reader import JsonLinesReader  # noqa
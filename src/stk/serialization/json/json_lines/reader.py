@@ -0,0 +1,120 @@
+"""
+JSON Lines Reader
+=================
+
+"""
+
+import json
+
+from ..deserializers import (
+    MoleculeDejsonizer,
+    ConstructedMoleculeDejsonizer,
+)
+from .utilities import open_file
+
+
+class JsonLinesReader:
+    """
+    Streams molecules out of a JSON lines file.
+
+    The file is written by a :class:`.JsonLinesWriter`. Molecules are
+    read one line at a time, so only the current molecule, and the
+    JSONs of the building blocks read so far, are kept in memory.
+
+    Examples
+    --------
+    *Reading an Archived Population*
+
+    .. code-block:: python
+
+        import stk
+
+        reader = stk.JsonLinesReader('population.jsonl.gz')
+        for molecule in reader.get_molecules():
+            print(molecule.get_num_atoms())
+
+    """
+
+    def __init__(
+        self,
+        path,
+        molecule_dejsonizer=MoleculeDejsonizer(),
+        constructed_molecule_dejsonizer=(
+            ConstructedMoleculeDejsonizer()
+        ),
+    ):
+        """
+        Initialize a :class:`.JsonLinesReader` instance.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the file from which molecules are read. If
+            it ends with ``.gz``, the file is decompressed.
+
+        molecule_dejsonizer : :class:`.MoleculeDejsonizer`, optional
+            Used to create molecules, which are not
+            :class:`.ConstructedMolecule` instances.
+
+        constructed_molecule_dejsonizer : \
+                :class:`.ConstructedMoleculeDejsonizer`, optional
+            Used to create constructed molecules.
+
+        """
+
+        self._path = path
+        self._molecule_dejsonizer = molecule_dejsonizer
+        self._constructed_molecule_dejsonizer = (
+            constructed_molecule_dejsonizer
+        )
+
+    def get_molecules(self):
+        """
+        Yield the molecules in the file.
+
+        Yields
+        ------
+        :class:`.Molecule`
+            A molecule, in the order it was written.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If a constructed molecule refers to a building block,
+            which has not been written before it.
+
+        """
+
+        # Maps the id of each building block record to the record.
+        building_blocks = {}
+        with open_file(self._path, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                if line.isspace():
+                    continue
+
+                record = json.loads(line)
+                if 'buildingBlock' in record:
+                    building_blocks[record.pop('buildingBlock')] = record
+                elif 'constructedMolecule' in record:
+                    try:
+                        record['buildingBlocks'] = tuple(
+                            building_blocks[id_]
+                            for id_ in record['buildingBlocks']
+                        )
+                    except KeyError as error:
+                        raise ValueError(
+                            f'Line {line_number} of {self._path} '
+                            f'refers to building block {error}, which '
+                            'is not defined before it.'
+                        )
+                    yield self._constructed_molecule_dejsonizer.from_json(
+                        json=record,
+                    )
+                else:
+                    yield self._molecule_dejsonizer.from_json(record)
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._path!r})'
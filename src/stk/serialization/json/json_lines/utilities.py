@@ -0,0 +1,31 @@
+import functools
+import gzip
+
+
+def open_file(path, mode):
+    """
+    Open a JSON lines file.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path of the file. If it ends with ``.gz``, the file is
+        compressed.
+
+    mode : :class:`str`
+        Either ``'r'`` or ``'w'``.
+
+    Returns
+    -------
+    :class:`io.TextIOBase`
+        The opened file.
+
+    """
+
+    if path.endswith('.gz'):
+        # The default compression level of zlib is much faster than
+        # that of gzip, for a small increase in file size.
+        open_ = functools.partial(gzip.open, compresslevel=6)
+    else:
+        open_ = open
+    return open_(path, f'{mode}t', encoding='utf-8')
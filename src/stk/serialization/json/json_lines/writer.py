@@ -0,0 +1,252 @@
+"""
+JSON Lines Writer
+=================
+
+"""
+
+import json
+import hashlib
+import weakref
+
+from stk.molecular import ConstructedMolecule
+from ..serializers import MoleculeJsonizer, ConstructedMoleculeJsonizer
+from .utilities import open_file
+
+
+class JsonLinesWriter:
+    """
+    Streams the JSONs of molecules into a JSON lines file.
+
+    Every line of the file holds one record. Molecules are written
+    with a :class:`.MoleculeJsonizer` and constructed molecules with
+    a :class:`.ConstructedMoleculeJsonizer`. The building blocks of
+    constructed molecules get records of their own, which are
+    written the first time a building block is found, and every
+    later constructed molecule refers to them by their id. Only
+    the ids and digests of the written records are kept in memory,
+    so any number of molecules can be written.
+
+    The file can be read with a :class:`.JsonLinesReader`.
+
+    Examples
+    --------
+    *Archiving a Population*
+
+    The writer can be used as a context manager, which closes the
+    file once all molecules are written. If the path ends with
+    ``.gz``, the file is compressed
+
+    .. code-block:: python
+
+        import stk
+
+        building_block = stk.BuildingBlock(
+            smiles='BrCCBr',
+            functional_groups=[stk.BromoFactory()],
+        )
+        population = (
+            stk.ConstructedMolecule(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(building_block, ),
+                    repeating_unit='A',
+                    num_repeating_units=num_repeating_units,
+                ),
+            )
+            for num_repeating_units in range(2, 10)
+        )
+        with stk.JsonLinesWriter('population.jsonl.gz') as writer:
+            writer.write_many(population)
+
+    """
+
+    def __init__(
+        self,
+        path,
+        molecule_jsonizer=MoleculeJsonizer(),
+        constructed_molecule_jsonizer=ConstructedMoleculeJsonizer(),
+    ):
+        """
+        Initialize a :class:`.JsonLinesWriter` instance.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the file into which molecules are written.
+            If it ends with ``.gz``, the file is compressed.
+
+        molecule_jsonizer : :class:`.MoleculeJsonizer`, optional
+            Used to create the JSONs of molecules, which are not
+            :class:`.ConstructedMolecule` instances.
+
+        constructed_molecule_jsonizer : \
+                :class:`.ConstructedMoleculeJsonizer`, optional
+            Used to create the JSONs of constructed molecules.
+
+        """
+
+        self._path = path
+        self._molecule_jsonizer = molecule_jsonizer
+        self._constructed_molecule_jsonizer = (
+            constructed_molecule_jsonizer
+        )
+        # Maps each building block already written to the id of its
+        # record. Building blocks are held by weak references, so
+        # they are not kept in memory by the writer.
+        self._building_block_ids = weakref.WeakKeyDictionary()
+        # Maps the digest of each written building block record to
+        # the id of the record. Used to find building blocks, which
+        # are not the same object as a written one, but have the
+        # same JSON.
+        self._record_ids = {}
+        self._file = open_file(path, 'w')
+
+    def write(self, molecule):
+        """
+        Write a molecule.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule to write.
+
+        Returns
+        -------
+        :class:`.JsonLinesWriter`
+            The writer.
+
+        """
+
+        if not isinstance(molecule, ConstructedMolecule):
+            self._write_record(self._molecule_jsonizer.to_json(molecule))
+            return self
+
+        record = dict(self._constructed_molecule_jsonizer.to_json(
+            molecule=molecule,
+        ))
+        record['buildingBlocks'] = tuple(map(
+            self._get_building_block_id,
+            molecule.get_building_blocks(),
+            record['buildingBlocks'],
+        ))
+        self._write_record(record)
+        return self
+
+    def write_many(self, molecules):
+        """
+        Write many molecules.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules to write.
+
+        Returns
+        -------
+        :class:`.JsonLinesWriter`
+            The writer.
+
+        """
+
+        for molecule in molecules:
+            self.write(molecule)
+        return self
+
+    def close(self):
+        """
+        Close the file.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _get_building_block_id(self, building_block, json):
+        """
+        Get the id of a building block record.
+
+        The record is written, if this is the first time the building
+        block is found.
+
+        Parameters
+        ----------
+        building_block : :class:`.Molecule`
+            The building block.
+
+        json : :class:`dict`
+            The JSON of the building block.
+
+        Returns
+        -------
+        :class:`int`
+            The id of the record of the building block.
+
+        """
+
+        id_ = self._building_block_ids.get(building_block)
+        if id_ is not None:
+            return id_
+
+        # Only building blocks which have not been seen before are
+        # hashed.
+        line = _to_line(json)
+        digest = hashlib.sha256(line.encode()).digest()
+        id_ = self._record_ids.get(digest)
+        if id_ is None:
+            id_ = self._record_ids[digest] = len(self._record_ids)
+            self._write_record({'buildingBlock': id_, **json})
+        self._building_block_ids[building_block] = id_
+        return id_
+
+    def _write_record(self, record):
+        """
+        Write a record.
+
+        Parameters
+        ----------
+        record : :class:`dict`
+            The record.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._file.write(_to_line(record))
+        self._file.write('\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._path!r})'
+
+
+def _to_line(record):
+    """
+    Get the line holding a record.
+
+    Parameters
+    ----------
+    record : :class:`dict`
+        The record.
+
+    Returns
+    -------
+    :class:`str`
+        The line, without the newline character.
+
+    """
+
+    return json.dumps(record, separators=(',', ':'))
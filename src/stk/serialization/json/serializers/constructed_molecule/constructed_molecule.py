@@ -4,6 +4,8 @@ Constructed Molecule JSONizer
 
 """
 
+import itertools as it
+
 from stk.molecular import (
     MoleculeKeyMaker,
     InchiKey,
@@ -58,6 +60,7 @@ class ConstructedMoleculeJsonizer:
     def __init__(
         self,
         key_makers=(InchiKey(), ),
+        version=1,
     ):
         """
         Initializes a :class:`.ConstructedMoleculeJsonizer`.
@@ -70,10 +73,30 @@ class ConstructedMoleculeJsonizer:
             molecular data to reference itself when split across
             multiple JSONs.
 
+        version : :class:`int`, optional
+            The version of the JSON schema to use, see
+            :class:`.MoleculeJsonizer`. In version ``2``, the atom
+            and bond infos are also run-length encoded, as a column
+            of building block indices, a column of building block
+            ids and a column of run lengths.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `version` is not supported.
+
         """
 
-        self._jsonizer = MoleculeJsonizer(key_makers=())
+        self._jsonizer = MoleculeJsonizer(
+            key_makers=(),
+            version=version,
+        )
         self._key_makers = key_makers
+        self._version = version
+        self._molecule_key_makers = tuple(
+            key_maker for key_maker in key_makers
+            if isinstance(key_maker, MoleculeKeyMaker)
+        )
 
     def to_json(self, molecule):
         """
@@ -87,93 +110,155 @@ class ConstructedMoleculeJsonizer:
         Returns
         -------
         :class:`dict`
-            A JSON representation of `molecule`.
+            A JSON representation of `molecule`. Parts of it may be
+            shared with other JSONs made by the jsonizer, so it
+            should not be modified in place.
 
         """
 
-        def get_keys(building_block):
-            return {
-                key_maker.get_key_name():
-                    key_maker.get_key(building_block)
-                for key_maker in self._key_makers
-                if isinstance(key_maker, MoleculeKeyMaker)
-            }
-
+        building_blocks = tuple(molecule.get_building_blocks())
         building_block_indices = {
             building_block: index
-            for index, building_block
-            in enumerate(molecule.get_building_blocks())
+            for index, building_block in enumerate(building_blocks)
         }
         building_block_indices[None] = None
 
-        def atom_info_to_json(atom_info):
+        def info_to_json(info):
             return (
-                building_block_indices[atom_info.get_building_block()],
-                atom_info.get_building_block_id(),
-            )
-
-        def bond_info_to_json(bond_info):
-            return (
-                building_block_indices[bond_info.get_building_block()],
-                bond_info.get_building_block_id(),
+                building_block_indices[info.get_building_block()],
+                info.get_building_block_id(),
             )
 
+        def infos_to_json(infos):
+            if self._version == 1:
+                return tuple(map(info_to_json, infos))
+            # Atoms and bonds from the same building block are next
+            # to each other, so their infos form long runs.
+            return _run_length_encode(map(info_to_json, infos))
+
+        # Each key is made only once, and then copied into every
+        # JSON which holds it.
+        building_block_keys = tuple(
+            map(self._get_building_block_keys, building_blocks)
+        )
+        keys = {
+            key_maker.get_key_name(): key_maker.get_key(molecule)
+            for key_maker in self._key_makers
+        }
         molecule_json = self._jsonizer.to_json(molecule)
+        molecule_json['molecule'].update(keys)
+        molecule_json['matrix'].update(keys)
         constructed_molecule_json = {
-            'BB': tuple(map(
-                get_keys,
-                molecule.get_building_blocks(),
-            )),
-            'aI': tuple(map(
-                atom_info_to_json,
-                molecule.get_atom_infos(),
-            )),
-            'bI': tuple(map(
-                bond_info_to_json,
-                molecule.get_bond_infos(),
-            )),
+            'BB': tuple(map(dict, building_block_keys)),
+            'aI': infos_to_json(molecule.get_atom_infos()),
+            'bI': infos_to_json(molecule.get_bond_infos()),
             'nBB': tuple(map(
                 molecule.get_num_building_block,
-                molecule.get_building_blocks(),
+                building_blocks,
             )),
+            **keys,
         }
-        for key_maker in self._key_makers:
-            key_name = key_maker.get_key_name()
-            key = key_maker.get_key(molecule)
-            molecule_json['molecule'][key_name] = key
-            molecule_json['matrix'][key_name] = key
-            constructed_molecule_json[key_name] = key
-
-        building_block_jsons = tuple(map(
-            self._jsonizer.to_json,
-            molecule.get_building_blocks(),
-        ))
-
-        def is_molecule_key_maker(key_maker):
-            return isinstance(key_maker, MoleculeKeyMaker)
-
-        for key_maker in filter(
-            is_molecule_key_maker,
-            self._key_makers,
-        ):
-            key_name = key_maker.get_key_name()
-            for building_block, json in zip(
-                molecule.get_building_blocks(),
-                building_block_jsons,
-            ):
-                key = key_maker.get_key(building_block)
-                json['molecule'][key_name] = key
-                json['matrix'][key_name] = key
-
+        if self._version != 1:
+            constructed_molecule_json['v'] = self._version
         return {
             'molecule': molecule_json['molecule'],
             'constructedMolecule': constructed_molecule_json,
             'matrix': molecule_json['matrix'],
-            'buildingBlocks': building_block_jsons,
+            'buildingBlocks': tuple(map(
+                self._get_building_block_json,
+                building_blocks,
+                building_block_keys,
+            )),
+        }
+
+    def _get_building_block_keys(self, building_block):
+        """
+        Get the keys of a building block.
+
+        Parameters
+        ----------
+        building_block : :class:`.Molecule`
+            The building block.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of each key to the key.
+
+        """
+
+        return {
+            key_maker.get_key_name(): key_maker.get_key(building_block)
+            for key_maker in self._molecule_key_makers
+        }
+
+    def _get_building_block_json(self, building_block, keys):
+        """
+        Get the JSON of a building block.
+
+        The JSON of the atoms, bonds and positions is stored on the
+        building block, so it is made only once, no matter how many
+        constructed molecules, or clones of the building block, are
+        serialized.
+
+        Parameters
+        ----------
+        building_block : :class:`.Molecule`
+            The building block.
+
+        keys : :class:`dict`
+            The keys of `building_block`.
+
+        Returns
+        -------
+        :class:`dict`
+            The JSON of `building_block`.
+
+        """
+
+        cache = building_block._get_serialization_cache()
+        json = cache.get(('json', self._version))
+        if json is None:
+            json = cache['json', self._version] = self._jsonizer.to_json(
+                molecule=building_block,
+            )
+        return {
+            'molecule': {**json['molecule'], **keys},
+            'matrix': {**json['matrix'], **keys},
         }
 
     def __str__(self):
         return repr(self)
 
     def __repr__(self):
-        return f'{self.__class__.__name__}({self._key_makers!r})'
+        version = (
+            '' if self._version == 1 else f', version={self._version}'
+        )
+        return (
+            f'{self.__class__.__name__}({self._key_makers!r}{version})'
+        )
+
+
+def _run_length_encode(values):
+    """
+    Get the run-length encoding of `values`.
+
+    Parameters
+    ----------
+    values : :class:`iterable` of :class:`tuple`
+        The values to encode. Each value is a :class:`tuple` of
+        the same length, ``n``.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`tuple`
+        ``n+1`` columns. The first ``n`` hold the value of each run
+        and the last holds the length of each run.
+
+    """
+
+    runs = tuple(
+        (*value, sum(1 for _ in run))
+        for value, run in it.groupby(values)
+    )
+    return tuple(zip(*runs)) if runs else ((), (), ())
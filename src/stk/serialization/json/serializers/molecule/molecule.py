@@ -5,7 +5,12 @@ Molecule JSONizer
 """
 
 from stk.molecular import InchiKey
-from .utilities import atom_to_json, bond_to_json
+from .utilities import (
+    atom_to_json,
+    bond_to_json,
+    to_column_json,
+    to_column_matrix_json,
+)
 
 
 class MoleculeJsonizer:
@@ -71,11 +76,62 @@ class MoleculeJsonizer:
     given by :meth:`.MoleculeKeyMaker.get_key_name` and the value
     given by :meth:`.MoleculeKeyMaker.get_key`.
 
+    *Using the Column-Oriented Schema*
+
+    Version ``2`` of the JSON schema stores each property of the
+    atoms and bonds in a single flat array, which makes JSONs of
+    large molecules much smaller and faster to create and store
+
+    .. code-block:: python
+
+        jsonizer = stk.MoleculeJsonizer(version=2)
+        json = jsonizer.to_json(stk.BuildingBlock('NCCN'))
+
+    In this case, ``json`` will look something like
+
+    .. code-block:: python
+
+        {
+            'molecule': {
+                'v': 2,
+
+                # The atomic number of every atom.
+                'a': (...),
+
+                # The ids and charges of charged atoms.
+                'c': ((...), (...)),
+
+                # The ids of the first and second atom of every bond,
+                # one bond after the other.
+                'b': (...),
+
+                # The order of every bond, as an int if it is
+                # integral.
+                'o': (...),
+
+                # The ids of periodic bonds and their periodicities,
+                # one bond after the other.
+                'p': ((...), (...)),
+
+                'InChIKey': 'The InChIKey of the molecule',
+            },
+            'matrix': {
+                # The position matrix, as base64 encoded float64
+                # values.
+                'm': '...',
+
+                'InChIKey': 'The InChIKey of the molecule',
+            },
+        }
+
+    :class:`.MoleculeDejsonizer` reads JSONs of either version.
+
     """
 
     def __init__(
         self,
         key_makers=(InchiKey(), ),
+        version=1,
     ):
         """
         Initialize a :class:`.MoleculeJsonizer` instance.
@@ -89,9 +145,25 @@ class MoleculeJsonizer:
             molecular data to reference itself when split across
             multiple JSONs.
 
+        version : :class:`int`, optional
+            The version of the JSON schema to use. Can be ``1``,
+            which stores a small array for every atom and bond, or
+            ``2``, which stores flat arrays.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `version` is not supported.
+
         """
 
+        if version not in (1, 2):
+            raise ValueError(
+                f'Version {version} of the JSON schema is not '
+                'supported.'
+            )
         self._key_makers = key_makers
+        self._version = version
 
     def to_json(self, molecule):
         """
@@ -109,13 +181,19 @@ class MoleculeJsonizer:
 
         """
 
-        json = {
-            'a': tuple(map(atom_to_json, molecule.get_atoms())),
-            'b': tuple(map(bond_to_json, molecule.get_bonds())),
-        }
-        position_matrix = {
-            'm': molecule.get_position_matrix().tolist(),
-        }
+        if self._version == 1:
+            json = {
+                'a': tuple(map(atom_to_json, molecule.get_atoms())),
+                'b': tuple(map(bond_to_json, molecule.get_bonds())),
+            }
+            position_matrix = {
+                'm': molecule.get_position_matrix().tolist(),
+            }
+        else:
+            json = to_column_json(molecule)
+            position_matrix = {
+                'm': to_column_matrix_json(molecule),
+            }
         for key_maker in self._key_makers:
             key_name = key_maker.get_key_name()
             key = key_maker.get_key(molecule)
@@ -130,4 +208,9 @@ class MoleculeJsonizer:
         return repr(self)
 
     def __repr__(self):
-        return f'{self.__class__.__name__}({self._key_makers!r})'
+        version = (
+            '' if self._version == 1 else f', version={self._version}'
+        )
+        return (
+            f'{self.__class__.__name__}({self._key_makers!r}{version})'
+        )
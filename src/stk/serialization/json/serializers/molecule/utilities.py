@@ -1,3 +1,6 @@
+import base64
+
+
 def atom_to_json(atom):
     """
     Return a JSON representation of `atom`.
@@ -42,3 +45,99 @@ def bond_to_json(bond):
         bond.get_order(),
         bond.get_periodicity(),
     )
+
+
+def to_column_json(molecule):
+    """
+    Return a column-oriented JSON representation of `molecule`.
+
+    Each property of the atoms and bonds is held in a single flat
+    array, rather than in one small array per atom or bond. Charges
+    and periodicities are zero for most atoms and bonds, so they are
+    stored sparsely, as an array of ids and an array of values.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to serialize.
+
+    Returns
+    -------
+    :class:`dict`
+        A JSON representation of the atoms and bonds of `molecule`.
+
+    """
+
+    charged_atoms = tuple(
+        atom for atom in molecule.get_atoms() if atom.get_charge() != 0
+    )
+    periodic_bonds = tuple(
+        (bond_id, bond.get_periodicity())
+        for bond_id, bond in enumerate(molecule.get_bonds())
+        if any(bond.get_periodicity())
+    )
+    return {
+        'v': 2,
+        'a': tuple(
+            atom.get_atomic_number() for atom in molecule.get_atoms()
+        ),
+        'c': (
+            tuple(atom.get_id() for atom in charged_atoms),
+            tuple(atom.get_charge() for atom in charged_atoms),
+        ),
+        'b': tuple(molecule._get_bond_atom_id_matrix().ravel().tolist()),
+        'o': tuple(
+            _to_compact_number(bond.get_order())
+            for bond in molecule.get_bonds()
+        ),
+        'p': (
+            tuple(bond_id for bond_id, _ in periodic_bonds),
+            tuple(
+                direction
+                for _, periodicity in periodic_bonds
+                for direction in periodicity
+            ),
+        ),
+    }
+
+
+def to_column_matrix_json(molecule):
+    """
+    Return a compact JSON representation of a position matrix.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule whose position matrix is serialized.
+
+    Returns
+    -------
+    :class:`str`
+        The position matrix, as little-endian ``float64`` values in
+        row-major order, encoded with base64. This is exact, and
+        much smaller and faster to encode than an array of numbers.
+
+    """
+
+    return base64.b64encode(
+        molecule.get_position_matrix().astype('<f8').tobytes()
+    ).decode('ascii')
+
+
+def _to_compact_number(number):
+    """
+    Convert a number to an :class:`int`, if it is integral.
+
+    Parameters
+    ----------
+    number : :class:`float` or :class:`int`
+        The number.
+
+    Returns
+    -------
+    :class:`float` or :class:`int`
+        The number, as an :class:`int` if it is integral.
+
+    """
+
+    return int(number) if number == int(number) else number
@@ -466,6 +466,37 @@ def remake(mol):
     return m
 
 
+def set_conformer_positions(conformer, position_matrix):
+    """
+    Set the positions of all atoms in `conformer`.
+
+    Parameters
+    ----------
+    conformer : :class:`rdkit.Conformer`
+        The conformer to modify.
+
+    position_matrix : :class:`numpy.ndarray`
+        A ``(n, 3)`` matrix holding the new position of every atom.
+
+    Returns
+    -------
+    :class:`rdkit.Conformer`
+        The `conformer`.
+
+    """
+
+    # Older versions of rdkit do not allow positions to be set in
+    # bulk.
+    if hasattr(conformer, 'SetPositions'):
+        conformer.SetPositions(
+            np.asarray(position_matrix, dtype=np.float64)
+        )
+    else:
+        for atom_id, position in enumerate(position_matrix):
+            conformer.SetAtomPosition(atom_id, position)
+    return conformer
+
+
 def get_projection(start, target):
     """
     Get the projection of `start` onto `target`.
@@ -0,0 +1,45 @@
+import stk
+
+from tests.utilities import is_equivalent_constructed_molecule
+from ..utilities import MockMongoClient
+
+
+def test_building_block_references():
+    """
+    Test that building blocks are stored only once.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    database = stk.ConstructedMoleculeMongoDb(
+        mongo_client=MockMongoClient(),
+        lru_cache_size=0,
+    )
+    building_block = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+    polymers = tuple(
+        stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(building_block, ),
+                repeating_unit='A',
+                num_repeating_units=num_repeating_units,
+            ),
+        )
+        for num_repeating_units in (2, 3)
+    )
+    for polymer in polymers:
+        database.put(polymer)
+
+    # One document for each polymer and one for the building block.
+    assert len(database._molecules._documents) == 3
+    assert len(database._position_matrices._documents) == 3
+    for polymer in polymers:
+        retrieved = database.get({
+            'InChIKey': stk.InchiKey().get_key(polymer),
+        })
+        is_equivalent_constructed_molecule(
+            polymer.with_canonical_atom_ordering(),
+            retrieved.with_canonical_atom_ordering(),
+        )
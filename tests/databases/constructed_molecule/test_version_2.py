@@ -0,0 +1,44 @@
+import stk
+
+from tests.utilities import is_equivalent_constructed_molecule
+from ..utilities import MockMongoClient
+
+
+def test_version_2():
+    """
+    Test a database using the version 2 schema.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    polymers = tuple(
+        stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    stk.BuildingBlock('BrC[N+]CBr', [stk.BromoFactory()]),
+                ),
+                repeating_unit='AB',
+                num_repeating_units=num_repeating_units,
+            ),
+        )
+        for num_repeating_units in (2, 3)
+    )
+    database = stk.ConstructedMoleculeMongoDb(
+        mongo_client=MockMongoClient(),
+        jsonizer=stk.ConstructedMoleculeJsonizer(version=2),
+    )
+    for polymer in polymers:
+        database.put(polymer)
+
+    for polymer in polymers:
+        retrieved = database.get({
+            'InChIKey': stk.InchiKey().get_key(polymer),
+        })
+        is_equivalent_constructed_molecule(
+            polymer.with_canonical_atom_ordering(),
+            retrieved.with_canonical_atom_ordering(),
+        )
@@ -0,0 +1,91 @@
+import pytest
+import stk
+
+
+def _has_nitrogen(molecule):
+    return any(
+        atom.get_atomic_number() == 7 for atom in molecule.get_atoms()
+    )
+
+
+def _get_polymer(building_block):
+    return stk.polymer.Linear(
+        building_blocks=(building_block, ),
+        repeating_unit='A',
+        num_repeating_units=2,
+    )
+
+
+@pytest.fixture(
+    params=(
+        1,
+        2,
+    ),
+)
+def num_processes(request):
+    return request.param
+
+
+def test_molecule_filter(num_processes):
+    """
+    Test that molecules rejected by `molecule_filter` are discarded.
+
+    Parameters
+    ----------
+    num_processes : :class:`int`
+        The number of processes the EA uses. If more than ``1``,
+        the EA runs with an executor.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    initial_population = tuple(
+        stk.MoleculeRecord(
+            topology_graph=_get_polymer(
+                building_block=stk.BuildingBlock(
+                    smiles=smiles,
+                    functional_groups=[stk.BromoFactory()],
+                ),
+            ),
+        )
+        for smiles in ('BrCCBr', 'BrCCCBr')
+    )
+    # Every mutant holds nitrogen, but it is also bigger, and
+    # therefore fitter, than any molecule of the initial population.
+    mutator = stk.RandomBuildingBlock(
+        building_blocks=(
+            stk.BuildingBlock('BrCNCCCCBr', [stk.BromoFactory()]),
+        ),
+        is_replaceable=lambda building_block: True,
+        random_seed=4,
+    )
+    ea = stk.EvolutionaryAlgorithm(
+        initial_population=initial_population,
+        fitness_calculator=stk.FitnessFunction(
+            fitness_function=lambda molecule: molecule.get_num_atoms(),
+        ),
+        mutator=mutator,
+        crosser=stk.GeneticRecombination(
+            get_gene=lambda building_block: 0,
+        ),
+        generation_selector=stk.Best(num_batches=2),
+        mutation_selector=stk.Best(num_batches=1),
+        crossover_selector=stk.Best(num_batches=1, batch_size=2),
+        molecule_filter=lambda molecule: not _has_nitrogen(molecule),
+        num_processes=num_processes,
+    )
+
+    num_mutants = 0
+    for generation in ea.get_generations(3):
+        for record in generation.get_mutation_records():
+            num_mutants += 1
+            assert _has_nitrogen(
+                record.get_molecule_record().get_molecule()
+            )
+        for record in generation.get_molecule_records():
+            assert not _has_nitrogen(record.get_molecule())
+
+    assert num_mutants > 0
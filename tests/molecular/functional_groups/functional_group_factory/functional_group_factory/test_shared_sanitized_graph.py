@@ -0,0 +1,83 @@
+import rdkit.Chem.AllChem as rdkit
+import stk
+
+
+def test_shared_sanitized_graph(monkeypatch):
+    """
+    Test that factories share the sanitized graph of a molecule.
+
+    Parameters
+    ----------
+    monkeypatch : :class:`_pytest.monkeypatch.MonkeyPatch`
+        Used to count the calls to :func:`rdkit.SanitizeMol`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    smiles = 'NCCc1ccc(Br)cc1C(=O)O'
+    factories = (
+        stk.PrimaryAminoFactory(),
+        stk.BromoFactory(),
+        stk.CarboxylicAcidFactory(),
+    )
+    molecule = stk.BuildingBlock(smiles)
+
+    num_calls = 0
+    sanitize_mol = rdkit.SanitizeMol
+
+    def counting_sanitize_mol(*args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        return sanitize_mol(*args, **kwargs)
+
+    monkeypatch.setattr(rdkit, 'SanitizeMol', counting_sanitize_mol)
+
+    functional_groups = [
+        tuple(factory.get_functional_groups(molecule))
+        for factory in factories
+    ]
+    graph = molecule._graph_cache['sanitized_rdkit']
+    functional_groups.extend(
+        tuple(factory.get_functional_groups(molecule))
+        for factory in factories
+    )
+    assert num_calls == 1
+    assert molecule._graph_cache['sanitized_rdkit'] is graph
+
+    monkeypatch.undo()
+    fresh_functional_groups = [
+        tuple(factory.get_functional_groups(stk.BuildingBlock(smiles)))
+        for factory in factories
+    ]
+    # Every factory must find a functional group, or the comparison
+    # below would pass trivially.
+    assert all(fresh_functional_groups)
+    assert (
+        list(map(_get_ids, functional_groups))
+        == list(map(_get_ids, 2*fresh_functional_groups))
+    )
+
+
+def _get_ids(functional_groups):
+    """
+    Get the class and atom ids of each functional group.
+
+    Parameters
+    ----------
+    functional_groups : :class:`tuple` of :class:`.FunctionalGroup`
+        The functional groups.
+
+    Returns
+    -------
+    :class:`tuple`
+        For each functional group, its class and atom ids.
+
+    """
+
+    return tuple(
+        (type(fg), tuple(fg.get_atom_ids()))
+        for fg in functional_groups
+    )
@@ -60,6 +60,33 @@ from .case_data import CaseData
             key_name='SMILES',
             key='C[C@H](O)c1ccccc1',
         ),
+        CaseData(
+            key_maker=stk.GraphHash(),
+            molecule=stk.BuildingBlock('NCCN'),
+            key_name='GraphHash',
+            key=(
+                '29e448f68c5bb9f19ba05280ff56a59c'
+                'ebe20f811707ac1b80c59f48d544dd09'
+            ),
+        ),
+        CaseData(
+            key_maker=stk.GraphHash(),
+            molecule=stk.BuildingBlock('C(N)CN'),
+            key_name='GraphHash',
+            key=(
+                '29e448f68c5bb9f19ba05280ff56a59c'
+                'ebe20f811707ac1b80c59f48d544dd09'
+            ),
+        ),
+        CaseData(
+            key_maker=stk.GraphHash(num_iterations=1),
+            molecule=stk.BuildingBlock('NCCN'),
+            key_name='GraphHash',
+            key=(
+                'c6c0b49a0f49a72b06a1ca955b95dd68'
+                '20744dabd145aa18aa9644c792c9390f'
+            ),
+        ),
         CaseData(
             key_maker=stk.MoleculeKeyMaker(
                 key_name='NumAtoms',
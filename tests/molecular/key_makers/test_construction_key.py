@@ -0,0 +1,99 @@
+import pytest
+import stk
+
+
+@pytest.fixture
+def building_blocks():
+    """
+    Building blocks used for construction.
+
+    """
+
+    return (
+        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+        stk.BuildingBlock('BrCNCBr', [stk.BromoFactory()]),
+    )
+
+
+def test_construction_key(building_blocks):
+    """
+    Test :class:`.ConstructionKey`.
+
+    Parameters
+    ----------
+    building_blocks : :class:`tuple` of :class:`.BuildingBlock`
+        Building blocks used for construction.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    bb1, bb2 = building_blocks
+    key_maker = stk.ConstructionKey()
+    topology_graph = stk.polymer.Linear((bb1, bb2), 'AB', 3)
+    constructed_molecule = stk.ConstructedMolecule(topology_graph)
+    key = key_maker.get_key(topology_graph)
+    assert key == key_maker.get_key(constructed_molecule)
+    assert key == key_maker.get_key(
+        constructed_molecule.with_canonical_atom_ordering()
+    )
+    # Equivalent building blocks give the same key.
+    assert key == key_maker.get_key(
+        stk.polymer.Linear(
+            building_blocks=(bb1.clone(), bb2),
+            repeating_unit='AB',
+            num_repeating_units=3,
+        )
+    )
+    # Placing the building blocks differently gives a different key.
+    assert key != key_maker.get_key(
+        stk.polymer.Linear((bb2, bb1), 'AB', 3)
+    )
+    assert key != key_maker.get_key(
+        stk.polymer.Linear((bb1, bb2), 'AB', 3, (0, 1))
+    )
+    assert key != key_maker.get_key(
+        stk.polymer.Linear((bb1, bb2), 'AB', 4)
+    )
+    assert tuple(key_maker.get_keys(
+        molecules=(topology_graph, constructed_molecule),
+    )) == (key, key)
+
+
+def test_construction_key_without_topology_graph(building_blocks):
+    """
+    Test :class:`.ConstructionKey` with an unknown topology graph.
+
+    Parameters
+    ----------
+    building_blocks : :class:`tuple` of :class:`.BuildingBlock`
+        Building blocks used for construction.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    constructed_molecule = stk.ConstructedMolecule(
+        topology_graph=stk.polymer.Linear(building_blocks, 'AB', 3),
+    )
+    constructed_molecule = stk.ConstructedMolecule.init(
+        atoms=tuple(constructed_molecule.get_atoms()),
+        bonds=tuple(constructed_molecule.get_bonds()),
+        position_matrix=constructed_molecule.get_position_matrix(),
+        atom_infos=tuple(constructed_molecule.get_atom_infos()),
+        bond_infos=tuple(constructed_molecule.get_bond_infos()),
+        num_building_blocks={
+            building_block:
+                constructed_molecule.get_num_building_block(
+                    building_block,
+                )
+            for building_block
+            in constructed_molecule.get_building_blocks()
+        },
+    )
+    with pytest.raises(ValueError):
+        stk.ConstructionKey().get_key(constructed_molecule)
@@ -0,0 +1,50 @@
+import pathos
+import pytest
+import stk
+
+
+@pytest.fixture(params=(False, True))
+def use_executor(request):
+    """
+    Whether to make the keys in other processes.
+
+    """
+
+    return request.param
+
+
+def test_get_keys(case_data, use_executor):
+    """
+    Test :meth:`.MoleculeKeyMaker.get_keys`.
+
+    Parameters
+    ----------
+    case_data : :class:`.CaseData`
+        A test case. Holds the key maker to test and the correct key
+        it should produce.
+
+    use_executor : :class:`bool`
+        Whether to make the keys in other processes.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    # Setting the position matrix gives a copy of the molecule
+    # without any stored keys. Its clones share stored keys, and
+    # a molecule with a stored key is also included.
+    molecule = case_data.molecule.with_position_matrix(
+        position_matrix=case_data.molecule.get_position_matrix(),
+    )
+    prefilled = stk.BuildingBlock('BrCCBr')
+    case_data.key_maker.prefill((prefilled, ), ('prefilled', ))
+    molecules = (molecule, prefilled, molecule.clone())
+    expected = (case_data.key, 'prefilled', case_data.key)
+    if use_executor:
+        with pathos.pools.ProcessPool(2) as pool:
+            keys = tuple(case_data.key_maker.get_keys(molecules, pool))
+    else:
+        keys = tuple(case_data.key_maker.get_keys(molecules))
+    assert keys == expected
@@ -0,0 +1,64 @@
+import numpy as np
+import stk
+
+
+def test_graph_hash():
+    """
+    Test that :class:`.GraphHash` tells apart the right molecules.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    graph_hash = stk.GraphHash()
+    assert (
+        graph_hash.get_key(stk.BuildingBlock('NCCBr'))
+        != graph_hash.get_key(stk.BuildingBlock('NCCCBr'))
+    )
+    # Charges are part of the hash.
+    assert (
+        graph_hash.get_key(stk.BuildingBlock('C[N+](C)(C)C'))
+        != graph_hash.get_key(stk.BuildingBlock('CC(C)(C)C'))
+    )
+    # Bond orders are part of the hash.
+    assert (
+        graph_hash.get_key(stk.BuildingBlock('C=CCC'))
+        != graph_hash.get_key(stk.BuildingBlock('CC=CC'))
+    )
+    # Stereochemistry is not part of the hash.
+    assert (
+        graph_hash.get_key(stk.BuildingBlock('C[C@H](O)Cl'))
+        == graph_hash.get_key(stk.BuildingBlock('C[C@@H](O)Cl'))
+    )
+
+
+def test_graph_hash_with_distances():
+    """
+    Test :class:`.GraphHash` with distances in the hash.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    graph_hash = stk.GraphHash(distance_precision=0.1)
+    molecule = stk.BuildingBlock('NCCBr')
+    moved = molecule.with_rotation_about_axis(
+        angle=1.,
+        axis=np.array([0., 0., 1.]),
+        origin=np.zeros(3),
+    ).with_displacement(np.array([1., 2., 3.]))
+    reflected = molecule.with_position_matrix(
+        position_matrix=molecule.get_position_matrix()*[-1, 1, 1],
+    )
+    stretched = molecule.with_position_matrix(
+        position_matrix=molecule.get_position_matrix()*1.5,
+    )
+    key = graph_hash.get_key(molecule)
+    assert key == graph_hash.get_key(moved)
+    assert key == graph_hash.get_key(reflected)
+    assert key != graph_hash.get_key(stretched)
+    assert key != stk.GraphHash().get_key(molecule)
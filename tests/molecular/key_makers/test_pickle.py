@@ -0,0 +1,38 @@
+import pickle
+
+import numpy as np
+import stk
+
+from tests.utilities import is_equivalent_molecule
+
+
+def test_pickle():
+    """
+    Test pickling a molecule, after a key maker has used it.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecule = stk.BuildingBlock('NCCN')
+    key_maker = stk.MoleculeKeyMaker(
+        key_name='num_atoms',
+        get_key=lambda molecule: molecule.get_num_atoms(),
+    )
+    assert key_maker.get_key(molecule) == 12
+    # Fill some other caches too.
+    stk.InchiKey().get_key(molecule)
+    tuple(molecule.get_atom_pairs_within(1.5))
+
+    data = pickle.dumps(molecule)
+    # Caches are not pickled.
+    assert len(data) <= len(pickle.dumps(stk.BuildingBlock('NCCN')))
+    unpickled = pickle.loads(data)
+    is_equivalent_molecule(molecule, unpickled)
+    assert np.all(np.equal(
+        molecule.get_position_matrix(),
+        unpickled.get_position_matrix(),
+    ))
+    assert key_maker.get_key(unpickled) == 12
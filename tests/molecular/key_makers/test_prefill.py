@@ -0,0 +1,63 @@
+import numpy as np
+import stk
+
+
+def test_prefill():
+    """
+    Test :meth:`.MoleculeKeyMaker.prefill`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecules = (stk.BuildingBlock('NCCN'), stk.BuildingBlock('BrCCBr'))
+    key_maker = stk.InchiKey()
+    key_maker.prefill(molecules, ('key0', 'key1'))
+    assert key_maker.get_key(molecules[0]) == 'key0'
+    # Clones with the same positions share the stored keys.
+    assert key_maker.get_key(molecules[1].clone()) == 'key1'
+    # Other key makers of the same kind share the stored keys too.
+    assert stk.InchiKey().get_key(molecules[1]) == 'key1'
+    # Keys are made again, once the positions change.
+    assert (
+        key_maker.get_key(molecules[0].with_displacement(np.ones(3)))
+        == 'PIICEJLVQHRZGT-UHFFFAOYSA-N'
+    )
+    # Other key makers do not see the stored keys.
+    assert stk.Smiles().get_key(molecules[0]) == 'NCCN'
+
+
+def test_prefill_made_keys():
+    """
+    Test :meth:`.MoleculeKeyMaker.prefill` without keys.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    num_calls = 0
+
+    def get_num_atoms(molecule):
+        nonlocal num_calls
+        num_calls += 1
+        return molecule.get_num_atoms()
+
+    key_maker = stk.MoleculeKeyMaker('num_atoms', get_num_atoms)
+    molecules = (
+        stk.BuildingBlock('NCCN'),
+        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+    )
+    key_maker.prefill(molecules)
+    assert num_calls == 2
+    assert key_maker.get_key(molecules[0]) == 12
+    assert key_maker.get_key(molecules[1].clone()) == 8
+    assert num_calls == 2
+    # Changing the functional groups discards the stored keys.
+    assert key_maker.get_key(molecules[1].with_functional_groups(())) == 8
+    assert num_calls == 3
+    assert key_maker.get_key(molecules[1]) == 8
+    assert num_calls == 3
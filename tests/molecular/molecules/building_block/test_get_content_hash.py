@@ -0,0 +1,83 @@
+import stk
+
+
+def test_get_content_hash():
+    """
+    Test :meth:`.BuildingBlock.get_content_hash`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    building_block = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+    content_hash = building_block.get_content_hash()
+    position_hash = building_block.get_content_hash(True)
+
+    equivalent = (
+        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+        building_block.clone(),
+        stk.BuildingBlock.init_from_molecule(
+            molecule=building_block,
+            functional_groups=[stk.BromoFactory()],
+        ),
+    )
+    for molecule in equivalent:
+        assert molecule.get_content_hash() == content_hash
+        assert molecule.get_content_hash(True) == position_hash
+
+    moved = building_block.with_displacement((1., 0., 0.))
+    assert moved.get_content_hash() == content_hash
+    assert moved.get_content_hash(True) != position_hash
+
+    different = (
+        stk.BuildingBlock('BrCCBr'),
+        stk.BuildingBlock('BrCCBr', [stk.BromoFactory((1, ), (0, ))]),
+        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()], (0, 1)),
+        stk.BuildingBlock('BrCCCBr', [stk.BromoFactory()]),
+        stk.BuildingBlock('BrC=CBr', [stk.BromoFactory()]),
+        building_block.with_functional_groups(
+            functional_groups=tuple(
+                building_block.get_functional_groups()
+            )[:1],
+        ),
+    )
+    content_hashes = {content_hash} | {
+        molecule.get_content_hash() for molecule in different
+    }
+    assert len(content_hashes) == len(different) + 1
+
+    # Content hashes of clones with different functional groups
+    # do not get mixed up.
+    clone = different[-1]
+    assert building_block.get_content_hash(True) == position_hash
+    assert clone.get_content_hash(True) != position_hash
+
+
+def test_get_content_hash_canonical_atom_ordering():
+    """
+    Test :meth:`.BuildingBlock.get_content_hash` with reordered atoms.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    building_block1 = stk.BuildingBlock(
+        smiles='NCCBr',
+        functional_groups=[stk.BromoFactory()],
+    )
+    building_block2 = stk.BuildingBlock(
+        smiles='BrCCN',
+        functional_groups=[stk.BromoFactory()],
+    )
+    assert (
+        building_block1.get_content_hash()
+        != building_block2.get_content_hash()
+    )
+    assert (
+        building_block1.with_canonical_atom_ordering().get_content_hash()
+        == building_block2.with_canonical_atom_ordering().get_content_hash()
+    )
@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+import stk
+
+from ..utilities import is_equivalent_building_block
+
+
+@pytest.mark.parametrize('num_processes', (1, 2))
+def test_init_many(num_processes):
+    """
+    Test :meth:`.BuildingBlock.init_many`.
+
+    Parameters
+    ----------
+    num_processes : :class:`int`
+        The number of processes to use.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    functional_groups = (stk.BromoFactory(), stk.PrimaryAminoFactory())
+    # The third SMILES is not valid.
+    smiles = ('NCCN', 'BrCCBr', 'C1CC', 'Nc1ccc(Br)cc1', 'NCCCN')
+    building_blocks = tuple(stk.BuildingBlock.init_many(
+        smiles=smiles,
+        functional_groups=functional_groups,
+        num_processes=num_processes,
+        chunk_size=2,
+    ))
+    assert len(building_blocks) == len(smiles)
+    for smiles_, building_block in zip(smiles, building_blocks):
+        if smiles_ == 'C1CC':
+            assert isinstance(building_block, Exception)
+            continue
+
+        expected = stk.BuildingBlock(smiles_, functional_groups)
+        is_equivalent_building_block(building_block, expected)
+        assert np.all(np.equal(
+            building_block.get_position_matrix(),
+            expected.get_position_matrix(),
+        ))
@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+import stk
+
+
+@pytest.fixture(
+    params=(
+        lambda molecule: molecule.with_displacement(
+            displacement=np.array([1., -2., 3.]),
+        ),
+        lambda molecule: molecule.with_rotation_about_axis(
+            angle=1.2,
+            axis=np.array([1., 1., 0.])/np.sqrt(2),
+            origin=np.array([0.5, -1., 2.]),
+        ),
+        lambda molecule: molecule.with_rotation_between_vectors(
+            start=np.array([1., 0., 0.]),
+            target=np.array([0., 1., 1.])/np.sqrt(2),
+            origin=np.array([-1., 0., 3.]),
+        ),
+        lambda molecule: molecule.with_rotation_to_minimize_angle(
+            start=np.array([1., 0., 0.]),
+            target=np.array([0., 0., 1.]),
+            axis=np.array([0., 1., 0.]),
+            origin=np.array([2., 1., 0.]),
+        ),
+    ),
+)
+def move(request):
+    """
+    A rigid motion of a molecule.
+
+    """
+
+    return request.param
+
+
+def test_placement_descriptors(building_block, move):
+    """
+    Test that cached descriptors are kept correct by rigid motions.
+
+    Parameters
+    ----------
+    building_block : :class:`.BuildingBlock`
+        The building block to test.
+
+    move : :class:`callable`
+        Takes a single parameter, `molecule`, and returns a clone
+        which has undergone a rigid motion.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    placer_ids = tuple(building_block.get_placer_ids())
+    core_atom_ids = tuple(building_block.get_core_atom_ids())
+    # Fill the cache before the motion.
+    building_block.get_centroid()
+    building_block.get_centroid(building_block.get_placer_ids())
+    building_block.get_centroid(building_block.get_core_atom_ids())
+    building_block.get_plane_normal(building_block.get_placer_ids())
+    building_block.get_maximum_diameter()
+    # Other atoms are not cached.
+    building_block.get_centroid((0, 0))
+    assert {
+        atom_ids
+        for _, atom_ids in building_block._geometry_cache['placement']
+    } <= {None, placer_ids, core_atom_ids}
+
+    moved = move(building_block)
+    # A building block with the same positions, but an empty cache.
+    expected = building_block.with_position_matrix(
+        position_matrix=moved.get_position_matrix(),
+    )
+    for atom_ids in (None, placer_ids, core_atom_ids):
+        assert np.allclose(
+            a=moved.get_centroid(atom_ids),
+            b=expected.get_centroid(atom_ids),
+            atol=1e-10,
+        )
+    # The normal is not unique when the atoms are on a line, so
+    # instead of comparing normals, check that both give a plane of
+    # best fit.
+    assert np.isclose(
+        a=_get_plane_error(
+            molecule=expected,
+            atom_ids=placer_ids,
+            normal=moved.get_plane_normal(placer_ids),
+        ),
+        b=_get_plane_error(
+            molecule=expected,
+            atom_ids=placer_ids,
+            normal=expected.get_plane_normal(placer_ids),
+        ),
+        atol=1e-8,
+    )
+    assert np.isclose(
+        a=moved.get_maximum_diameter(),
+        b=expected.get_maximum_diameter(),
+        atol=1e-10,
+    )
+
+
+def _get_plane_error(molecule, atom_ids, normal):
+    """
+    Get the error of a plane fitted to atoms of a molecule.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule.
+
+    atom_ids : :class:`tuple` of :class:`int`
+        The ids of the atoms.
+
+    normal : :class:`numpy.ndarray`
+        The normal of the plane, which passes through the centroid
+        of the atoms.
+
+    Returns
+    -------
+    :class:`float`
+        The sum of squared distances of the atoms from the plane.
+
+    """
+
+    positions = molecule.get_position_matrix()[list(atom_ids)]
+    return np.sum((
+        (positions - molecule.get_centroid(atom_ids)) @ normal
+    )**2)
+
+
+@pytest.mark.parametrize(
+    argnames='smiles',
+    argvalues=(
+        'Brc1ccc(Br)cc1',
+        'Brc1cc(Br)cc(Br)c1',
+        'BrCCCBr',
+    ),
+)
+def test_plane_normal_after_rotation(smiles):
+    """
+    Test that plane normals do not depend on past rotations.
+
+    Parameters
+    ----------
+    smiles : :class:`str`
+        The SMILES of the building block to test.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    building_block = stk.BuildingBlock(smiles, [stk.BromoFactory()])
+    atom_id_groups = (
+        None,
+        tuple(building_block.get_placer_ids()),
+        tuple(building_block.get_core_atom_ids()),
+    )
+    generator = np.random.RandomState(4)
+    for _ in range(20):
+        for atom_ids in atom_id_groups:
+            # Fill the cache before the rotation.
+            building_block.get_plane_normal(atom_ids)
+
+        axis = generator.normal(size=3)
+        rotated = building_block.with_rotation_about_axis(
+            angle=generator.uniform(0, 2*np.pi),
+            axis=axis/np.linalg.norm(axis),
+            origin=building_block.get_centroid(),
+        )
+        # A building block with the same positions, but an empty
+        # cache.
+        expected = building_block.with_position_matrix(
+            position_matrix=rotated.get_position_matrix(),
+        )
+        for atom_ids in atom_id_groups:
+            assert np.array_equal(
+                rotated.get_plane_normal(atom_ids),
+                expected.get_plane_normal(atom_ids),
+            )
+        building_block = rotated
@@ -0,0 +1,58 @@
+import pytest
+import stk
+
+
+@pytest.fixture
+def building_blocks():
+    """
+    The building blocks stored in a library.
+
+    """
+
+    return (
+        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+        stk.BuildingBlock(
+            smiles='Nc1ccc(N)cc1',
+            functional_groups=[stk.PrimaryAminoFactory()],
+        ),
+        stk.BuildingBlock('[Br-]'),
+        stk.BuildingBlock(
+            smiles='O=CC(C=O)C=O',
+            functional_groups=[stk.AldehydeFactory()],
+        ),
+        stk.BuildingBlock(
+            smiles='BrCC(Br)CN',
+            functional_groups=[
+                stk.BromoFactory(),
+                stk.PrimaryAminoFactory(),
+            ],
+        ),
+        stk.BuildingBlock(
+            smiles='BrCCBr',
+            functional_groups=[stk.BromoFactory()],
+            placer_ids=(1, 2),
+        ),
+    )
+
+
+@pytest.fixture
+def path(tmpdir):
+    """
+    The path of a library file.
+
+    """
+
+    return str(tmpdir / 'building_blocks.stklib')
+
+
+@pytest.fixture
+def library(path, building_blocks):
+    """
+    A :class:`.BuildingBlockLibrary` holding `building_blocks`.
+
+    """
+
+    return stk.BuildingBlockLibrary.init_from_building_blocks(
+        path=path,
+        building_blocks=building_blocks,
+    )
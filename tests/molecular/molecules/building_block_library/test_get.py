@@ -0,0 +1,42 @@
+import pytest
+import stk
+
+from ..utilities import is_equivalent_building_block
+
+
+def test_get(library, building_blocks):
+    """
+    Test :meth:`.BuildingBlockLibrary.get`.
+
+    Parameters
+    ----------
+    library : :class:`.BuildingBlockLibrary`
+        The library to test.
+
+    building_blocks : :class:`tuple` of :class:`.BuildingBlock`
+        The building blocks held by `library`. The first and last
+        building blocks have the same keys.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    for key_maker in (stk.InchiKey(), stk.Smiles()):
+        # The last building block has the same keys as the first, so
+        # it is never returned.
+        for expected in building_blocks[:-1]:
+            is_equivalent_building_block(
+                building_block1=library.get({
+                    key_maker.get_key_name():
+                        key_maker.get_key(expected),
+                }),
+                building_block2=expected,
+            )
+
+    with pytest.raises(KeyError):
+        library.get({'SMILES': 'NCCN'})
+
+    with pytest.raises(KeyError):
+        library.get({'InChI': 'InChI=1S/CH4/h1H4'})
@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import stk
+
+from ..utilities import is_equivalent_building_block
+
+
+def test_get_building_block(library, building_blocks, path):
+    """
+    Test :meth:`.BuildingBlockLibrary.get_building_block`.
+
+    Parameters
+    ----------
+    library : :class:`.BuildingBlockLibrary`
+        The library to test.
+
+    building_blocks : :class:`tuple` of :class:`.BuildingBlock`
+        The building blocks held by `library`.
+
+    path : :class:`str`
+        The path of the file holding `library`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    assert library.get_num_building_blocks() == len(building_blocks)
+    # Open the library again, to check that nothing is lost when
+    # it is written to disk.
+    library = stk.BuildingBlockLibrary(path)
+    for index, expected in enumerate(building_blocks):
+        building_block = library.get_building_block(index)
+        is_equivalent_building_block(building_block, expected)
+        assert np.all(np.equal(
+            building_block.get_position_matrix(),
+            expected.get_position_matrix(),
+        ))
+
+    with pytest.raises(IndexError):
+        library.get_building_block(len(building_blocks))
@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+import stk
+
+
+def _get_conformers(molecule, num_conformers):
+    """
+    Get randomly rotated and displaced clones of `molecule`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to clone.
+
+    num_conformers : :class:`int`
+        The number of clones to make.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`.Molecule`
+        The clones.
+
+    """
+
+    generator = np.random.RandomState(4)
+    conformers = []
+    for _ in range(num_conformers):
+        axis = generator.normal(size=3)
+        conformers.append(
+            molecule.with_rotation_about_axis(
+                angle=generator.uniform(0, 2*np.pi),
+                axis=axis/np.linalg.norm(axis),
+                origin=generator.normal(size=3),
+            ).with_displacement(generator.normal(size=3))
+        )
+    return tuple(conformers)
+
+
+@pytest.fixture(
+    params=(
+        lambda: _get_conformers(stk.BuildingBlock('NCCN'), 1),
+        lambda: _get_conformers(stk.BuildingBlock('NCCCCN'), 5),
+        lambda: _get_conformers(
+            molecule=stk.ConstructedMolecule(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(
+                        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    ),
+                    repeating_unit='A',
+                    num_repeating_units=3,
+                ),
+            ),
+            num_conformers=4,
+        ),
+    ),
+)
+def conformers(request):
+    """
+    The molecules from which an ensemble is created.
+
+    """
+
+    return request.param()
+
+
+@pytest.fixture
+def ensemble(conformers):
+    return stk.ConformerEnsemble.init_from_molecules(conformers)
+
+
+@pytest.fixture(
+    params=(
+        None,
+        0,
+        (0, 2),
+    ),
+)
+def atom_ids(request):
+    return request.param
@@ -0,0 +1,32 @@
+import numpy as np
+
+
+def test_get_conformer(ensemble, conformers):
+    """
+    Test :meth:`.ConformerEnsemble.get_conformer`.
+
+    Parameters
+    ----------
+    ensemble : :class:`.ConformerEnsemble`
+        The ensemble to test.
+
+    conformers : :class:`tuple` of :class:`.Molecule`
+        The molecules from which `ensemble` was created.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    assert ensemble.get_num_conformers() == len(conformers)
+    for conformer_id, expected in enumerate(conformers):
+        conformer = ensemble.get_conformer(conformer_id)
+        assert conformer.__class__ is expected.__class__
+        assert np.allclose(
+            conformer.get_position_matrix(),
+            expected.get_position_matrix(),
+            atol=1e-12,
+        )
+        assert tuple(conformer.get_atoms()) == tuple(expected.get_atoms())
+        assert tuple(conformer.get_bonds()) == tuple(expected.get_bonds())
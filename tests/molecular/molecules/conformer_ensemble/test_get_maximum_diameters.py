@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def test_get_maximum_diameters(ensemble, conformers, atom_ids):
+    """
+    Test :meth:`.ConformerEnsemble.get_maximum_diameters`.
+
+    Parameters
+    ----------
+    ensemble : :class:`.ConformerEnsemble`
+        The ensemble to test.
+
+    conformers : :class:`tuple` of :class:`.Molecule`
+        The molecules from which `ensemble` was created.
+
+    atom_ids : :class:`tuple` of :class:`int`
+        The atom ids to use. Can be a single :class:`int` or
+        ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    assert np.allclose(
+        ensemble.get_maximum_diameters(atom_ids),
+        [
+            conformer.get_maximum_diameter(atom_ids)
+            for conformer in conformers
+        ],
+        atol=1e-12,
+    )
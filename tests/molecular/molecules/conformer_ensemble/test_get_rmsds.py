@@ -0,0 +1,42 @@
+import numpy as np
+
+
+def test_get_rmsds(ensemble):
+    """
+    Test :meth:`.ConformerEnsemble.get_rmsds`.
+
+    Parameters
+    ----------
+    ensemble : :class:`.ConformerEnsemble`
+        The ensemble to test.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    # The conformers only differ by rigid motions.
+    assert np.allclose(ensemble.get_rmsds(), 0, atol=1e-8)
+
+    generator = np.random.RandomState(2)
+    noise = generator.normal(
+        scale=0.1,
+        size=ensemble.get_position_matrices().shape,
+    )
+    noise[0] = 0
+    noisy = ensemble.with_displacement(noise)
+    rmsds = noisy.get_rmsds(reference_id=0)
+    # A superposition can never be worse than no superposition.
+    reference = noisy.get_position_matrices()[0]
+    aligned = noisy.with_aligned_conformers(reference_id=0)
+    assert np.allclose(
+        np.sqrt(np.square(
+            aligned.get_position_matrices() - reference
+        ).sum(axis=2).mean(axis=1)),
+        rmsds,
+    )
+    assert np.all(
+        rmsds <= np.sqrt(np.square(noise).sum(axis=2).mean(axis=1))
+        + 1e-12
+    )
@@ -0,0 +1,43 @@
+import os
+import numpy as np
+import stk
+
+
+def test_init_from_file(ensemble, tmpdir):
+    """
+    Test :meth:`.ConformerEnsemble.init_from_file`.
+
+    Parameters
+    ----------
+    ensemble : :class:`.ConformerEnsemble`
+        An ensemble, whose conformers are written to a file.
+
+    tmpdir : :class:`py.path.local`
+        A temporary directory into which test files are written.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    frames = []
+    for conformer_id, conformer in enumerate(ensemble.get_conformers()):
+        frame_path = os.path.join(tmpdir, f'frame_{conformer_id}.xyz')
+        conformer.write(frame_path)
+        with open(frame_path, 'r') as f:
+            frames.append(f.read())
+
+    path = os.path.join(tmpdir, 'trajectory.xyz')
+    with open(path, 'w') as f:
+        f.write(''.join(frames))
+
+    loaded = stk.ConformerEnsemble.init_from_file(
+        molecule=ensemble.get_conformer(0),
+        path=path,
+    )
+    assert np.allclose(
+        loaded.get_position_matrices(),
+        ensemble.get_position_matrices(),
+        atol=1e-5,
+    )
@@ -0,0 +1,29 @@
+import numpy as np
+
+
+def test_with_centroid(ensemble, atom_ids):
+    """
+    Test :meth:`.ConformerEnsemble.with_centroid`.
+
+    Parameters
+    ----------
+    ensemble : :class:`.ConformerEnsemble`
+        The ensemble to test.
+
+    atom_ids : :class:`tuple` of :class:`int`
+        The atom ids to use. Can be a single :class:`int` or
+        ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    position = np.array([1., 2., 3.])
+    clone = ensemble.with_centroid(position, atom_ids)
+    assert np.allclose(clone.get_centroids(atom_ids), position)
+    assert np.allclose(
+        clone.get_position_matrices() - ensemble.get_position_matrices(),
+        (position - ensemble.get_centroids(atom_ids))[:, np.newaxis],
+    )
@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def test_with_rotation_about_axis(ensemble):
+    """
+    Test :meth:`.ConformerEnsemble.with_rotation_about_axis`.
+
+    Parameters
+    ----------
+    ensemble : :class:`.ConformerEnsemble`
+        The ensemble to test.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    axis = np.array([1., 2., 3.])/np.sqrt(14)
+    origin = np.array([1., -1., 2.])
+    before = ensemble.get_position_matrices()
+    rotated = ensemble.with_rotation_about_axis(1.3, axis, origin)
+    assert np.array_equal(ensemble.get_position_matrices(), before)
+    for conformer_id, conformer in enumerate(ensemble.get_conformers()):
+        assert np.allclose(
+            rotated.get_conformer(conformer_id).get_position_matrix(),
+            conformer.with_rotation_about_axis(
+                angle=1.3,
+                axis=axis,
+                origin=origin,
+            ).get_position_matrix(),
+            atol=1e-12,
+        )
@@ -0,0 +1,32 @@
+import pytest
+import stk
+
+
+@pytest.fixture(
+    params=(
+        # The same SMILES is used for both building blocks.
+        ('NCCN', 'NCCN'),
+        ('Brc1ccc(Br)cc1', 'Brc1ccc(Br)cc1'),
+        # Equivalent SMILES are used, which have different atom
+        # orders.
+        ('BrCCN', 'NCCBr'),
+        ('Brc1ccc(N)cc1', 'Nc1ccc(Br)cc1'),
+    ),
+)
+def smiles_pair(request):
+    """
+    A pair of equivalent SMILES.
+
+    """
+
+    return request.param
+
+
+@pytest.fixture
+def embedding_cache(tmpdir):
+    """
+    An empty :class:`.EmbeddingCache` instance.
+
+    """
+
+    return stk.EmbeddingCache(str(tmpdir))
@@ -0,0 +1,73 @@
+import numpy as np
+import stk
+from scipy.spatial.distance import pdist
+
+from tests.utilities import is_equivalent_molecule
+
+
+def test_building_block_init(embedding_cache, smiles_pair):
+    """
+    Test :class:`.BuildingBlock` initialization with a cache.
+
+    Parameters
+    ----------
+    embedding_cache : :class:`.EmbeddingCache`
+        An empty cache.
+
+    smiles_pair : :class:`tuple` of :class:`str`
+        Two equivalent SMILES. The first is used to fill the cache
+        and the second to take the position matrix from it.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    smiles1, smiles2 = smiles_pair
+    building_block1 = stk.BuildingBlock(
+        smiles=smiles1,
+        embedding_cache=embedding_cache,
+    )
+    assert embedding_cache.get_num_entries() == 1
+    _test_position_matrix(building_block1, stk.BuildingBlock(smiles1))
+
+    building_block2 = stk.BuildingBlock(
+        smiles=smiles2,
+        embedding_cache=embedding_cache,
+    )
+    assert embedding_cache.get_num_entries() == 1
+    is_equivalent_molecule(building_block2, stk.BuildingBlock(smiles2))
+    # The atoms of the second building block hold the positions
+    # of their equivalents in the first building block.
+    assert np.allclose(
+        a=np.sort(pdist(building_block1.get_position_matrix())),
+        b=np.sort(pdist(building_block2.get_position_matrix())),
+    )
+    if smiles1 == smiles2:
+        _test_position_matrix(building_block2, building_block1)
+
+
+def _test_position_matrix(building_block1, building_block2):
+    """
+    Test that two building blocks are the same.
+
+    Parameters
+    ----------
+    building_block1 : :class:`.BuildingBlock`
+        The first building block.
+
+    building_block2 : :class:`.BuildingBlock`
+        The second building block.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    is_equivalent_molecule(building_block1, building_block2)
+    assert np.all(np.equal(
+        building_block1.get_position_matrix(),
+        building_block2.get_position_matrix(),
+    ))
@@ -0,0 +1,78 @@
+import os
+
+import stk
+
+
+def test_eviction(tmpdir):
+    """
+    Test that the least recently used entries are removed.
+
+    Parameters
+    ----------
+    tmpdir : :class:`py.path.local`
+        A temporary directory for the cache.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    directory = str(tmpdir)
+    # All molecules have the same number of atoms, so all entries
+    # have the same size.
+    embedding_cache = stk.EmbeddingCache(directory)
+    stk.BuildingBlock('CCCCO', embedding_cache=embedding_cache)
+    entry_size = embedding_cache.get_size()
+    embedding_cache = stk.EmbeddingCache(
+        directory=directory,
+        max_size=3*entry_size,
+    )
+
+    paths = {}
+    for time, smiles in enumerate(('CCCCO', 'CC(C)CO', 'CCC(C)O')):
+        stk.BuildingBlock(smiles, embedding_cache=embedding_cache)
+        paths[smiles] = _get_newest_path(directory)
+        # Set the modification times explicitly, so that the
+        # order of use does not depend on the file system clock.
+        os.utime(paths[smiles], (time, time))
+
+    # Use the oldest entry, which makes the second oldest entry
+    # the least recently used one.
+    stk.BuildingBlock('CCCCO', embedding_cache=embedding_cache)
+    assert embedding_cache.get_num_entries() == 3
+
+    # Going above 3 entries removes entries until at most 2 are
+    # left.
+    stk.BuildingBlock('CCOCC', embedding_cache=embedding_cache)
+    assert embedding_cache.get_num_entries() == 2
+    assert embedding_cache.get_size() == 2*entry_size
+    assert os.path.exists(paths['CCCCO'])
+    assert not os.path.exists(paths['CC(C)CO'])
+    assert not os.path.exists(paths['CCC(C)O'])
+
+
+def _get_newest_path(directory):
+    """
+    Get the path of the most recently modified entry.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory of the cache.
+
+    Returns
+    -------
+    :class:`str`
+        The path of the entry.
+
+    """
+
+    return max(
+        (
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith('.npy')
+        ),
+        key=os.path.getmtime,
+    )
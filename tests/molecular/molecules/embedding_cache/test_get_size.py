@@ -0,0 +1,36 @@
+import stk
+
+
+def test_get_size(tmpdir):
+    """
+    Test :meth:`.EmbeddingCache.get_size`.
+
+    Parameters
+    ----------
+    tmpdir : :class:`py.path.local`
+        A temporary directory for the cache.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    embedding_cache = stk.EmbeddingCache(str(tmpdir))
+    stk.BuildingBlock('NCCN', embedding_cache=embedding_cache)
+    entry_size = embedding_cache.get_size()
+
+    # Any entry added beyond the maximum size should cause old
+    # entries to be removed.
+    embedding_cache = stk.EmbeddingCache(
+        directory=str(tmpdir),
+        max_size=3*entry_size,
+    )
+    assert embedding_cache.get_size() == entry_size
+    for smiles in ('CCCN', 'NCCCN', 'NCCCCN', 'NCCCCCN'):
+        stk.BuildingBlock(smiles, embedding_cache=embedding_cache)
+        assert embedding_cache.get_size() <= 3*entry_size
+        assert embedding_cache.get_num_entries() <= 3
+
+    assert embedding_cache.clear().get_num_entries() == 0
+    assert embedding_cache.get_size() == 0
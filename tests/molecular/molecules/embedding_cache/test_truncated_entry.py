@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+import stk
+
+
+def test_truncated_entry(tmpdir):
+    """
+    Test that a truncated entry is treated as a missing one.
+
+    Parameters
+    ----------
+    tmpdir : :class:`py.path.local`
+        A temporary directory for the cache.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    directory = str(tmpdir)
+    embedding_cache = stk.EmbeddingCache(directory)
+    stk.BuildingBlock('NCCN', embedding_cache=embedding_cache)
+    path, = (
+        os.path.join(directory, name) for name in os.listdir(directory)
+    )
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) // 2)
+
+    building_block = stk.BuildingBlock(
+        smiles='NCCN',
+        embedding_cache=embedding_cache,
+    )
+    assert np.all(np.equal(
+        building_block.get_position_matrix(),
+        stk.BuildingBlock('NCCN').get_position_matrix(),
+    ))
+    # The truncated entry is replaced by a complete one.
+    assert embedding_cache.get_num_entries() == 1
+    assert np.load(path).shape == (building_block.get_num_atoms(), 3)
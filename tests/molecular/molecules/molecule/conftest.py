@@ -157,6 +157,25 @@ def get_origin(request):
     return request.param
 
 
+@pytest.fixture(
+    params=(
+        None,
+        (
+            np.array([12., 0., 0.]),
+            np.array([6., 10.392, 0.]),
+            np.array([0., 0., 9.]),
+        ),
+    ),
+)
+def cell(request):
+    """
+    The a, b and c vectors of a periodic cell, or ``None``.
+
+    """
+
+    return request.param
+
+
 @pytest.fixture(
     params=[
         lambda molecule: None,
@@ -0,0 +1,35 @@
+import numpy as np
+
+
+def test_get_adjacency_matrix(molecule):
+    """
+    Test :meth:`.Molecule.get_adjacency_matrix`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    num_atoms = molecule.get_num_atoms()
+    expected = np.zeros((num_atoms, num_atoms), dtype=bool)
+    for bond in molecule.get_bonds():
+        atom1_id = bond.get_atom1().get_id()
+        atom2_id = bond.get_atom2().get_id()
+        expected[atom1_id, atom2_id] = True
+        expected[atom2_id, atom1_id] = True
+
+    adjacency_matrix = molecule.get_adjacency_matrix()
+    assert np.array_equal(adjacency_matrix.toarray() != 0, expected)
+
+    # Modifying the returned matrix should not affect the molecule.
+    adjacency_matrix.data[:] = 0
+    assert np.array_equal(
+        molecule.get_adjacency_matrix().toarray() != 0,
+        expected,
+    )
@@ -0,0 +1,66 @@
+import numpy as np
+
+from .utilities import get_distances
+
+
+def test_get_atom_ids_within(molecule, cell):
+    """
+    Test :meth:`.Molecule.get_atom_ids_within`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The periodic cell to use, or ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    _test_get_atom_ids_within(molecule, cell)
+    # The spatial index of the molecule must not be reused by a
+    # clone with different positions.
+    _test_get_atom_ids_within(
+        molecule=molecule.with_displacement(np.array([1., 2., -1.])),
+        cell=cell,
+    )
+
+
+def _test_get_atom_ids_within(molecule, cell):
+    """
+    Test :meth:`.Molecule.get_atom_ids_within`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The periodic cell to use, or ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    position = np.array([0.5, 1., -0.5])
+    radius = 2.5
+    distances = get_distances(
+        position_matrix=molecule.get_position_matrix(),
+        position=position,
+        cell=cell,
+    )
+    expected = [
+        atom_id
+        for atom_id, distance in enumerate(distances)
+        if distance <= radius
+    ]
+    assert (
+        list(molecule.get_atom_ids_within(position, radius, cell))
+        == expected
+    )
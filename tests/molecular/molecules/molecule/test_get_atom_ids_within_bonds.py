@@ -0,0 +1,39 @@
+import pytest
+
+from .utilities import get_neighbor_ids
+
+
+@pytest.mark.parametrize('num_bonds', (0, 1, 3))
+def test_get_atom_ids_within_bonds(molecule, num_bonds):
+    """
+    Test :meth:`.Molecule.get_atom_ids_within_bonds`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    num_bonds : :class:`int`
+        The maximum number of bonds between atoms.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    neighbor_ids = get_neighbor_ids(molecule)
+    atom_ids = {0, molecule.get_num_atoms()-1}
+    expected = set(atom_ids)
+    for _ in range(num_bonds):
+        expected.update(
+            neighbor_id
+            for atom_id in tuple(expected)
+            for neighbor_id in neighbor_ids[atom_id]
+        )
+
+    result = list(molecule.get_atom_ids_within_bonds(
+        atom_ids=atom_ids,
+        num_bonds=num_bonds,
+    ))
+    assert result == sorted(expected)
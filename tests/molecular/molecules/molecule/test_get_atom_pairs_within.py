@@ -0,0 +1,40 @@
+import itertools as it
+
+from .utilities import get_distances
+
+
+def test_get_atom_pairs_within(molecule, cell):
+    """
+    Test :meth:`.Molecule.get_atom_pairs_within`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The periodic cell to use, or ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    distance = 1.5
+    position_matrix = molecule.get_position_matrix()
+    expected = [
+        (atom1_id, atom2_id)
+        for atom1_id, atom2_id in it.combinations(
+            range(molecule.get_num_atoms()),
+            2,
+        )
+        if get_distances(
+            position_matrix=position_matrix[[atom2_id]],
+            position=position_matrix[atom1_id],
+            cell=cell,
+        )[0] <= distance
+    ]
+    assert (
+        list(molecule.get_atom_pairs_within(distance, cell)) == expected
+    )
@@ -0,0 +1,35 @@
+from .utilities import get_neighbor_ids
+
+
+def test_get_connected_components(molecule):
+    """
+    Test :meth:`.Molecule.get_connected_components`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    neighbor_ids = get_neighbor_ids(molecule)
+    expected = []
+    visited = set()
+    for atom_id in range(molecule.get_num_atoms()):
+        if atom_id in visited:
+            continue
+        component = {atom_id}
+        stack = [atom_id]
+        while stack:
+            for neighbor_id in neighbor_ids[stack.pop()]:
+                if neighbor_id not in component:
+                    component.add(neighbor_id)
+                    stack.append(neighbor_id)
+        visited.update(component)
+        expected.append(tuple(sorted(component)))
+
+    assert list(molecule.get_connected_components()) == expected
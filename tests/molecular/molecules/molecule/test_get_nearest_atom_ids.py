@@ -0,0 +1,42 @@
+import numpy as np
+
+from .utilities import get_distances
+
+
+def test_get_nearest_atom_ids(molecule, cell):
+    """
+    Test :meth:`.Molecule.get_nearest_atom_ids`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The periodic cell to use, or ``None``.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    position = np.array([1., -2., 0.5])
+    num_atoms = 3
+    distances = get_distances(
+        position_matrix=molecule.get_position_matrix(),
+        position=position,
+        cell=cell,
+    )
+    atom_ids = list(molecule.get_nearest_atom_ids(
+        position=position,
+        num_atoms=num_atoms,
+        cell=cell,
+    ))
+    assert len(atom_ids) == min(num_atoms, molecule.get_num_atoms())
+    # Compare distances, because atoms may be equally distant.
+    assert np.allclose(
+        a=distances[atom_ids],
+        b=np.sort(distances)[:num_atoms],
+        atol=1e-12,
+    )
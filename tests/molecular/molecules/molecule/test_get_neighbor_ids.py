@@ -0,0 +1,22 @@
+from .utilities import get_neighbor_ids
+
+
+def test_get_neighbor_ids(molecule):
+    """
+    Test :meth:`.Molecule.get_neighbor_ids`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    for atom_id, expected in get_neighbor_ids(molecule).items():
+        assert list(molecule.get_neighbor_ids(atom_id)) == sorted(
+            expected
+        )
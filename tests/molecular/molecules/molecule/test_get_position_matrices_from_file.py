@@ -0,0 +1,66 @@
+import os
+import pytest
+import numpy as np
+
+
+def test_get_position_matrices_from_file(molecule, tmpdir):
+    """
+    Test :meth:`.Molecule.get_position_matrices_from_file`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    tmpdir : :class:`py.path.local`
+        A temporary directory into which test files are written.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    generator = np.random.RandomState(4)
+    position_matrices = generator.normal(
+        scale=10,
+        size=(3, molecule.get_num_atoms(), 3),
+    )
+    # Write a trajectory, with a different capitalization of the
+    # element symbols in the last frame.
+    frames = []
+    for frame_id, position_matrix in enumerate(position_matrices):
+        frame_path = os.path.join(tmpdir, f'frame_{frame_id}.xyz')
+        molecule.with_position_matrix(position_matrix).write(frame_path)
+        with open(frame_path, 'r') as f:
+            frames.append(f.read())
+    frames[-1] = frames[-1].upper()
+
+    path = os.path.join(tmpdir, 'trajectory.xyz')
+    with open(path, 'w') as f:
+        f.write(''.join(frames))
+
+    result = np.array(list(
+        molecule.get_position_matrices_from_file(path)
+    ))
+    assert np.allclose(result, position_matrices, atol=1e-5)
+
+    first_frame = molecule.with_structure_from_file(path)
+    assert np.allclose(
+        first_frame.get_position_matrix(),
+        position_matrices[0],
+        atol=1e-5,
+    )
+
+    # A frame where the first atom has the wrong element.
+    atom_lines = frames[0].split('\n')
+    element, *coordinates = atom_lines[2].split()
+    wrong_element = 'He' if element.title() != 'He' else 'Ne'
+    atom_lines[2] = ' '.join((wrong_element, *coordinates))
+    with open(path, 'w') as f:
+        f.write(frames[0] + '\n'.join(atom_lines))
+
+    position_matrices = molecule.get_position_matrices_from_file(path)
+    next(position_matrices)
+    with pytest.raises(RuntimeError, match='Atom 0'):
+        next(position_matrices)
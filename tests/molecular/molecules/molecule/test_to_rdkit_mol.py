@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def test_to_rdkit_mol(molecule):
     """
     Test :meth:`.Molecule.to_rdkit_mol`.
@@ -30,3 +33,14 @@ def test_to_rdkit_mol(molecule):
             bond.get_atom1().get_id() == rdkit_bond.GetBeginAtomIdx()
         )
         assert bond.get_atom2().get_id() == rdkit_bond.GetEndAtomIdx()
+
+    assert np.allclose(
+        a=molecule.get_position_matrix(),
+        b=rdkit_molecule.GetConformer().GetPositions(),
+        atol=1e-32,
+    )
+
+    # Modifying the returned molecule must not affect later calls.
+    rdkit_molecule.GetConformer().SetAtomPosition(0, (1e3, 1e3, 1e3))
+    rdkit_molecule.RemoveAllConformers()
+    assert molecule.to_rdkit_mol().GetNumConformers() == 1
@@ -0,0 +1,113 @@
+import os
+import sys
+import pytest
+import numpy as np
+
+from ..utilities import is_clone
+
+
+@pytest.fixture(
+    params=(
+        lambda molecule: molecule.with_displacement(
+            displacement=np.array([1., -2., 3.]),
+        ),
+        lambda molecule: molecule.with_rotation_about_axis(
+            angle=1.2,
+            axis=np.array([0., 0.6, 0.8]),
+            origin=np.array([1., 1., -1.]),
+        ),
+        lambda molecule: molecule.with_rotation_between_vectors(
+            start=np.array([1., 0., 0.]),
+            target=np.array([0., 1., 0.]),
+            origin=np.array([1., 2., 3.]),
+        ),
+        lambda molecule: molecule.with_centroid(
+            position=np.array([5., 5., 5.]),
+            atom_ids=0,
+        ),
+        lambda molecule: molecule.with_position_matrix(
+            position_matrix=np.arange(
+                molecule.get_num_atoms()*3,
+                dtype=np.float64,
+            ).reshape(-1, 3),
+        ),
+        lambda molecule: molecule.with_canonical_atom_ordering(),
+    ),
+)
+def apply_operation(request):
+    return request.param
+
+
+def test_with_memory_mapped_positions(
+    molecule,
+    apply_operation,
+    tmpdir,
+    monkeypatch,
+):
+    """
+    Test :meth:`.Molecule.with_memory_mapped_positions`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test.
+
+    apply_operation : :class:`callable`
+        Takes a single parameter, `molecule`, and returns a modified
+        clone of it.
+
+    tmpdir : :class:`py.path.local`
+        A temporary directory, which holds the memory-mapped files.
+
+    monkeypatch : :class:`_pytest.monkeypatch.MonkeyPatch`
+        Used to make the chunks small, so that molecules are split
+        into multiple chunks.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    monkeypatch.setattr(
+        sys.modules['stk.molecular.molecules.molecule.molecule'],
+        '_chunk_size',
+        3,
+    )
+    monkeypatch.setattr(
+        sys.modules[
+            'stk.molecular.molecules.molecule.utilities.writers.utilities'
+        ],
+        '_chunk_size',
+        2,
+    )
+
+    memory_mapped = molecule.with_memory_mapped_positions(str(tmpdir))
+    is_clone(memory_mapped, molecule)
+    assert np.array_equal(
+        memory_mapped.get_position_matrix(),
+        molecule.get_position_matrix(),
+    )
+
+    expected = apply_operation(molecule)
+    result = apply_operation(memory_mapped)
+    is_clone(result, expected)
+    assert np.allclose(
+        result.get_position_matrix(),
+        expected.get_position_matrix(),
+        atol=1e-12,
+    )
+    assert np.allclose(result.get_centroid(), expected.get_centroid())
+    assert np.isclose(
+        result.get_maximum_diameter(),
+        expected.get_maximum_diameter(),
+    )
+
+    for extension in ('.mol', '.xyz'):
+        expected_path = os.path.join(tmpdir, f'expected{extension}')
+        result_path = os.path.join(tmpdir, f'result{extension}')
+        expected.write(expected_path)
+        result.write(result_path)
+        with open(expected_path) as expected_file:
+            with open(result_path) as result_file:
+                assert expected_file.read() == result_file.read()
@@ -1,3 +1,4 @@
+import itertools as it
 import numpy as np
 
 
@@ -21,3 +22,58 @@ def get_direction(position_matrix, atom_ids):
     atom_positions = position_matrix[atom_ids, :]
     centered_positions = atom_positions - atom_positions.mean(axis=0)
     return np.linalg.svd(centered_positions)[-1][0]
+
+
+def get_distances(position_matrix, position, cell):
+    """
+    Get the distance of every position to `position`.
+
+    If `cell` is not ``None``, the distance to the nearest periodic
+    image is used.
+
+    """
+
+    displacements = position_matrix - position
+    if cell is None:
+        return np.linalg.norm(displacements, axis=1)
+
+    cell = np.array(cell)
+    # Move every displacement close to the origin, then check
+    # neighboring images for the shortest one.
+    fractional = displacements @ np.linalg.inv(cell)
+    displacements = (fractional - np.round(fractional)) @ cell
+    return np.min(
+        [
+            np.linalg.norm(displacements + np.array(image) @ cell, axis=1)
+            for image in it.product((-1, 0, 1), repeat=3)
+        ],
+        axis=0,
+    )
+
+
+def get_neighbor_ids(molecule):
+    """
+    Get the ids of the atoms bonded to each atom.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule whose bonds are used.
+
+    Returns
+    -------
+    :class:`dict`
+        Maps the id of every atom to a :class:`set` holding the ids
+        of the atoms bonded to it.
+
+    """
+
+    neighbor_ids = {
+        atom_id: set() for atom_id in range(molecule.get_num_atoms())
+    }
+    for bond in molecule.get_bonds():
+        atom1_id = bond.get_atom1().get_id()
+        atom2_id = bond.get_atom2().get_id()
+        neighbor_ids[atom1_id].add(atom2_id)
+        neighbor_ids[atom2_id].add(atom1_id)
+    return neighbor_ids
@@ -46,6 +46,8 @@ def _test_with_canonical_atom_ordering(molecule, result):
 
     ordered = molecule.with_canonical_atom_ordering()
     is_clone(ordered, result)
+    # Ordering an already ordered molecule should not change it.
+    is_clone(ordered.with_canonical_atom_ordering(), result)
     order = rdkit.CanonicalRankAtoms(molecule.to_rdkit_mol())
     old_position_matrix = molecule.get_position_matrix()
     new_position_matrix = ordered.get_position_matrix()
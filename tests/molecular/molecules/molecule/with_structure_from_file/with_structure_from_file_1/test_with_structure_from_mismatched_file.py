@@ -0,0 +1,37 @@
+import pytest
+import stk
+
+
+@pytest.mark.parametrize(
+    argnames=('molecule', 'match'),
+    argvalues=(
+        # Same number of atoms, but different elements.
+        (stk.BuildingBlock('CCCO'), 'Atom 0 element'),
+        (stk.BuildingBlock('NCCCN'), 'number of atoms'),
+    ),
+)
+def test_with_structure_from_mismatched_file(molecule, match, path):
+    """
+    Test :meth:`.Molecule.with_structure_from_file`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to test. It does not match the molecule written
+        into the structure file.
+
+    match : :class:`str`
+        A pattern matching the error message.
+
+    path : :class:`str`
+        A path into which the test structure is written.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    stk.BuildingBlock('NCCN').write(path)
+    with pytest.raises(RuntimeError, match=match):
+        molecule.with_structure_from_file(path)
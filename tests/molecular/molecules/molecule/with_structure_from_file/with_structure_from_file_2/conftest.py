@@ -6,9 +6,17 @@ from .case_data import CaseData
 
 @pytest.fixture(
     params=(
+        CaseData(
+            molecule=stk.BuildingBlock('NCCCN'),
+            path='NCCCN.mae',
+        ),
+        CaseData(
+            molecule=stk.BuildingBlock('NCCN'),
+            path='NCCN.mol',
+        ),
         CaseData(
             molecule=stk.BuildingBlock('NCCN'),
-            path='NCCN.mae',
+            path='NCCN.coord',
         ),
     ),
 )
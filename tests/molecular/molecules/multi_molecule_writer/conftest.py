@@ -0,0 +1,58 @@
+import pytest
+import stk
+
+
+@pytest.fixture(
+    scope='session',
+    params=(
+        lambda: (stk.BuildingBlock('NCCN'), ),
+        lambda: (
+            stk.BuildingBlock('NCCN'),
+            stk.BuildingBlock('[NH3+]CC(=O)[O-]'),
+            stk.ConstructedMolecule(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(
+                        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    ),
+                    repeating_unit='A',
+                    num_repeating_units=3,
+                ),
+            ),
+        ),
+    ),
+)
+def molecules(request):
+    return request.param()
+
+
+@pytest.fixture(
+    params=(
+        'molecules.sdf',
+        'molecules.xyz',
+        'molecules.sdf.gz',
+        'molecules.xyz.bz2',
+        'molecules.mol.xz',
+    ),
+)
+def filename(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=(
+        False,
+        True,
+    ),
+)
+def use_thread(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=(
+        1,
+        2**20,
+    ),
+)
+def buffer_size(request):
+    return request.param
@@ -0,0 +1,68 @@
+import os
+import gzip
+import bz2
+import lzma
+import stk
+
+
+def test_write_many(
+    tmpdir,
+    molecules,
+    filename,
+    use_thread,
+    buffer_size,
+):
+    """
+    Test :meth:`.MultiMoleculeWriter.write_many`.
+
+    Parameters
+    ----------
+    tmpdir : :class:`py.path.local`
+        A temporary directory into which test files are written.
+
+    molecules : :class:`tuple` of :class:`.Molecule`
+        The molecules to write.
+
+    filename : :class:`str`
+        The name of the file into which the molecules are written.
+
+    use_thread : :class:`bool`
+        Toggles the use of a worker thread by the writer.
+
+    buffer_size : :class:`int`
+        The buffer size of the writer.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    path = os.path.join(tmpdir, filename)
+    with stk.MultiMoleculeWriter(
+        path=path,
+        buffer_size=buffer_size,
+        use_thread=use_thread,
+    ) as writer:
+        writer.write_many(molecules)
+
+    root, compression = os.path.splitext(filename)
+    open_ = {
+        '.gz': gzip.open,
+        '.bz2': bz2.open,
+        '.xz': lzma.open,
+    }.get(compression)
+    if open_ is None:
+        root = filename
+        open_ = open
+    _, extension = os.path.splitext(root)
+
+    expected = []
+    for molecule_id, molecule in enumerate(molecules):
+        molecule_path = os.path.join(tmpdir, f'{molecule_id}{extension}')
+        molecule.write(molecule_path)
+        with open(molecule_path, 'r') as f:
+            expected.append(f.read())
+
+    with open_(path, 'rt') as f:
+        assert f.read() == ''.join(expected)
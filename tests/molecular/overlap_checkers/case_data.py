@@ -0,0 +1,44 @@
+class CaseData:
+    """
+    A test case.
+
+    Attributes
+    ----------
+    overlap_checker : :class:`.OverlapChecker`
+        The overlap checker to test.
+
+    molecule : :class:`.ConstructedMolecule`
+        The molecule to check.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The periodic cell of :attr:`.molecule`. Can be ``None``.
+
+    overlaps : :class:`tuple` of :class:`tuple` of :class:`int`
+        The correct overlapping atom pairs, in order.
+
+    """
+
+    def __init__(self, overlap_checker, molecule, cell, overlaps):
+        """
+        Initialize a :class:`.CaseData` instance.
+
+        Parameters
+        ----------
+        overlap_checker : :class:`.OverlapChecker`
+            The overlap checker to test.
+
+        molecule : :class:`.ConstructedMolecule`
+            The molecule to check.
+
+        cell : :class:`tuple` of :class:`numpy.ndarray`
+            The periodic cell of `molecule`. Can be ``None``.
+
+        overlaps : :class:`tuple` of :class:`tuple` of :class:`int`
+            The correct overlapping atom pairs, in order.
+
+        """
+
+        self.overlap_checker = overlap_checker
+        self.molecule = molecule
+        self.cell = cell
+        self.overlaps = overlaps
@@ -0,0 +1,160 @@
+import pytest
+import numpy as np
+import stk
+
+from .case_data import CaseData
+
+
+def _get_molecule(atoms, position_matrix, building_block_ids, bonds):
+    """
+    Get a :class:`.ConstructedMolecule` made of single atoms.
+
+    Parameters
+    ----------
+    atoms : :class:`tuple` of :class:`.Atom`
+        The atoms of the molecule.
+
+    position_matrix : :class:`list`
+        The position of every atom.
+
+    building_block_ids : :class:`tuple`
+        The building block id of every atom. Can hold ``None``.
+
+    bonds : :class:`tuple` of :class:`tuple` of :class:`int`
+        The ids of atoms which are bonded.
+
+    Returns
+    -------
+    :class:`.ConstructedMolecule`
+        The molecule.
+
+    """
+
+    bonds = tuple(
+        stk.Bond(atoms[atom1_id], atoms[atom2_id], 1)
+        for atom1_id, atom2_id in bonds
+    )
+    return stk.ConstructedMolecule.init(
+        atoms=atoms,
+        bonds=bonds,
+        position_matrix=np.array(position_matrix, dtype=np.float64),
+        atom_infos=tuple(
+            stk.AtomInfo(
+                atom=atom,
+                building_block=None,
+                building_block_id=building_block_id,
+            )
+            for atom, building_block_id in zip(atoms, building_block_ids)
+        ),
+        bond_infos=tuple(
+            stk.BondInfo(
+                bond=bond,
+                building_block=None,
+                building_block_id=None,
+            )
+            for bond in bonds
+        ),
+        num_building_blocks={},
+    )
+
+
+@pytest.fixture(
+    params=(
+        CaseData(
+            overlap_checker=stk.OverlapChecker(),
+            molecule=_get_molecule(
+                atoms=(stk.H(0), stk.H(1), stk.C(2), stk.C(3)),
+                position_matrix=[
+                    [0, 0, 0],
+                    [0.5, 0, 0],
+                    [10, 0, 0],
+                    [11, 0, 0],
+                ],
+                building_block_ids=(0, 1, 2, 3),
+                bonds=(),
+            ),
+            cell=None,
+            overlaps=((0, 1), (2, 3)),
+        ),
+        CaseData(
+            overlap_checker=stk.OverlapChecker(),
+            molecule=_get_molecule(
+                atoms=(stk.H(0), stk.H(1), stk.C(2), stk.C(3)),
+                position_matrix=[
+                    [0, 0, 0],
+                    [0.5, 0, 0],
+                    [10, 0, 0],
+                    [11, 0, 0],
+                ],
+                building_block_ids=(0, 0, None, 1),
+                bonds=(),
+            ),
+            cell=None,
+            overlaps=(),
+        ),
+        CaseData(
+            overlap_checker=stk.OverlapChecker(),
+            molecule=_get_molecule(
+                atoms=(stk.C(0), stk.C(1), stk.H(2)),
+                position_matrix=[
+                    [0, 0, 0],
+                    [1.4, 0, 0],
+                    [1.4, 0.6, 0],
+                ],
+                building_block_ids=(0, 1, 0),
+                bonds=((0, 1), ),
+            ),
+            cell=None,
+            overlaps=((1, 2), ),
+        ),
+        CaseData(
+            overlap_checker=stk.OverlapChecker(scale=0.5),
+            molecule=_get_molecule(
+                atoms=(stk.C(0), stk.C(1)),
+                position_matrix=[
+                    [0, 0, 0],
+                    [1, 0, 0],
+                ],
+                building_block_ids=(0, 1),
+                bonds=(),
+            ),
+            cell=None,
+            overlaps=(),
+        ),
+        CaseData(
+            overlap_checker=stk.OverlapChecker(radii={6: 0.6}),
+            molecule=_get_molecule(
+                atoms=(stk.C(0), stk.C(1)),
+                position_matrix=[
+                    [0, 0, 0],
+                    [1.3, 0, 0],
+                ],
+                building_block_ids=(0, 1),
+                bonds=(),
+            ),
+            cell=None,
+            overlaps=(),
+        ),
+        CaseData(
+            overlap_checker=stk.OverlapChecker(),
+            molecule=_get_molecule(
+                atoms=(stk.C(0), stk.C(1), stk.C(2)),
+                position_matrix=[
+                    [0.2, 5, 5],
+                    [9.6, 5, 5],
+                    [5, 5, 5],
+                ],
+                building_block_ids=(0, 1, 2),
+                bonds=(),
+            ),
+            cell=(
+                np.array([10, 0, 0]),
+                np.array([0, 10, 0]),
+                np.array([0, 0, 10]),
+            ),
+            overlaps=((0, 1), ),
+        ),
+    ),
+)
+def case_data(request):
+    return request.param
@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+import stk
+
+
+def test_get_overlaps(case_data):
+    """
+    Test :meth:`.OverlapChecker.get_overlaps`.
+
+    Parameters
+    ----------
+    case_data : :class:`.CaseData`
+        A test case. Holds the overlap checker to test and the
+        correct overlaps.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    _test_get_overlaps(
+        overlap_checker=case_data.overlap_checker,
+        molecule=case_data.molecule,
+        cell=case_data.cell,
+        overlaps=case_data.overlaps,
+    )
+
+
+def _test_get_overlaps(overlap_checker, molecule, cell, overlaps):
+    """
+    Test :meth:`.OverlapChecker.get_overlaps`.
+
+    Parameters
+    ----------
+    overlap_checker : :class:`.OverlapChecker`
+        The overlap checker to test.
+
+    molecule : :class:`.ConstructedMolecule`
+        The molecule to check.
+
+    cell : :class:`tuple` of :class:`numpy.ndarray`
+        The periodic cell of `molecule`. Can be ``None``.
+
+    overlaps : :class:`tuple` of :class:`tuple` of :class:`int`
+        The correct overlapping atom pairs, in order.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    result = tuple(overlap_checker.get_overlaps(molecule, cell))
+    assert result == overlaps
+    assert overlap_checker.has_overlaps(molecule, cell) == bool(overlaps)
+
+
+def test_get_overlaps_missing_radius():
+    """
+    Test that :meth:`.OverlapChecker.get_overlaps` reports elements
+    without a radius.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    atoms = (stk.C(0), )
+    molecule = stk.ConstructedMolecule.init(
+        atoms=atoms,
+        bonds=(),
+        position_matrix=np.zeros((1, 3)),
+        atom_infos=(stk.AtomInfo(atoms[0], None, 0), ),
+        bond_infos=(),
+        num_building_blocks={},
+    )
+    overlap_checker = stk.OverlapChecker(radii={1: 0.31})
+    with pytest.raises(ValueError):
+        tuple(overlap_checker.get_overlaps(molecule))
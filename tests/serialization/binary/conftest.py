@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+import stk
+
+
+@pytest.fixture(
+    params=(
+        lambda: stk.BuildingBlock('Br[C+2][C+2]Br'),
+        lambda: stk.BuildingBlock('[Na+]'),
+        lambda: stk.BuildingBlock('c1ccccc1').with_displacement(
+            displacement=np.array([1., 2., 3.]),
+        ),
+    ),
+)
+def molecule(request):
+    """
+    A :class:`.Molecule` instance.
+
+    """
+
+    return request.param()
+
+
+@pytest.fixture(
+    params=(
+        lambda: stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    stk.BuildingBlock('BrC=CBr', [stk.BromoFactory()]),
+                ),
+                repeating_unit='AB',
+                num_repeating_units=3,
+            ),
+        ),
+        lambda: stk.ConstructedMolecule(
+            topology_graph=stk.cof.Honeycomb(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    stk.BuildingBlock(
+                        smiles='Brc1cc(Br)cc(Br)c1',
+                        functional_groups=[stk.BromoFactory()],
+                    ),
+                ),
+                lattice_size=(2, 2, 1),
+                periodic=True,
+            ),
+        ),
+    ),
+)
+def constructed_molecule(request):
+    """
+    A :class:`.ConstructedMolecule` instance.
+
+    """
+
+    return request.param()
@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+import stk
+
+from tests.utilities import is_equivalent_constructed_molecule
+
+
+@pytest.mark.parametrize('lazy', (False, True))
+def test_constructed_molecule(constructed_molecule, lazy):
+    """
+    Test serialization of a :class:`.ConstructedMolecule`.
+
+    Parameters
+    ----------
+    constructed_molecule : :class:`.ConstructedMolecule`
+        The constructed molecule to serialize.
+
+    lazy : :class:`bool`
+        Whether the deserializer is lazy.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    serializer = stk.ConstructedMoleculeBinarySerializer()
+    deserializer = stk.ConstructedMoleculeBinaryDeserializer(lazy)
+    # Any object supporting the buffer protocol can be deserialized.
+    data = memoryview(serializer.to_bytes(constructed_molecule))
+    result = deserializer.from_bytes(data)
+    is_equivalent_constructed_molecule(constructed_molecule, result)
+    assert np.all(np.equal(
+        constructed_molecule.get_position_matrix(),
+        result.get_position_matrix(),
+    ))
+    for building_block1, building_block2 in zip(
+        constructed_molecule.get_building_blocks(),
+        result.get_building_blocks(),
+    ):
+        assert np.all(np.equal(
+            building_block1.get_position_matrix(),
+            building_block2.get_position_matrix(),
+        ))
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+import stk
+
+from tests.utilities import is_equivalent_molecule
+
+
+def test_molecule(molecule):
+    """
+    Test serialization of a :class:`.Molecule`.
+
+    Parameters
+    ----------
+    molecule : :class:`.Molecule`
+        The molecule to serialize.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    data = stk.MoleculeBinarySerializer().to_bytes(molecule)
+    result = stk.MoleculeBinaryDeserializer().from_bytes(data)
+    is_equivalent_molecule(molecule, result)
+    assert np.all(np.equal(
+        molecule.get_position_matrix(),
+        result.get_position_matrix(),
+    ))
+
+
+def test_molecule_from_constructed_molecule(constructed_molecule):
+    """
+    Test deserialization of the wrong type of molecule.
+
+    Parameters
+    ----------
+    constructed_molecule : :class:`.ConstructedMolecule`
+        The serialized molecule.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    serializer = stk.ConstructedMoleculeBinarySerializer()
+    data = serializer.to_bytes(constructed_molecule)
+    with pytest.raises(ValueError):
+        stk.MoleculeBinaryDeserializer().from_bytes(data)
@@ -0,0 +1,51 @@
+import numpy as np
+import stk
+
+from tests.utilities import is_equivalent_constructed_molecule
+
+
+def test_lazy_from_json():
+    """
+    Test :meth:`.ConstructedMoleculeDejsonizer.from_json` when lazy.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecule = stk.ConstructedMolecule(
+        topology_graph=stk.polymer.Linear(
+            building_blocks=(
+                stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                stk.BuildingBlock('BrCNCBr', [stk.BromoFactory()]),
+            ),
+            repeating_unit='AB',
+            num_repeating_units=2,
+        ),
+    )
+    json = stk.ConstructedMoleculeJsonizer().to_json(molecule)
+    dejsonizer = stk.ConstructedMoleculeDejsonizer(lazy=True)
+
+    lazy = dejsonizer.from_json(json)
+    assert np.allclose(
+        lazy.get_position_matrix(),
+        molecule.get_position_matrix(),
+    )
+    building_blocks = tuple(lazy.get_building_blocks())
+    assert len(building_blocks) == 2
+    # Only the building blocks were needed.
+    assert '_atoms' not in vars(lazy)
+    assert '_atom_infos' not in vars(lazy)
+    is_equivalent_constructed_molecule(molecule, lazy)
+    for building_block1, building_block2 in zip(
+        building_blocks,
+        lazy.get_building_blocks(),
+    ):
+        assert building_block1 is building_block2
+
+    # Clones hold all components.
+    is_equivalent_constructed_molecule(
+        molecule,
+        dejsonizer.from_json(json).with_displacement(np.ones(3)),
+    )
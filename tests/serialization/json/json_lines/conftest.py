@@ -0,0 +1,41 @@
+import pytest
+import stk
+
+
+@pytest.fixture(
+    params=(
+        'molecules.jsonl',
+        'molecules.jsonl.gz',
+    ),
+)
+def path(request, tmp_path):
+    """
+    A path into which molecules are written.
+
+    """
+
+    return str(tmp_path / request.param)
+
+
+@pytest.fixture
+def molecules():
+    """
+    Molecules written into a file.
+
+    """
+
+    building_block1 = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+    building_block2 = stk.BuildingBlock('BrCNCBr', [stk.BromoFactory()])
+    return (
+        *(
+            stk.ConstructedMolecule(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(building_block1, building_block2),
+                    repeating_unit='AB',
+                    num_repeating_units=num_repeating_units,
+                ),
+            )
+            for num_repeating_units in (1, 2, 3)
+        ),
+        building_block2,
+    )
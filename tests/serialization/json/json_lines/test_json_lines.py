@@ -0,0 +1,115 @@
+import itertools as it
+import json
+
+import numpy as np
+import stk
+
+from tests.utilities import is_equivalent
+from stk.serialization.json.json_lines.utilities import open_file
+
+
+def test_json_lines(path, molecules):
+    """
+    Test :class:`.JsonLinesWriter` and :class:`.JsonLinesReader`.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path into which molecules are written.
+
+    molecules : :class:`tuple` of :class:`.Molecule`
+        The molecules to write.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    with stk.JsonLinesWriter(path) as writer:
+        writer.write_many(molecules)
+
+    with open_file(path, 'r') as f:
+        records = tuple(map(json.loads, f))
+    # Each building block is written only once.
+    num_building_blocks = sum(
+        'buildingBlock' in record for record in records
+    )
+    assert num_building_blocks == 2
+    assert len(records) == len(molecules) + num_building_blocks
+
+    for molecule1, molecule2 in it.zip_longest(
+        molecules,
+        stk.JsonLinesReader(path).get_molecules(),
+    ):
+        is_equivalent(molecule1, molecule2)
+        assert np.allclose(
+            molecule1.get_position_matrix(),
+            molecule2.get_position_matrix(),
+        )
+
+
+def test_close(path, molecules):
+    """
+    Test :meth:`.JsonLinesWriter.close`.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path into which molecules are written.
+
+    molecules : :class:`tuple` of :class:`.Molecule`
+        The molecules to write.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    writer = stk.JsonLinesWriter(path)
+    writer.write_many(molecules)
+    writer.close()
+    # Closing again does nothing.
+    writer.close()
+
+    num_read = sum(1 for _ in stk.JsonLinesReader(path).get_molecules())
+    assert num_read == len(molecules)
+
+
+def test_equal_building_blocks(path):
+    """
+    Test that building blocks with the same JSON are written once.
+
+    The building blocks of the written molecules are different
+    objects, which hold the same molecule.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path into which molecules are written.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecules = tuple(
+        stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                ),
+                repeating_unit='A',
+                num_repeating_units=num_repeating_units,
+            ),
+        )
+        for num_repeating_units in (2, 3)
+    )
+    with stk.JsonLinesWriter(path) as writer:
+        writer.write_many(molecules)
+
+    with open_file(path, 'r') as f:
+        records = tuple(map(json.loads, f))
+    assert sum('buildingBlock' in record for record in records) == 1
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+import stk
+
+from tests.utilities import (
+    is_equivalent_molecule,
+    is_equivalent_constructed_molecule,
+)
+
+
+def test_molecule_version_2():
+    """
+    Test a round trip through the version 2 schema of a molecule.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecule = stk.BuildingBlock('NC[N+](C)(C)CC(=O)[O-]')
+    json = stk.MoleculeJsonizer(version=2).to_json(molecule)
+    assert json['molecule']['v'] == 2
+    # Only the charged atoms are stored.
+    assert len(json['molecule']['c'][0]) == 2
+
+    dejsonized = stk.MoleculeDejsonizer().from_json(json)
+    is_equivalent_molecule(molecule, dejsonized)
+    assert np.all(np.equal(
+        molecule.get_position_matrix(),
+        dejsonized.get_position_matrix(),
+    ))
+
+
+def test_constructed_molecule_version_2():
+    """
+    Test a round trip through the version 2 schema of a periodic
+    constructed molecule.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecule = stk.ConstructedMolecule(
+        topology_graph=stk.cof.Honeycomb(
+            building_blocks=(
+                stk.BuildingBlock(
+                    smiles='BrC1=CC(Br)=CC(Br)=C1',
+                    functional_groups=[stk.BromoFactory()],
+                ),
+                stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+            ),
+            lattice_size=(2, 2, 1),
+            periodic=True,
+        ),
+    )
+    json = stk.ConstructedMoleculeJsonizer(version=2).to_json(molecule)
+    assert json['constructedMolecule']['v'] == 2
+    # Atoms of the same building block are stored as a single run.
+    assert (
+        len(json['constructedMolecule']['aI'][2])
+        < molecule.get_num_atoms()
+    )
+
+    for lazy in (False, True):
+        dejsonized = stk.ConstructedMoleculeDejsonizer(
+            lazy=lazy,
+        ).from_json(json)
+        is_equivalent_constructed_molecule(molecule, dejsonized)
+        assert np.all(np.equal(
+            molecule.get_position_matrix(),
+            dejsonized.get_position_matrix(),
+        ))
+        assert any(
+            bond.get_periodicity() != (0, 0, 0)
+            for bond in dejsonized.get_bonds()
+        )
+
+
+def test_invalid_version():
+    """
+    Test that an unknown schema version is rejected.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    with pytest.raises(ValueError):
+        stk.MoleculeJsonizer(version=3)
+
+    with pytest.raises(ValueError):
+        stk.ConstructedMoleculeJsonizer(version=3)
@@ -0,0 +1,41 @@
+import numpy as np
+import stk
+
+
+def test_building_block_json():
+    """
+    Test that cached building block JSONs follow the building block.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    building_block1 = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+    building_block2 = building_block1.with_displacement(
+        displacement=np.array([1., 2., 3.]),
+    )
+    jsonizer = stk.ConstructedMoleculeJsonizer()
+    building_block_jsons = tuple(
+        jsonizer.to_json(
+            stk.ConstructedMolecule(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(building_block, ),
+                    repeating_unit='A',
+                    num_repeating_units=2,
+                ),
+            ),
+        )['buildingBlocks'][0]
+        for building_block in (
+            building_block1,
+            building_block1.clone(),
+            building_block2,
+        )
+    )
+    assert building_block_jsons[0] == building_block_jsons[1]
+    for building_block, json in zip(
+        (building_block1, building_block1, building_block2),
+        building_block_jsons,
+    ):
+        assert json == stk.MoleculeJsonizer().to_json(building_block)